@@ -1,17 +1,13 @@
 import argparse
 import sys
 
-import zipfile2
-
 from okonomiyaki.file_formats import EggMetadata
+from okonomiyaki.utils import ArchiveView
 from okonomiyaki.versions import MetadataVersion
 
 
 def _metadata_from_path(path, sha256):
-    if sha256 is None:
-        return EggMetadata.from_egg(path)
-    else:
-        return EggMetadata._from_egg(path, sha256)
+    return EggMetadata.from_egg(path, sha256=sha256)
 
 
 def pkg_info(ns):
@@ -35,8 +31,8 @@ def spec_depend(ns):
 
 
 def show_index(ns):
-    with zipfile2.ZipFile(ns.path) as zp:
-        entries = sorted(zp.namelist())
+    with ArchiveView(ns.path) as view:
+        entries = sorted(view.namelist())
 
     for entry in entries:
         print(entry)
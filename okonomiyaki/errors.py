@@ -11,6 +11,9 @@ class UnsupportedMetadata(InvalidPackageFormat):
         self.metadata_version = metadata_version
         super(UnsupportedMetadata, self).__init__(*a, **kw)
 
+    def __reduce__(self):
+        return (self.__class__, (self.metadata_version,) + self.args)
+
     def __str__(self):
         if len(self.args) >= 1:
             return self.args[0]
@@ -25,6 +28,9 @@ class InvalidEggName(InvalidPackageFormat):
         msg = "Invalid egg name '{0}'".format(egg_name)
         super(InvalidEggName, self).__init__(msg)
 
+    def __reduce__(self):
+        return (self.__class__, (self.egg_name,))
+
 
 class InvalidMetadata(InvalidPackageFormat):
     def __init__(self, message, *a, **kw):
@@ -39,10 +45,18 @@ class _undefined(object):
     def __repr__(self):
         return '<undefined>'
 
+    def __reduce__(self):
+        # Unpickle as the module-level singleton, so that identity checks
+        # against InvalidMetadataField.undefined keep working
+        return "_UNDEFINED"
+
+
+_UNDEFINED = _undefined()
+
 
 class InvalidMetadataField(InvalidMetadata):
 
-    undefined = _undefined()
+    undefined = _UNDEFINED
 
     def __init__(self, name, value, *a, **kw):
         self.name = name
@@ -54,6 +68,9 @@ class InvalidMetadataField(InvalidMetadata):
                 name, value)
         super(InvalidMetadataField, self).__init__(message, *a, **kw)
 
+    def __reduce__(self):
+        return (self.__class__, (self.name, self.value))
+
 
 class MissingMetadata(InvalidMetadata):
     pass
@@ -62,23 +79,33 @@ class MissingMetadata(InvalidMetadata):
 class InvalidRequirementString(InvalidPackageFormat):
     def __init__(self, requirement_string, add_msg=None):
         self.requirement_string = requirement_string
+        self.add_msg = add_msg
         msg = "Invalid requirement string {0!r}".format(requirement_string)
         if add_msg is not None:
             msg += ": {}".format(add_msg)
         super(InvalidRequirementString, self).__init__(msg)
 
+    def __reduce__(self):
+        return (self.__class__, (self.requirement_string, self.add_msg))
+
 
 class InvalidRequirementStringHyphen(InvalidRequirementString):
     def __init__(self, requirement_string):
         msg = "Package versions should be separated by whitespace instead of a hyphen."
         super(InvalidRequirementStringHyphen, self).__init__(requirement_string, add_msg=msg)
 
+    def __reduce__(self):
+        return (self.__class__, (self.requirement_string,))
+
 
 class InvalidVersion(OkonomiyakiError):
     def __init__(self, version_string, *a, **kw):
         self.version_string = version_string
         super(InvalidVersion, self).__init__(*a, **kw)
 
+    def __reduce__(self):
+        return (self.__class__, (self.version_string,) + self.args)
+
     def __str__(self):
         if len(self.args) >= 1:
             return self.args[0]
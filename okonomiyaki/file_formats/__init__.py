@@ -4,10 +4,25 @@ formats we support at Enthought
 
 At the moment, we only support the Enthought's egg format.
 """
-# flake8: noqa
-from ._egg_info import (
-    Dependencies, EggMetadata, Requirement, egg_name, is_egg_name_valid,
-    split_egg_name
-)
-from ._package_info import PackageInfo
-from .egg import EggBuilder, EggRewriter
+from okonomiyaki.utils._lazy import lazy_exports
+
+# Public names are imported on first access, see okonomiyaki.utils._lazy
+_EXPORTS = {
+    "EggIndex": "._egg_index",
+    "Dependencies": "._egg_info",
+    "EggMetadata": "._egg_info",
+    "Requirement": "._egg_info",
+    "egg_name": "._egg_info",
+    "is_egg_name_valid": "._egg_info",
+    "split_egg_name": "._egg_info",
+    "EggMetadataCache": "._metadata_cache",
+    "PackageInfo": "._package_info",
+    "SCAN_ERRORS": "._scan",
+    "scan_eggs": "._scan",
+    "EggBuilder": ".egg",
+    "EggRewriter": ".egg",
+}
+
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
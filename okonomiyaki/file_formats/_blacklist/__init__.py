@@ -1,3 +1,4 @@
+from .checksum import compute_sha256_if_needed
 from .pkg_info_data import (
     EGG_PKG_INFO_BLACK_LIST, may_be_in_pkg_info_blacklist
 )
@@ -13,4 +14,5 @@ __all__ = [
     "EGG_PLATFORM_BLACK_LIST", "EGG_PKG_INFO_BLACK_LIST",
     "EGG_PYTHON_TAG_BLACK_LIST", "may_be_in_pkg_info_blacklist",
     "may_be_in_python_tag_blacklist", "may_be_in_platform_blacklist",
+    "compute_sha256_if_needed",
 ]
@@ -0,0 +1,95 @@
+""" Loading of the blacklist payloads.
+
+The payloads (the correct platform string, python tag or PKG-INFO content of
+each blacklisted egg) live in a compressed data file, which is only loaded
+the first time an egg name is found in one of the blacklists. The names
+themselves are kept in the small names module, as they are needed for every
+lookup.
+"""
+import os.path
+import threading
+
+from collections.abc import Mapping
+
+
+BLACKLIST_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "blacklist_data.json.gz"
+)
+
+PKG_INFO = "pkg_info"
+PLATFORM = "platform"
+PYTHON_TAG = "python_tag"
+
+# Shared PKG-INFO contents, referenced by name from the PKG_INFO blacklist
+PKG_INFO_CONTENTS = "pkg_info_contents"
+
+_DATA = None
+_DATA_LOCK = threading.Lock()
+
+
+def _load_data():
+    global _DATA
+    if _DATA is None:
+        with _DATA_LOCK:
+            if _DATA is None:
+                # Deferred, as most processes never need the data
+                import gzip
+                import json
+
+                with gzip.open(BLACKLIST_DATA, "rt", encoding="utf8") as fp:
+                    data = json.load(fp)
+                contents = data.pop(PKG_INFO_CONTENTS)
+                data[PKG_INFO] = dict(
+                    (name, dict(
+                        (checksum, contents[key])
+                        for checksum, key in egg.items()
+                    ))
+                    for name, egg in data[PKG_INFO].items()
+                )
+                data[PKG_INFO_CONTENTS] = contents
+                _DATA = data
+    return _DATA
+
+
+def egg_black_list(kind):
+    """ Returns the (egg basename) -> (egg sha256) -> (value) mapping of the
+    given blacklist, loading the data file if needed.
+    """
+    return _load_data()[kind]
+
+
+def pkg_info_content(key):
+    """ Returns the shared PKG-INFO content with the given name, e.g.
+    PYSIDE_1_1_0_PKG_INFO.
+    """
+    return _load_data()[PKG_INFO_CONTENTS][key]
+
+
+class LazyBlackList(Mapping):
+    """ Read-only (egg sha256) -> (value) mapping for the given blacklist,
+    whose data is loaded on first access.
+    """
+    def __init__(self, kind):
+        self._kind = kind
+        self._checksums = None
+
+    def _get_checksums(self):
+        if self._checksums is None:
+            self._checksums = dict(
+                (checksum, value)
+                for egg in egg_black_list(self._kind).values()
+                for checksum, value in egg.items()
+            )
+        return self._checksums
+
+    def __getitem__(self, checksum):
+        return self._get_checksums()[checksum]
+
+    def __iter__(self):
+        return iter(self._get_checksums())
+
+    def __len__(self):
+        return len(self._get_checksums())
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self._kind)
@@ -0,0 +1,36 @@
+from okonomiyaki.utils import compute_sha256
+
+
+def compute_sha256_if_needed(path_or_file, may_be_in_blacklist):
+    """ Compute the sha256 of the given egg only if its name may be in a
+    blacklist, and return None otherwise.
+
+    For zipfile-like objects, the name is taken from their filename
+    attribute. Archives without a filename are always checksummed.
+
+    Parameters
+    ----------
+    path_or_file: str or file-like object.
+        If a string, understood as the path to the egg. Otherwise,
+        understood as a zipfile-like object.
+    may_be_in_blacklist: callable
+        Returns True if the given egg path may be in the blacklist, e.g.
+        may_be_in_platform_blacklist.
+    """
+    if isinstance(path_or_file, str):
+        filename = path_or_file
+    else:
+        filename = getattr(path_or_file, "filename", None)
+
+    if filename is not None and not may_be_in_blacklist(filename):
+        return None
+    elif isinstance(path_or_file, str):
+        return compute_sha256(path_or_file)
+    else:
+        fp = path_or_file.fp
+        position = fp.tell()
+        try:
+            fp.seek(0)
+            return compute_sha256(fp)
+        finally:
+            fp.seek(position)
@@ -0,0 +1,231 @@
+""" Names of the blacklisted eggs.
+
+Generated by scripts/update_blacklist_data.py, do not edit.
+"""
+
+EGG_PKG_INFO_NAMES = frozenset([
+    'PySide-1.0.7-1.egg',
+    'PySide-1.0.8-1.egg',
+    'PySide-1.0.8-2.egg',
+    'PySide-1.0.9-1.egg',
+    'PySide-1.1.0-2.egg',
+    'PySide-1.1.0-3.egg',
+    'b3-1.4.1-1.egg',
+    'dblatex-0.3.1.1-1.egg',
+    'fullstate-0.1-1.egg',
+    'lastSoul-1.0.1-1.egg',
+    'medialog.boardfile-1.3.2-1.egg',
+    'medialog.boardfile-1.6.1-1.egg',
+    'medialog.popupworkflow-0.6-1.egg',
+    'medialog.subskins-4.1b1-1.egg',
+    'pymultinest-0.1-1.egg',
+    'shrink-1.1.1-1.egg',
+])
+EGG_PLATFORM_NAMES = frozenset([
+    '7z-9.20-1.egg',
+    'Bottleneck-0.6.0-2.egg',
+    'GDAL-1.9.0-3.egg',
+    'Pycluster-1.50-5.egg',
+    'ScientificPython-2.9.0-6.egg',
+    'Shapely-1.2.17-1.egg',
+    'Twisted-14.0.2-1.egg',
+    '_registry_path-1.0-2.egg',
+    'basemap-1.0.6-1.egg',
+    'basemap-1.0.6-2.egg',
+    'basemap-1.0.6-3.egg',
+    'biopython-1.59-2.egg',
+    'blockcanvas-4.0.3-1.egg',
+    'cartopy-0.11.0-1.egg',
+    'casuarius-1.1-1.egg',
+    'chaco-4.3.0-1.egg',
+    'chaco-4.3.0-2.egg',
+    'cmake-3.0.2-1.egg',
+    'cmake-3.0.2-2.egg',
+    'cmake-3.1.1-1.egg',
+    'enable-4.3.0-1.egg',
+    'enable-4.3.0-4.egg',
+    'enaml-0.6.8-2.egg',
+    'fastnumpy-1.0-5.egg',
+    'faulthandler-2.3-1.egg',
+    'fiona-1.2.0-7.egg',
+    'gevent-1.0.1-2.egg',
+    'greenlet-0.4.4-1.egg',
+    'h5py-2.1.3-2.egg',
+    'larry-0.6.0-3.egg',
+    'libxml2-2.7.8-3.egg',
+    'libxslt-1.1.26-3.egg',
+    'lxml-2.3.4-4.egg',
+    'matplotlib-1.2.0-3.egg',
+    'matplotlib-1.2.0-4.egg',
+    'matplotlib-1.2.0-7.egg',
+    'matplotlib-1.4.0-3.egg',
+    'mayavi-4.3.0-1.egg',
+    'mayavi-4.3.0-3.egg',
+    'netCDF4-1.0-4.egg',
+    'numexpr-2.0.1-3.egg',
+    'numpy-1.6.1-5.egg',
+    'numpy-1.7.1-1.egg',
+    'pandas-0.10.0-1.egg',
+    'pandas-0.10.1-1.egg',
+    'pandas-0.11.0-1.egg',
+    'pandas-0.11.0-2.egg',
+    'pandas-0.14.1-3.egg',
+    'psutil-0.7.1-1.egg',
+    'pyaudio-0.2.4-1.egg',
+    'pyaudio-0.2.4-3.egg',
+    'pyfits-3.0.6-2.egg',
+    'pyhdf-0.8.3-8.egg',
+    'pymc-2.2.0-2.egg',
+    'pysparse-1.2.dev213-5.egg',
+    'pytables-2.3.1-6.egg',
+    'pyzmq-2.2.0-2.egg',
+    'scikit_learn-0.13.1-1.egg',
+    'scikit_learn-0.13.1-4.egg',
+    'scikits.image-0.8.2-1.egg',
+    'scikits.image-0.8.2-2.egg',
+    'scikits.timeseries-0.91.3-5.egg',
+    'scimath-4.1.2-1.egg',
+    'scimath-4.1.2-2.egg',
+    'scipy-0.10.1-2.egg',
+    'scipy-0.10.1-3.egg',
+    'scipy-0.11.0-1.egg',
+    'scipy-0.12.0-1.egg',
+    'scipy-0.12.0-2.egg',
+    'statsmodels-0.4.3-1.egg',
+    'swig-2.0.12-1.egg',
+    'swig-3.0.2-1.egg',
+    'tar-1.13-1.egg',
+    'tornado-4.0.2-1.egg',
+    'traits-4.3.0-1.egg',
+    'traits-4.3.0-2.egg',
+    'wxPython-2.8.10.1-5.egg',
+    'xz-5.2.0-1.egg',
+])
+EGG_PYTHON_TAG_NAMES = frozenset([
+    'EPDDocs-1.0-1.egg',
+    'EPDIndex-1.0-1.egg',
+    'EPDIndex-1.1-1.egg',
+    'EPDIndex-1.2-1.egg',
+    'Examples-7.1-1.egg',
+    'Examples-7.1-2.egg',
+    'Examples-7.2-1.egg',
+    'Examples-7.3-1.egg',
+    'MKL-10.2-1.egg',
+    'MKL-10.2-2.egg',
+    'MKL-10.3-1.egg',
+    'PyQt-4.10.3-1.egg',
+    'PyQt-4.11.0-1.egg',
+    'PyQt-4.11.3-1.egg',
+    'PyQt-4.11.4-1.egg',
+    'PyQt-4.11.4-2.egg',
+    'PyQt-4.11.4-3.egg',
+    'PySide-1.0.3-1.egg',
+    'PySide-1.0.3-2.egg',
+    'PySide-1.0.5-1.egg',
+    'PySide-1.0.7-1.egg',
+    'PySide-1.0.8-1.egg',
+    'PySide-1.0.8-2.egg',
+    'PySide-1.0.9-1.egg',
+    'PySide-1.1.0-1.egg',
+    'PySide-1.1.0-2.egg',
+    'PySide-1.1.0-3.egg',
+    'PySide-1.2.1-1.egg',
+    'PySide-1.2.1-2.egg',
+    'PySide-1.2.2-1.egg',
+    'PySide-1.2.2-2.egg',
+    'PythonDoc-2.7.3-1.egg',
+    'agw-0.9.1-1.egg',
+    'basemap_ld-1.0.1-1.egg',
+    'basemap_ld-1.0.2-1.egg',
+    'basemap_ld-1.0.6-1.egg',
+    'basemap_ld-1.0.7-1.egg',
+    'bvls-0.1-2.egg',
+    'casuarius-1.0-1.egg',
+    'casuarius-1.0b1-1.egg',
+    'casuarius-1.1-1.egg',
+    'casuarius-1.1-2.egg',
+    'casuarius-1.1-3.egg',
+    'cdecimal-2.3-1.egg',
+    'doclinks-7.1-1.egg',
+    'doclinks-7.1-2.egg',
+    'doclinks-7.2-1.egg',
+    'doclinks-7.2-2.egg',
+    'doclinks-7.3-1.egg',
+    'dynd_python-0.6.6-1.egg',
+    'dynd_python-0.6.6-2.egg',
+    'dynd_python-0.6.6-3.egg',
+    'enstaller-4.5.0-1.egg',
+    'enstaller-4.5.1-1.egg',
+    'enstaller-4.5.2-1.egg',
+    'enstaller-4.5.3-1.egg',
+    'faulthandler-2.3-1.egg',
+    'faulthandler-2.3-2.egg',
+    'faulthandler-2.4-1.egg',
+    'gmpy-1.11-1.egg',
+    'gmpy-1.11-2.egg',
+    'gmpy-1.11-3.egg',
+    'iris-1.7.3-1.egg',
+    'iris-1.7.3-10.egg',
+    'iris-1.7.3-2.egg',
+    'iris-1.7.3-3.egg',
+    'iris-1.7.3-4.egg',
+    'iris-1.7.3-5.egg',
+    'iris-1.7.3-6.egg',
+    'iris-1.7.3-7.egg',
+    'iris-1.7.3-8.egg',
+    'iris-1.7.3-9.egg',
+    'kiwisolver-0.1.2-1.egg',
+    'kiwisolver-0.1.3-1.egg',
+    'mistune-0.6-1.egg',
+    'mistune-0.6-2.egg',
+    'opencv-2.4.5-2.egg',
+    'opencv-2.4.5-3.egg',
+    'opencv-2.4.5-4.egg',
+    'opencv-2.4.5-5.egg',
+    'opencv-2.4.9-1.egg',
+    'opencv-2.4.9-2.egg',
+    'pyaudio-0.2.4-1.egg',
+    'pymc-2.1b0-1.egg',
+    'pyodbc-2.1.8-1.egg',
+    'pyodbc-3.0.10-1.egg',
+    'pyodbc-3.0.6-1.egg',
+    'pyodbc-3.0.7-1.egg',
+    'pyodbc-3.0.7-2.egg',
+    'pyside-1.0.0b3-1.egg',
+    'pyside-1.0.0b5-1.egg',
+    'pyside-1.0.0rc1-1.egg',
+    'pyside-1.0.2-1.egg',
+    'scite-1.74-3.egg',
+    'scite-1.74-4.egg',
+    'scite-1.74-6.egg',
+    'shiboken-1.2.1-1.egg',
+    'shiboken-1.2.1-2.egg',
+    'shiboken-1.2.1-3.egg',
+    'shiboken-1.2.2-1.egg',
+    'shiboken-1.2.2-2.egg',
+    'shiboken-1.2.2-3.egg',
+    'sip-4.15.3-1.egg',
+    'sip-4.16.1-1.egg',
+    'sip-4.16.7-1.egg',
+    'sip-4.17-1.egg',
+    'ujson-1.33.0-1.egg',
+    'ujson-1.33.0-2.egg',
+    'ujson-1.35-1.egg',
+])
+# Names of the shared PKG-INFO contents
+PKG_INFO_CONTENT_NAMES = frozenset([
+    'B3_1_4_1',
+    'DBLATEX_0_3_1_1',
+    'FULLSTATE_0_1',
+    'LASTSOUL_1_0_1',
+    'MEDIALOG_BOARDFILE_1_3_2',
+    'MEDIALOG_BOARDFILE_1_6_1',
+    'MEDIALOG_POPUPWORKFLOW_0_6',
+    'MEDIALOG_SUBSKINS_4_1B1',
+    'PYMULTINEST_0_1',
+    'PYSIDE_1_0_7_PKG_INFO',
+    'PYSIDE_1_0_8_PKG_INFO',
+    'PYSIDE_1_0_9_PKG_INFO',
+    'PYSIDE_1_1_0_PKG_INFO',
+    'SHRINK_1_1_1',
+])
@@ -0,0 +1,345 @@
+""" An in-memory index of egg metadata, for name, version and tags lookups.
+"""
+import bisect
+
+from okonomiyaki.versions import EnpkgVersion, VersionInterner
+
+from ._egg_info import (
+    EggMetadata, _JSON__RAW_NAME, _JSON_ABI_TAG, _JSON_PLATFORM_TAG,
+    _JSON_PYTHON_TAG, _JSON_VERSION)
+
+
+# Same conventions as the *_tag_string properties of EggMetadata
+_ANY_PLATFORM = u"any"
+_NO_ABI = u"none"
+_NO_PYTHON = u"none"
+
+
+def _normalize_name(raw_name):
+    """ Same normalization as EggMetadata.name."""
+    return raw_name.lower().replace("-", "_")
+
+
+class _SortedEntries(object):
+    """ Entries sorted by version, with their (python_tag, abi_tag,
+    platform_tag) tuples. Entries of equal versions are kept in insertion
+    order.
+    """
+    __slots__ = ("_keys", "_records")
+
+    def __init__(self):
+        # Version sort keys, and the matching (entry, tag) records
+        self._keys = []
+        self._records = []
+
+    def insert(self, key, record):
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._records.insert(i, record)
+
+    def find(self, key, tag):
+        """ Returns the index of the entry of the given version and tag, or
+        -1.
+        """
+        lo = bisect.bisect_left(self._keys, key)
+        hi = bisect.bisect_right(self._keys, key, lo)
+        for i in range(lo, hi):
+            if self._records[i][1] == tag:
+                return i
+        return -1
+
+    def pop(self, i):
+        del self._keys[i]
+        return self._records.pop(i)
+
+    def end(self, max_key=None):
+        """ Returns the index following the newest entry whose version is
+        lower than or equal to max_key.
+        """
+        if max_key is None:
+            return len(self._keys)
+        return bisect.bisect_right(self._keys, max_key)
+
+    def key(self, i):
+        return self._keys[i]
+
+    def record(self, i):
+        return self._records[i]
+
+    def iter_newest_first(self, max_key=None):
+        records = self._records
+        for i in range(self.end(max_key) - 1, -1, -1):
+            yield records[i]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class EggIndex(object):
+    """ An in-memory index of eggs, to find the eggs of a given name, version
+    and tags without scanning every egg.
+
+    Entries may be EggMetadata instances, or the dictionaries returned by
+    EggMetadata.to_json_dict. They are returned as given. The entries of a
+    name are kept sorted by version, and indexed by python, abi and platform
+    tags, so that the latest matching entry is found in O(log n).
+
+    Tags follow the conventions of the EggMetadata *_tag_string properties:
+    'none' for eggs without python tag or abi, and 'any' for cross-platform
+    eggs.
+
+    Example::
+
+        index = EggIndex(scanned_metadata)
+        metadata = index.latest(
+            "numpy", python_tag="cp311", platform_tag="linux_x86_64")
+
+        tags = supported_tags(platform, implementation, abi)
+        metadata = index.best("numpy", tags)
+
+    Parameters
+    ----------
+    entries: iterable
+        The initial entries.
+    """
+    def __init__(self, entries=()):
+        self._versions = VersionInterner(EnpkgVersion)
+
+        # name -> _SortedEntries mapping
+        self._by_name = {}
+        # (name, python_tag, abi_tag, platform_tag) -> _SortedEntries
+        self._by_tag = {}
+        # (name, tag) -> _SortedEntries mappings, one per tag kind
+        self._by_python_tag = {}
+        self._by_abi_tag = {}
+        self._by_platform_tag = {}
+        self._len = 0
+
+        self.update(entries)
+
+    # Public methods
+    def add(self, entry):
+        """ Index the given entry. An already indexed entry of the same name,
+        version and tags is replaced.
+
+        Parameters
+        ----------
+        entry: EggMetadata or dict
+            The egg metadata, or its to_json_dict() representation.
+        """
+        name, version, tag = self._entry_key(entry)
+        key = version.sort_key
+        self._discard(name, key, tag)
+
+        record = (entry, tag)
+        python_tag, abi_tag, platform_tag = tag
+        for mapping, index_key in (
+            (self._by_name, name),
+            (self._by_tag, (name, python_tag, abi_tag, platform_tag)),
+            (self._by_python_tag, (name, python_tag)),
+            (self._by_abi_tag, (name, abi_tag)),
+            (self._by_platform_tag, (name, platform_tag)),
+        ):
+            entries = mapping.get(index_key)
+            if entries is None:
+                entries = mapping[index_key] = _SortedEntries()
+            entries.insert(key, record)
+        self._len += 1
+
+    def update(self, entries):
+        """ Index every given entry, see add."""
+        for entry in entries:
+            self.add(entry)
+
+    def remove(self, entry):
+        """ Remove the entry of the same name, version and tags as the given
+        entry.
+
+        Raises a KeyError if there is no such entry.
+        """
+        name, version, tag = self._entry_key(entry)
+        if not self._discard(name, version.sort_key, tag):
+            raise KeyError(entry)
+
+    def get(self, name, python_tag=None, abi_tag=None, platform_tag=None,
+            max_version=None):
+        """ Returns the list of the matching entries, newest first.
+
+        Parameters
+        ----------
+        name: str
+            The package name. Names are compared as EggMetadata.name, e.g.
+            'PyYAML' and 'pyyaml' are the same name.
+        python_tag: str or None
+            If given, only return entries of this python tag, e.g. 'cp311'.
+        abi_tag: str or None
+            If given, only return entries of this abi tag.
+        platform_tag: str or None
+            If given, only return entries of this platform tag.
+        max_version: EnpkgVersion, str or None
+            If given, only return entries of this version or older.
+        """
+        return [
+            entry for entry, _ in self._iter_matching(
+                name, python_tag, abi_tag, platform_tag, max_version)
+        ]
+
+    def latest(self, name, python_tag=None, abi_tag=None, platform_tag=None,
+               max_version=None):
+        """ Returns the newest matching entry, or None. The arguments are the
+        same as for get.
+        """
+        for entry, _ in self._iter_matching(
+                name, python_tag, abi_tag, platform_tag, max_version):
+            return entry
+        return None
+
+    def best(self, name, supported, max_version=None):
+        """ Returns the newest entry whose tag is supported, or None. Between
+        entries of the newest version, the most preferred tag wins.
+
+        Parameters
+        ----------
+        name: str
+            The package name.
+        supported: iterable
+            The supported (python_tag, abi_tag, platform_tag) tuples, in
+            preference order, e.g. as returned by
+            okonomiyaki.platforms.supported_tags.
+        max_version: EnpkgVersion, str or None
+            If given, ignore entries newer than this version.
+        """
+        name = _normalize_name(name)
+        max_key = self._max_key(max_version)
+
+        best_record = best_key = None
+        for python_tag, abi_tag, platform_tag in supported:
+            entries = self._by_tag.get(
+                (name, python_tag, abi_tag, platform_tag))
+            if entries is None:
+                continue
+            i = entries.end(max_key) - 1
+            if i >= 0 and (best_key is None or entries.key(i) > best_key):
+                best_record, best_key = entries.record(i), entries.key(i)
+
+        if best_record is None:
+            return None
+        return best_record[0]
+
+    def names(self):
+        """ Returns the set of indexed names."""
+        return set(self._by_name)
+
+    # Protocol implementations
+    def __iter__(self):
+        """ Iterate over the entries, by name then version."""
+        for name in sorted(self._by_name):
+            for entry, _ in self._by_name[name]:
+                yield entry
+
+    def __len__(self):
+        return self._len
+
+    # Private methods
+    def _entry_key(self, entry):
+        """ Returns the (name, version, tag) tuple of the given entry."""
+        if isinstance(entry, EggMetadata):
+            tag = (
+                entry.python_tag_string, entry.abi_tag_string,
+                entry.platform_tag_string
+            )
+            return entry.name, entry.version, tag
+        else:
+            tag = (
+                entry[_JSON_PYTHON_TAG] or _NO_PYTHON,
+                entry[_JSON_ABI_TAG] or _NO_ABI,
+                entry[_JSON_PLATFORM_TAG] or _ANY_PLATFORM,
+            )
+            version = self._versions.from_string(entry[_JSON_VERSION])
+            return _normalize_name(entry[_JSON__RAW_NAME]), version, tag
+
+    def _max_key(self, max_version):
+        if max_version is None:
+            return None
+        if isinstance(max_version, str):
+            max_version = self._versions.from_string(max_version)
+        return max_version.sort_key
+
+    def _discard(self, name, key, tag):
+        """ Remove the entry of the given name, version key and tag from
+        every index. Returns False if there is no such entry.
+        """
+        entries = self._by_name.get(name)
+        if entries is None:
+            return False
+        i = entries.find(key, tag)
+        if i < 0:
+            return False
+
+        python_tag, abi_tag, platform_tag = tag
+        for mapping, index_key in (
+            (self._by_name, name),
+            (self._by_tag, (name, python_tag, abi_tag, platform_tag)),
+            (self._by_python_tag, (name, python_tag)),
+            (self._by_abi_tag, (name, abi_tag)),
+            (self._by_platform_tag, (name, platform_tag)),
+        ):
+            entries = mapping[index_key]
+            entries.pop(entries.find(key, tag))
+            if len(entries) == 0:
+                del mapping[index_key]
+        self._len -= 1
+        return True
+
+    def _iter_matching(self, name, python_tag, abi_tag, platform_tag,
+                       max_version):
+        """ Generates the (entry, tag) records matching the given
+        constraints, newest first.
+        """
+        name = _normalize_name(name)
+        max_key = self._max_key(max_version)
+
+        if (
+            python_tag is not None and abi_tag is not None
+            and platform_tag is not None
+        ):
+            entries = self._by_tag.get(
+                (name, python_tag, abi_tag, platform_tag))
+            if entries is not None:
+                for record in entries.iter_newest_first(max_key):
+                    yield record
+            return
+
+        # Start from the smallest index matching one of the constraints,
+        # and filter on the other ones
+        entries = self._by_name.get(name)
+        if entries is None:
+            return
+        used = None
+        for position, (mapping, tag) in enumerate((
+            (self._by_python_tag, python_tag),
+            (self._by_abi_tag, abi_tag),
+            (self._by_platform_tag, platform_tag),
+        )):
+            if tag is not None:
+                candidate = mapping.get((name, tag))
+                if candidate is None:
+                    return
+                if len(candidate) < len(entries):
+                    entries, used = candidate, position
+
+        filters = [
+            (position, tag) for position, tag in enumerate(
+                (python_tag, abi_tag, platform_tag))
+            if tag is not None and position != used
+        ]
+        for record in entries.iter_newest_first(max_key):
+            tag = record[1]
+            for position, value in filters:
+                if tag[position] != value:
+                    break
+            else:
+                yield record
@@ -2,8 +2,6 @@ import io
 import posixpath
 import re
 
-import zipfile2
-
 from attr import attr, attributes
 from attr.validators import instance_of, optional
 
@@ -12,18 +10,19 @@ from okonomiyaki.errors import (
     InvalidEggName, InvalidMetadataField,
     MissingMetadata, UnsupportedMetadata)
 from okonomiyaki.platforms import (
-    EPDPlatform, PlatformABI, PythonABI, PythonImplementation)
-from okonomiyaki.utils import (
-    compute_sha256, decode_if_needed, parse_assignments)
-from okonomiyaki.versions import EnpkgVersion, MetadataVersion
+    EPDPlatform, Platform, PlatformABI, PythonABI, PythonImplementation)
+from okonomiyaki.utils import decode_if_needed, parse_assignments
+from okonomiyaki.utils._zip import _read_leading_members
+from okonomiyaki.utils.archives import _open_archive
+from okonomiyaki.versions import EnpkgVersion, MetadataVersion, RuntimeVersion
 from .legacy import (
     _guess_abi_tag, _guess_platform_abi, _guess_platform_tag, _guess_python_tag)
 from ._blacklist import (
     EGG_PLATFORM_BLACK_LIST, EGG_PYTHON_TAG_BLACK_LIST,
-    may_be_in_platform_blacklist, may_be_in_python_tag_blacklist,
-    may_be_in_pkg_info_blacklist)
+    compute_sha256_if_needed, may_be_in_platform_blacklist,
+    may_be_in_python_tag_blacklist, may_be_in_pkg_info_blacklist)
 from ._package_info import (
-    PackageInfo, _convert_if_needed, _keep_position, _read_pkg_info)
+    PackageInfo, _PKG_INFO_LOCATION, _convert_if_needed, _read_pkg_info)
 
 
 _EGG_NAME_RE = re.compile(r"""
@@ -45,6 +44,11 @@ _SPEC_LIB_DEPEND_LOCATION = posixpath.join(EGG_INFO_PREFIX, "spec",
 _SPEC_SUMMARY_LOCATION = posixpath.join(EGG_INFO_PREFIX, "spec", "summary")
 _USR_PREFIX_LOCATION = posixpath.join(EGG_INFO_PREFIX, "usr")
 
+# Members written first by EggBuilder
+_HEAD_METADATA_LOCATIONS = (
+    _SPEC_SUMMARY_LOCATION, _SPEC_DEPEND_LOCATION, _PKG_INFO_LOCATION
+)
+
 _TAG_METADATA_VERSION = "metadata_version"
 _TAG_NAME = "name"
 _TAG_VERSION = "version"
@@ -346,6 +350,33 @@ _METADATA_DEFAULT_VERSION_STRING = "1.4"
 _METADATA_DEFAULT_VERSION = M(_METADATA_DEFAULT_VERSION_STRING)
 
 
+class _HeadMembers(object):
+    """ Zipfile-like, read-only access to the metadata members found at the
+    start of an egg.
+    """
+    def __init__(self, filename, members):
+        self.filename = filename
+        self._members = members
+
+    def read(self, name):
+        return self._members[name]
+
+
+def _read_head_members(path):
+    """ Returns a _HeadMembers instance if the egg at the given path starts
+    with its metadata, as written by EggBuilder, and None otherwise.
+
+    This avoids parsing the central directory, whose cost grows with the
+    number of members in the egg.
+    """
+    with open(path, "rb") as fp:
+        members = _read_leading_members(fp, _HEAD_METADATA_LOCATIONS)
+    if members is None:
+        return None
+    else:
+        return _HeadMembers(path, members)
+
+
 def _epd_platform_from_raw_spec(raw_spec):
     """ Create an EPDPlatform instance from the metadata info returned by
     parse_rawspec.
@@ -444,18 +475,30 @@ class LegacySpecDepend(object):
             args["metadata_version"],
         )
 
+    @staticmethod
+    def _may_be_in_blacklist(path):
+        return (
+            may_be_in_platform_blacklist(path)
+            or may_be_in_python_tag_blacklist(path)
+        )
+
     @classmethod
-    def from_egg(cls, path_or_file):
-        sha256 = None
-        if isinstance(path_or_file, str):
-            if (
-                may_be_in_platform_blacklist(path_or_file)
-                or may_be_in_python_tag_blacklist(path_or_file)
-            ):
-                sha256 = compute_sha256(path_or_file)
-        else:
-            with _keep_position(path_or_file.fp):
-                sha256 = compute_sha256(path_or_file.fp)
+    def from_egg(cls, path_or_file, sha256=None):
+        """ Create a LegacySpecDepend instance from an existing egg.
+
+        Parameters
+        ----------
+        path_or_file: str or file-like object.
+            If a string, understood as the path to the egg. Otherwise,
+            understood as a zipfile-like object, e.g. a ZipFile or an
+            ArchiveView instance.
+        sha256: str or None
+            The sha256 of the egg, if already known. Otherwise, it is only
+            computed when the egg may be in one of the blacklists.
+        """
+        if sha256 is None:
+            sha256 = compute_sha256_if_needed(
+                path_or_file, cls._may_be_in_blacklist)
         return cls._from_egg(path_or_file, sha256)
 
     @classmethod
@@ -465,7 +508,7 @@ class LegacySpecDepend(object):
             if epd_platform_string is None:
                 epd_platform = None
             else:
-                epd_platform = EPDPlatform.from_epd_string(epd_platform_string)
+                epd_platform = EPDPlatform.from_string(epd_platform_string)
 
             try:
                 spec_depend_string = zp.read(_SPEC_DEPEND_LOCATION).decode()
@@ -480,7 +523,7 @@ class LegacySpecDepend(object):
                 return cls._from_data(data, epd_platform)
 
         if isinstance(path_or_file, str):
-            with zipfile2.ZipFile(path_or_file) as zp:
+            with _open_archive(path_or_file) as zp:
                 return _create_spec_depend(zp)
         else:
             return _create_spec_depend(path_or_file)
@@ -666,6 +709,33 @@ _JSON_RUNTIME_DEPENDENCIES = "runtime_dependencies"
 _JSON_SUMMARY = "summary"
 
 
+def _epd_platform_from_json_dict(json_dict, python):
+    """ Create an EPDPlatform instance from the output of
+    EggMetadata.to_json_dict.
+
+    The python runtime and the platform tag are taken into account the same
+    way as when parsing spec/depend, so that the platform release survives
+    the round trip.
+    """
+    if python is None:
+        runtime_version = None
+    else:
+        runtime_version = RuntimeVersion.from_string(
+            "{0}.{1}".format(python.major, python.minor))
+    epd_platform = EPDPlatform.from_string(
+        json_dict[_JSON_EPD_PLATFORM], runtime_version)
+
+    platform_tag = json_dict[_JSON_PLATFORM_TAG]
+    if platform_tag is not None and 'osx' in platform_tag.lower():
+        platform = epd_platform.platform
+        epd_platform = EPDPlatform(Platform(
+            os_kind=platform.os_kind, name_kind=platform.name_kind,
+            family_kind=platform.family_kind,
+            release='.'.join(platform_tag.split('_')[1:3]),
+            arch=platform.arch, machine=platform.machine))
+    return epd_platform
+
+
 class EggMetadata(object):
     """ Enthought egg metadata for format 1.x.
     """
@@ -688,26 +758,26 @@ class EggMetadata(object):
         )
 
     @classmethod
-    def from_egg(cls, path_or_file, strict=True):
+    def from_egg(cls, path_or_file, strict=True, sha256=None):
         """ Create a EggMetadata instance from an existing Enthought egg.
 
         Parameters
         ----------
         path: str or file-like object.
             If a string, understood as the path to the egg. Otherwise,
-            understood as a zipfile-like object.
+            understood as a zipfile-like object, e.g. a ZipFile or an
+            ArchiveView instance.
         strict: bool
             If True, will fail if metadata cannot be decoded correctly (e.g.
             unicode errors in EGG-INFO/PKG-INFO). If false, will ignore those
             errors, at the risk of data loss.
+        sha256: str or None
+            The sha256 of the egg, if already known. Otherwise, it is only
+            computed when the egg may be in one of the blacklists.
         """
-        sha256 = None
-        if isinstance(path_or_file, str):
-            if cls._may_be_in_blacklist(path_or_file):
-                sha256 = compute_sha256(path_or_file)
-        else:
-            with _keep_position(path_or_file.fp):
-                sha256 = compute_sha256(path_or_file.fp)
+        if sha256 is None:
+            sha256 = compute_sha256_if_needed(
+                path_or_file, cls._may_be_in_blacklist)
         return cls._from_egg(path_or_file, sha256, strict)
 
     @classmethod
@@ -722,7 +792,7 @@ class EggMetadata(object):
         if json_dict[_JSON_EPD_PLATFORM] is None:
             epd_platform = None
         else:
-            epd_platform = EPDPlatform.from_epd_string(json_dict[_JSON_EPD_PLATFORM])
+            epd_platform = _epd_platform_from_json_dict(json_dict, python)
 
         dependencies = Dependencies(tuple(json_dict[_JSON_RUNTIME_DEPENDENCIES]))
         metadata_version = MetadataVersion.from_string(
@@ -763,8 +833,12 @@ class EggMetadata(object):
             return summary, pkg_info_string, spec_depend
 
         if isinstance(path_or_file, str):
-            with zipfile2.ZipFile(path_or_file) as zp:
-                summary, pkg_info_string, spec_depend = _compute_all_metadata(zp)
+            head = _read_head_members(path_or_file)
+            if head is not None:
+                summary, pkg_info_string, spec_depend = _compute_all_metadata(head)
+            else:
+                with _open_archive(path_or_file) as zp:
+                    summary, pkg_info_string, spec_depend = _compute_all_metadata(zp)
         else:
             summary, pkg_info_string, spec_depend = _compute_all_metadata(
                 path_or_file
@@ -1027,6 +1101,9 @@ class EggMetadata(object):
         path : str
             The path to write the zipped metadata into.
         """
+        # zipfile2 is only needed to write archives
+        import zipfile2
+
         with zipfile2.ZipFile(path, "w", zipfile2.ZIP_DEFLATED) as zp:
             zp.writestr(
                 _SPEC_DEPEND_LOCATION, self.spec_depend_string.encode())
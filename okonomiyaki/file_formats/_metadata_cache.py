@@ -0,0 +1,223 @@
+import json
+import os
+import os.path
+import time
+
+from okonomiyaki.utils import compute_sha256
+from okonomiyaki.utils._sqlite import SqliteCache
+from ._egg_info import EggMetadata
+from ._package_info import PackageInfo
+
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS egg_metadata (
+    path TEXT NOT NULL,
+    strict INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT,
+    json_dict TEXT NOT NULL,
+    pkg_info TEXT,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (path, strict)
+)"""
+
+_CREATE_LAST_USED_INDEX = """\
+CREATE INDEX IF NOT EXISTS egg_metadata_last_used
+ON egg_metadata (last_used)"""
+
+# Number of recency updates kept in memory before being written
+_MAX_PENDING_UPDATES = 1000
+
+
+def _clock_ns():
+    # time.time_ns is not available on python 3.6
+    return int(time.time() * 1e9)
+
+
+class EggMetadataCache(SqliteCache):
+    """ A persistent, sqlite-backed cache of egg metadata.
+
+    Entries are keyed on the absolute path of the egg, and invalidated when
+    its size or modification time change. When verify_sha256 is True, the
+    sha256 of the egg is checked as well, at the cost of reading the whole
+    file on every lookup.
+
+    Example::
+
+        with EggMetadataCache(cache_directory) as cache:
+            metadata = cache.from_egg("numpy-1.7.1-1.egg")
+
+    Parameters
+    ----------
+    directory: str
+        The directory holding the cache database. It is created if it does
+        not exist.
+    max_entries: int or None
+        If not None, the least recently used entries are evicted once the
+        cache holds more than max_entries eggs. Eviction runs every
+        max_entries / 10 new entries, so the cache may temporarily hold
+        about 10% more eggs.
+    verify_sha256: bool
+        If True, also invalidate entries whose sha256 does not match.
+    """
+    _DATABASE_NAME = "egg_metadata.sqlite"
+    _SCHEMA_VERSION = 2
+    _TABLE = "egg_metadata"
+    _SCHEMA = (_CREATE_TABLE, _CREATE_LAST_USED_INDEX)
+
+    def __init__(self, directory, max_entries=None, verify_sha256=False):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(
+                "Invalid maximum number of entries: {0!r}".format(max_entries))
+        super(EggMetadataCache, self).__init__(directory)
+        self.max_entries = max_entries
+        self.verify_sha256 = verify_sha256
+
+        # Recency updates of the cache hits, written in batches: (path,
+        # strict) -> last_used mapping
+        self._pending_updates = {}
+        self._last_used = 0
+        self._stores_since_eviction = 0
+
+    # Public methods
+    def from_egg(self, path, strict=True):
+        """ Return the EggMetadata of the given egg, reading the egg only
+        if it is not in the cache already.
+
+        Parameters
+        ----------
+        path: str
+            The path to the egg.
+        strict: bool
+            Passed through to EggMetadata.from_egg.
+        """
+        metadata = self.get(path, strict)
+        if metadata is None:
+            # stat before reading, so that an egg modified while being read
+            # is not cached under its new size and mtime
+            st = os.stat(path)
+            if self.verify_sha256:
+                sha256 = compute_sha256(path)
+            else:
+                sha256 = None
+            metadata = EggMetadata.from_egg(path, strict, sha256=sha256)
+            self._store(self._key(path), strict, st, metadata, sha256)
+        return metadata
+
+    def get(self, path, strict=True):
+        """ Return the cached EggMetadata of the given egg, or None if the
+        egg is not in the cache, or has changed since it was cached.
+        """
+        key = self._key(path)
+        row = self._execute(
+            "SELECT size, mtime_ns, sha256, json_dict, pkg_info "
+            "FROM egg_metadata WHERE path = ? AND strict = ?",
+            (key, strict)
+        ).fetchone()
+        if row is None:
+            return None
+
+        size, mtime_ns, sha256, json_dict, pkg_info = row
+        if not self._is_fresh(path, size, mtime_ns, sha256):
+            self._delete(key)
+            return None
+
+        self._pending_updates[(key, strict)] = self._stamp()
+        if len(self._pending_updates) >= _MAX_PENDING_UPDATES:
+            self._write_pending_updates()
+            self._commit()
+        return EggMetadata.from_json_dict(json.loads(json_dict), pkg_info)
+
+    def invalidate(self, path):
+        """ Remove the given egg from the cache."""
+        self._delete(self._key(path))
+
+    def flush(self):
+        """ Write the pending recency updates of the cache hits.
+
+        Hits only update the recency of their entries in memory, so that
+        warm lookups do not commit to the database. Pending updates are
+        written when new entries are stored, every 1000 hits, and by close.
+        """
+        if len(self._pending_updates) > 0:
+            self._write_pending_updates()
+            self._commit()
+
+    def close(self):
+        if self._connection is not None:
+            self.flush()
+        super(EggMetadataCache, self).close()
+
+    # Protocol implementations
+    def __getstate__(self):
+        state = super(EggMetadataCache, self).__getstate__()
+        state["_pending_updates"] = {}
+        state["_stores_since_eviction"] = 0
+        return state
+
+    # Private methods
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def _is_fresh(self, path, size, mtime_ns, sha256):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_size != size or st.st_mtime_ns != mtime_ns:
+            return False
+        if self.verify_sha256:
+            return sha256 is not None and compute_sha256(path) == sha256
+        return True
+
+    def _store(self, key, strict, st, metadata, sha256):
+        pkg_info = metadata._pkg_info
+        if isinstance(pkg_info, PackageInfo):
+            pkg_info = pkg_info.to_string()
+        # The new entry is more recent than any pending hit on the old one
+        self._pending_updates.pop((key, strict), None)
+        self._execute(
+            "INSERT OR REPLACE INTO egg_metadata "
+            "(path, strict, size, mtime_ns, sha256, json_dict, pkg_info, "
+            "last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, strict, st.st_size, st.st_mtime_ns, sha256,
+             json.dumps(metadata.to_json_dict()), pkg_info, self._stamp())
+        )
+        self._write_pending_updates()
+        if self.max_entries is not None:
+            self._stores_since_eviction += 1
+            if self._stores_since_eviction >= max(1, self.max_entries // 10):
+                self._evict()
+        self._commit()
+
+    def _evict(self):
+        # Walks the last_used index, instead of sorting the table
+        self._execute(
+            "DELETE FROM egg_metadata WHERE last_used <= ("
+            "SELECT last_used FROM egg_metadata "
+            "ORDER BY last_used DESC LIMIT 1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._stores_since_eviction = 0
+
+    def _stamp(self):
+        """ A last_used value: the current time, strictly increasing within
+        a process.
+        """
+        self._last_used = max(_clock_ns(), self._last_used + 1)
+        return self._last_used
+
+    def _write_pending_updates(self):
+        self._connect().executemany(
+            "UPDATE egg_metadata SET last_used = ? "
+            "WHERE path = ? AND strict = ?",
+            [(last_used, key, strict)
+             for (key, strict), last_used in self._pending_updates.items()]
+        )
+        self._pending_updates.clear()
+
+    def _delete(self, key):
+        self._execute("DELETE FROM egg_metadata WHERE path = ?", (key,))
+        self._commit()
@@ -3,18 +3,18 @@ Most of the code below is adapted from pkg-info 1.2.1
 
 We support 1.0, 1.1, 1.2, 2.0, 2.1, 2.2, 2.3, 2.4
 """
-import contextlib
 import io
 import os
 import os.path
+import re
 import warnings
 import textwrap
 
-import zipfile2
-
-from okonomiyaki.utils import compute_sha256
+from okonomiyaki.utils.archives import _open_archive
 from okonomiyaki.errors import OkonomiyakiError
-from ._blacklist import EGG_PKG_INFO_BLACK_LIST, may_be_in_pkg_info_blacklist
+from ._blacklist import (
+    EGG_PKG_INFO_BLACK_LIST, compute_sha256_if_needed,
+    may_be_in_pkg_info_blacklist)
 from ._wheel_info import WheelInfo
 
 
@@ -96,16 +96,22 @@ HEADER_ATTRS = {
 
 MAX_SUPPORTED_VERSION = max(HEADER_ATTRS.keys())
 
+# Attribute names which may be given as fields to PackageInfo.from_string
+FIELDS = frozenset(
+    attr_name for _, attr_name, _ in HEADER_ATTRS[MAX_SUPPORTED_VERSION]
+    if attr_name != 'metadata_version'
+)
+
 
 class PackageInfo(object):
     """ Class modeling the PKG-INFO content.
     """
     @classmethod
-    def from_path(cls, path, strict=True):
+    def from_path(cls, path, strict=True, fields=None):
         if path.endswith(".egg"):
-            return cls.from_egg(path, strict)
+            return cls.from_egg(path, strict, fields=fields)
         elif path.endswith(".whl"):
-            return cls.from_wheel(path, strict)
+            return cls.from_wheel(path, strict, fields=fields)
         else:
             raise OkonomiyakiError(
                 u"Unrecognized package extension: '{}'".format(
@@ -114,11 +120,11 @@ class PackageInfo(object):
             )
 
     @classmethod
-    def from_wheel(cls, path_or_file, strict=True):
+    def from_wheel(cls, path_or_file, strict=True, fields=None):
         if isinstance(path_or_file, str):
             wheel_info = WheelInfo.from_path(path_or_file)
 
-            with zipfile2.ZipFile(path_or_file) as fp:
+            with _open_archive(path_or_file) as fp:
                 data = _read_pkg_info_wheel(fp, (wheel_info.name, wheel_info.version))
         else:
             # path_or_file assumed to be a ZipFile instance
@@ -129,31 +135,33 @@ class PackageInfo(object):
             raise OkonomiyakiError(msg)
 
         data = _convert_if_needed(data, None, strict)
-        return cls.from_string(data)
+        return cls.from_string(data, fields)
 
     @classmethod
-    def from_egg(cls, path_or_file, strict=True):
+    def from_egg(cls, path_or_file, strict=True, sha256=None, fields=None):
         """ Create a PackageInfo instance from an existing egg.
 
         Parameters
         ----------
         path: str or file-like object.
             If a string, understood as the path to the egg. Otherwise,
-            understood as a zipfile-like object.
+            understood as a zipfile-like object, e.g. a ZipFile or an
+            ArchiveView instance.
+        sha256: str or None
+            The sha256 of the egg, if already known. Otherwise, it is only
+            computed when the egg may be in the PKG-INFO blacklist.
+        fields: iterable or None
+            If given, only parse those attributes, see from_string.
         """
-        sha256 = None
-        if isinstance(path_or_file, str):
-            if may_be_in_pkg_info_blacklist(path_or_file):
-                sha256 = compute_sha256(path_or_file)
-        else:
-            with _keep_position(path_or_file.fp):
-                sha256 = compute_sha256(path_or_file.fp)
-        return cls._from_egg(path_or_file, sha256, strict)
+        if sha256 is None:
+            sha256 = compute_sha256_if_needed(
+                path_or_file, may_be_in_pkg_info_blacklist)
+        return cls._from_egg(path_or_file, sha256, strict, fields)
 
     @classmethod
-    def _from_egg(cls, path_or_file, sha256, strict=True):
+    def _from_egg(cls, path_or_file, sha256, strict=True, fields=None):
         if isinstance(path_or_file, str):
-            with zipfile2.ZipFile(path_or_file) as fp:
+            with _open_archive(path_or_file) as fp:
                 data = _read_pkg_info(fp)
         else:
             data = _read_pkg_info(path_or_file)
@@ -163,14 +171,34 @@ class PackageInfo(object):
             raise OkonomiyakiError(msg)
 
         data = _convert_if_needed(data, sha256, strict)
-        return cls.from_string(data)
+        return cls.from_string(data, fields)
 
     @classmethod
-    def from_string(cls, s):
+    def from_string(cls, s, fields=None):
+        """ Create a PackageInfo instance from the given PKG-INFO content.
+
+        Parameters
+        ----------
+        s: str
+            The PKG-INFO content.
+        fields: iterable or None
+            If given, the attribute names to parse, e.g. ('summary',
+            'requires_dist'). name and version are always parsed, other
+            attributes keep their default value. Unless 'description' is
+            given, the metadata body is skipped: its offset is then
+            available as description_offset, see load_description.
+        """
         if not isinstance(s, str):
             raise ValueError("Expected text value, got {0!r}".format(type(s)))
-        fp = io.StringIO(s)
-        msg = _parse(fp)
+
+        if fields is None:
+            msg = _parse_string(s)
+            with_description = True
+        else:
+            fields = _ensure_supported_fields(fields)
+            with_description = 'description' in fields
+            msg = _parse_string(
+                s, _header_names(fields), with_body=with_description)
         kw = {}
 
         if 'Metadata-Version' in msg:
@@ -185,6 +213,8 @@ class PackageInfo(object):
         for header_name, attr_name, multiple in attributes:
             if attr_name == 'metadata_version':
                 continue
+            if fields is not None and attr_name not in fields:
+                continue
 
             if header_name in msg:
                 if header_name == "Keywords":
@@ -201,7 +231,20 @@ class PackageInfo(object):
                     if value != 'UNKNOWN':
                         kw[attr_name] = value
 
-        if metadata_version_info >= (2, 1):
+        description_offset = None
+        # email.parser does not record the body offset: the body is then
+        # read as usual
+        body_offset = getattr(msg, "body_offset", None)
+        if (
+            metadata_version_info >= (2, 1)
+            and not with_description
+            and body_offset is not None
+        ):
+            # As for a full parse, a Description header takes precedence
+            # over the body
+            if body_offset < len(s) and "description" not in msg.skipped:
+                description_offset = body_offset
+        elif metadata_version_info >= (2, 1):
             msg_body = msg.get_payload()
             if msg_body is not None and msg_body != '':
                 if 'description' in kw:
@@ -228,7 +271,9 @@ class PackageInfo(object):
 
         name = kw.pop("name")
         version = kw.pop("version")
-        return cls(metadata_version, name, version, **kw)
+        pkg_info = cls(metadata_version, name, version, **kw)
+        pkg_info.description_offset = description_offset
+        return pkg_info
 
     def __init__(
             self, metadata_version, name, version, platform=None,
@@ -286,6 +331,32 @@ class PackageInfo(object):
         self.license_file = license_file or ()
         self.license_expression = license_expression or ()
 
+        # Offset of the description body in the PKG-INFO content, in
+        # characters, when it was skipped by from_string
+        self.description_offset = None
+
+    def load_description(self, data):
+        """ Returns the description, reading it from the given PKG-INFO
+        content if it was skipped when parsing.
+
+        Parameters
+        ----------
+        data: str
+            The PKG-INFO content this instance was created from, as given to
+            from_string.
+
+        Note
+        ----
+        Only a description given as the metadata body can be loaded: a
+        skipped Description header is not.
+        """
+        if not isinstance(data, str):
+            raise ValueError(
+                "Expected text value, got {0!r}".format(type(data)))
+        if self.description_offset is None:
+            return self.description
+        return data[self.description_offset:]
+
     def to_string(self, metadata_version_info=None, description_field=True):
         if metadata_version_info is None:
             metadata_version = self.metadata_version
@@ -414,11 +485,177 @@ def _ensure_supported_version(metadata_version):
         raise OkonomiyakiError(msg)
 
 
+def _ensure_supported_fields(fields):
+    fields = frozenset(fields)
+    unknown = fields - FIELDS
+    if unknown:
+        msg = "Unknown PKG-INFO field(s): {0}".format(
+            ", ".join(sorted(unknown)))
+        raise ValueError(msg)
+    # Always needed to create a PackageInfo
+    return fields | frozenset(("name", "version"))
+
+
+def _header_names(fields):
+    """ Returns the lower case header names needed to parse the given
+    fields.
+    """
+    names = set(["metadata-version"])
+    for header_name, attr_name, _ in HEADER_ATTRS[MAX_SUPPORTED_VERSION]:
+        if attr_name in fields:
+            names.add(header_name.lower())
+    return names
+
+
 def _parse(fp):
     from email.parser import Parser
     return Parser().parse(fp)
 
 
+def _parse_string(s, names=None, with_body=True):
+    """ Parse the given PKG-INFO content, using the fast parser if possible,
+    and email.parser otherwise.
+
+    names and with_body are only hints: email.parser always parses every
+    header and the body.
+    """
+    msg = _parse_fast(s, names, with_body)
+    if msg is None:
+        msg = _parse(io.StringIO(s))
+    return msg
+
+
+# Header line, as recognized by email.feedparser
+_HEADER_RE = re.compile(r"[\041-\071\073-\176]*:")
+_LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)?")
+
+
+class _Message(object):
+    """ The subset of email.message.Message used to read PKG-INFO content.
+    """
+    def __init__(self, headers, payload, body_offset, skipped=()):
+        # (lower case header name) -> (list of values) mapping
+        self._headers = headers
+        self._payload = payload
+        # Offset of the body in the parsed content
+        self.body_offset = body_offset
+        # Lower case names of the headers which were not kept
+        self.skipped = frozenset(skipped)
+
+    def __contains__(self, name):
+        return name.lower() in self._headers
+
+    def get(self, name, failobj=None):
+        values = self._headers.get(name.lower())
+        if values is None:
+            return failobj
+        return values[0]
+
+    def get_all(self, name, failobj=None):
+        values = self._headers.get(name.lower())
+        if values is None:
+            return failobj
+        return list(values)
+
+    def get_payload(self):
+        return self._payload
+
+
+def _has_surrogates(s):
+    # str.isascii is a fast path, only available on python >= 3.7
+    if getattr(s, "isascii", lambda: False)():
+        return False
+    try:
+        s.encode("utf-8")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+def _parse_fast(s, names=None, with_body=True):
+    """ Parse the given PKG-INFO content into a _Message, with the same
+    results as email.parser with the default (compat32) policy.
+
+    Only the header lines are split: the body is sliced as is from the
+    content.
+
+    If names is given, only the headers with those lower case names are
+    kept. If with_body is False, the payload is None and only the body
+    offset is recorded.
+
+    Returns None for content outside of the subset of RFC 822 understood by
+    this parser (unix-from lines, explicit content types, surrogates), for
+    which email.parser should be used instead.
+    """
+    headers = {}
+    # Names of the headers not kept
+    skipped = set()
+    has_content_type = False
+
+    def _add_header(source_lines):
+        name, value = source_lines[0].split(":", 1)
+        name = name.lower()
+        if names is not None and name not in names:
+            skipped.add(name)
+            return
+        value = value.lstrip(" \t") + "".join(source_lines[1:])
+        headers.setdefault(name, []).append(value.rstrip("\r\n"))
+
+    # Same line splitting as email.feedparser: \r\n, \r or \n. str.find
+    # is much faster than the regex when there is no \r
+    universal_newlines = "\r" in s
+
+    current = None
+    position = 0
+    size = len(s)
+    body_start = size
+    while position < size:
+        if universal_newlines:
+            end = _LINE_RE.match(s, position).end()
+        else:
+            end = s.find("\n", position) + 1 or size
+        line = s[position:end]
+
+        if line[0] in " \t":
+            # Continuation lines before any header are ignored
+            if current is not None:
+                current.append(line)
+            position = end
+            continue
+
+        if current is not None:
+            _add_header(current)
+            current = None
+
+        if line.startswith("From "):
+            return None
+        elif _HEADER_RE.match(line) is None:
+            # End of headers: an empty line is the separator, anything else
+            # is already part of the body
+            body_start = end if line[0] in "\r\n" else position
+            break
+        elif line[0] != ":":
+            # Lines without header name are ignored
+            current = [line]
+            if line[:13].lower() == "content-type:":
+                has_content_type = True
+        position = end
+
+    if current is not None:
+        _add_header(current)
+
+    if has_content_type:
+        return None
+
+    # email.message handles those specially. The body only matters if it
+    # is kept
+    if _has_surrogates(s if with_body else s[:body_start]):
+        return None
+
+    payload = s[body_start:] if with_body else None
+    return _Message(headers, payload, body_start, skipped)
+
+
 def _must_decode(value):  # pragma NO COVER
     if type(value) is bytes:
         try:
@@ -514,16 +751,6 @@ def _read_pkg_info(fp):
     return None
 
 
-@contextlib.contextmanager
-def _keep_position(fp):
-    pos = fp.tell()
-    try:
-        fp.seek(0)
-        yield
-    finally:
-        fp.seek(pos)
-
-
 # Copied from distutils.util
 def _rfc822_escape(header):
     """Return a version of the string escaped for inclusion in an
@@ -0,0 +1,59 @@
+import functools
+import zipfile
+
+from okonomiyaki.errors import OkonomiyakiError
+from okonomiyaki.utils._parallel import _map_paths
+from ._egg_info import EggMetadata
+
+
+SCAN_ERRORS = (OkonomiyakiError, zipfile.BadZipFile, OSError, UnicodeDecodeError)
+""" Exceptions reported per egg by scan_eggs instead of aborting the scan."""
+
+
+def _egg_metadata(path, strict):
+    return EggMetadata.from_egg(path, strict=strict)
+
+
+def _cached_egg_metadata(path, cache, strict):
+    return cache.from_egg(path, strict=strict)
+
+
+def scan_eggs(paths, workers=None, ordered=True, chunksize=1, strict=True,
+              cache=None):
+    """ Extract the metadata of many eggs, using a pool of processes.
+
+    Yields (path, result) pairs, where result is either an EggMetadata
+    instance, or the exception raised while reading that egg (any of
+    SCAN_ERRORS, e.g. MissingMetadata, InvalidMetadataField or
+    UnsupportedMetadata). Other exceptions abort the scan.
+
+    Parameters
+    ----------
+    paths: iterable
+        Paths of the eggs to scan.
+    workers: int or None
+        Number of worker processes. If None, use as many processes as there
+        are CPUs. If 1, eggs are scanned in the calling process.
+    ordered: bool
+        If True (the default), results are yielded in the order of paths.
+        Otherwise, results are yielded as they complete.
+    chunksize: int
+        The number of eggs sent to a worker at once. Larger values reduce
+        the inter-process overhead for repositories of many small eggs.
+    strict: bool
+        Passed through to EggMetadata.from_egg.
+    cache: EggMetadataCache or None
+        If given, the metadata of eggs which did not change since the last
+        scan are read from this cache instead of from the eggs themselves.
+    """
+    if cache is None:
+        func = functools.partial(_egg_metadata, strict=strict)
+        chunk_done = None
+    else:
+        func = functools.partial(
+            _cached_egg_metadata, cache=cache, strict=strict)
+        # Each chunk gets its own copy of the cache in the worker: write its
+        # pending recency updates, and close its connection
+        chunk_done = cache.close
+    return _map_paths(
+        func, paths, SCAN_ERRORS, workers, ordered, chunksize, chunk_done)
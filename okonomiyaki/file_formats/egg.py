@@ -1,13 +1,20 @@
+import collections
+import concurrent.futures
 import os
 import os.path
 import re
 import shutil
+import stat
 import tempfile
 import time
 import zipfile
 
 import zipfile2
 
+from ..utils._zip import (
+    _add_member_from_file, _add_raw_member, _deflate_file, _iter_file,
+    _iter_raw_data, _normalize_arcname, _raw_zip_info, _supports_raw_members
+)
 from ._egg_info import (
     _SPEC_DEPEND_LOCATION, _SPEC_SUMMARY_LOCATION
 )
@@ -82,7 +89,7 @@ class _EggBuilderNoPkgInfo(object):
         zinfo.external_attr = chmod << 16
         self._fp.writestr(zinfo, data)
 
-    def add_tree(self, directory, archive_prefix=""):
+    def add_tree(self, directory, archive_prefix="", workers=None):
         """
         Add the given directory to the egg, under the given archive_prefix.
 
@@ -91,19 +98,77 @@ class _EggBuilderNoPkgInfo(object):
         directory: path
             A path to a directory. Every file in this directory will be
             included, recursively.
+        workers: int
+            If given, files are compressed concurrently in a pool of that
+            many threads. Members are still written in the same order, and
+            the generated egg does not depend on the number of workers.
         """
-        for root, dirs, files in os.walk(directory):
-            for item in dirs + files:
-                path = os.path.join(root, item)
-                name = os.path.join(archive_prefix,
-                                    os.path.relpath(path, directory))
+        def _iter_tree():
+            for root, dirs, files in os.walk(directory):
+                for item in dirs + files:
+                    path = os.path.join(root, item)
+                    name = os.path.join(archive_prefix,
+                                        os.path.relpath(path, directory))
+                    yield path, name
+
+        if (
+            workers is None or self._fp.compression != zipfile.ZIP_DEFLATED
+            or not _supports_raw_members(self._fp)
+        ):
+            for path, name in _iter_tree():
                 self._fp.write(path, name)
+        else:
+            self._add_concurrently(_iter_tree(), workers)
 
     def commit(self):
         """ Commit the metadata, and close the file.
         """
         self.close()
 
+    def _add_concurrently(self, iterator, workers):
+        # Regular files are compressed in the pool, everything else
+        # (directories, symlinks) is written by ZipFile.write when its turn
+        # comes. The number of pending files is bounded to limit memory
+        # usage.
+        max_pending = 2 * workers
+        pending = collections.deque()
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            try:
+                for path, name in iterator:
+                    if stat.S_ISREG(os.lstat(path).st_mode):
+                        arcname = _normalize_arcname(self._fp, name)
+                        future = executor.submit(_deflate_file, path, arcname)
+                    else:
+                        future = None
+                    pending.append((path, name, future))
+
+                    if len(pending) > max_pending:
+                        self._write_pending(*pending.popleft())
+
+                while len(pending) > 0:
+                    self._write_pending(*pending.popleft())
+            finally:
+                for _, _, future in pending:
+                    if future is not None:
+                        future.cancel()
+                # Release the compressed data of the files which were not
+                # written, once their compression is done
+                for _, _, future in pending:
+                    if (
+                        future is not None and not future.cancelled()
+                        and future.exception() is None
+                    ):
+                        future.result()[1].close()
+
+    def _write_pending(self, path, name, future):
+        if future is None:
+            self._fp.write(path, name)
+        else:
+            zinfo, data, zip64 = future.result()
+            with data:
+                _add_raw_member(self._fp, zinfo, _iter_file(data), zip64)
+
     def _write_spec_depend(self):
         spec_depend_string = self._egg_metadata.spec_depend_string
         self.add_data(
@@ -177,7 +242,8 @@ class EggRewriter(_EggBuilderNoPkgInfo):
     """ Class to create Enthought eggs from existing setuptools eggs.
     """
     def __init__(self, egg_metadata, egg, compress=True, cwd=None,
-                 rename=None, accept=None, allow_overwrite=False):
+                 rename=None, accept=None, allow_overwrite=False,
+                 streaming=False):
         """ Create a new egg rewriter instance.
 
         Parameters
@@ -205,6 +271,12 @@ class EggRewriter(_EggBuilderNoPkgInfo):
             By default, the egg creation will fail if one adds existing
             archives. If set to True, one can overwrite archive members
             already present in the source egg.
+        streaming: bool
+            If True, members are copied directly from the original egg
+            instead of being extracted in a temporary directory first.
+            Members whose compression matches the compress argument are
+            copied as is, without being decompressed, and keep their
+            original timestamps and permissions.
 
         Note
         ----
@@ -218,11 +290,43 @@ class EggRewriter(_EggBuilderNoPkgInfo):
         self._accept = accept or DefaultAcceptFilter()
 
         self._allow_overwrite = allow_overwrite
+        self._streaming = streaming
 
     def commit(self):
-        self._copy_existing_content()
+        if self._streaming and _supports_raw_members(self._fp):
+            self._stream_existing_content()
+        else:
+            self._copy_existing_content()
         super(EggRewriter, self).commit()
 
+    def _stream_existing_content(self):
+        with zipfile2.ZipFile(self._egg) as source:
+            nameset = set(source.namelist())
+            for zinfo in source.infolist():
+                arcname = self._rename(zinfo.filename)
+
+                if self._allow_overwrite:
+                    if arcname in self._fp._filenames_set:
+                        continue
+
+                if self._accept(zinfo.filename, nameset):
+                    self._copy_member(source, zinfo, arcname)
+
+    def _copy_member(self, source, zinfo, arcname):
+        arcname = _normalize_arcname(self._fp, arcname)
+        if zinfo.filename.endswith("/"):
+            arcname += "/"
+
+        target_info = _raw_zip_info(zinfo, arcname)
+        if zinfo.compress_type == self._fp.compression or zinfo.file_size == 0:
+            _add_raw_member(
+                self._fp, target_info, _iter_raw_data(source, zinfo)
+            )
+        else:
+            target_info.compress_type = self._fp.compression
+            with source.open(zinfo) as source_fp:
+                _add_member_from_file(self._fp, target_info, source_fp)
+
     def _copy_existing_content(self):
         with zipfile2.ZipFile(self._egg) as source:
             tempdir = tempfile.mkdtemp()
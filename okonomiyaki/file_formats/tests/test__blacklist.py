@@ -0,0 +1,132 @@
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from .._blacklist import (
+    EGG_PKG_INFO_BLACK_LIST, EGG_PLATFORM_BLACK_LIST, EGG_PYTHON_TAG_BLACK_LIST,
+    may_be_in_pkg_info_blacklist, may_be_in_platform_blacklist,
+    may_be_in_python_tag_blacklist)
+from .._blacklist import pkg_info_data, platform_tag, python_tag
+
+
+def _run_after_import(code):
+    """ Runs the given code in a fresh interpreter, after importing
+    okonomiyaki.file_formats and the blacklist package, and returns its
+    output.
+    """
+    code = textwrap.dedent("""\
+        import okonomiyaki.file_formats
+        from okonomiyaki.file_formats import _blacklist
+        from okonomiyaki.file_formats._blacklist import _data
+    """) + textwrap.dedent(code)
+    process = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE,
+        universal_newlines=True, check=True,
+    )
+    return process.stdout.strip()
+
+
+class TestBlacklistImport(unittest.TestCase):
+    def test_import_does_not_load_data(self):
+        # When
+        output = _run_after_import("""\
+            _blacklist.may_be_in_pkg_info_blacklist("nose-1.3.4-1.egg")
+            _blacklist.may_be_in_platform_blacklist("xz-5.2.0-1.egg")
+            print(_data._DATA is None)
+        """)
+
+        # Then
+        self.assertEqual(output, "True")
+
+    @unittest.skipIf(
+        sys.version_info < (3, 8), "audit hooks require python >= 3.8")
+    def test_import_does_not_read_data_file(self):
+        # When
+        output = _run_after_import("""\
+            import sys
+
+            opened = []
+
+            def hook(event, args):
+                if event == "open" and args[0] == _data.BLACKLIST_DATA:
+                    opened.append(args[0])
+
+            sys.addaudithook(hook)
+            _blacklist.may_be_in_python_tag_blacklist("EPDIndex-1.0-1.egg")
+            print(len(opened))
+            _blacklist.EGG_PYTHON_TAG_BLACK_LIST.get("0" * 64)
+            print(len(opened))
+        """)
+
+        # Then
+        self.assertEqual(output.split(), ["0", "1"])
+
+
+class TestBlacklist(unittest.TestCase):
+    def test_may_be_in_blacklist(self):
+        # Given
+        pkg_info_egg = "/eggs/PySide-1.1.0-3.egg"
+        platform_egg = "/eggs/xz-5.2.0-1.egg"
+        python_tag_egg = "/eggs/EPDIndex-1.0-1.egg"
+
+        # When/Then
+        self.assertTrue(may_be_in_pkg_info_blacklist(pkg_info_egg))
+        self.assertTrue(may_be_in_platform_blacklist(platform_egg))
+        self.assertTrue(may_be_in_python_tag_blacklist(python_tag_egg))
+
+        self.assertFalse(may_be_in_pkg_info_blacklist(platform_egg))
+        self.assertFalse(may_be_in_platform_blacklist("nose-1.3.4-1.egg"))
+        self.assertFalse(may_be_in_python_tag_blacklist(platform_egg))
+
+    def test_lookup(self):
+        # Given
+        pyside_sha256 = (
+            "5eff70cfb464c2d531e6f93f7601e8ef8255b3a1ab4dd533826cfdcd5b962b60"
+        )
+        xz_sha256 = (
+            "ca5f2c417dd9f6354db3c2999edb441382ed11c7a034ade1839d1871a78ab2e8"
+        )
+        epd_index_sha256 = (
+            "2073936820da8c05da42cbb7140d5e59c175fe23cf230532701d5dfb322fb104"
+        )
+
+        # When/Then
+        self.assertEqual(
+            EGG_PKG_INFO_BLACK_LIST[pyside_sha256],
+            pkg_info_data.PYSIDE_1_1_0_PKG_INFO
+        )
+        self.assertEqual(EGG_PLATFORM_BLACK_LIST.get(xz_sha256), "win-32")
+        self.assertEqual(
+            EGG_PYTHON_TAG_BLACK_LIST.get(epd_index_sha256), "py27"
+        )
+        self.assertIsNone(EGG_PLATFORM_BLACK_LIST.get("0" * 64))
+
+    def test_egg_black_lists(self):
+        # Given
+        black_lists = (
+            (pkg_info_data._EGG_PKG_INFO_BLACK_LIST, EGG_PKG_INFO_BLACK_LIST),
+            (platform_tag._EGG_PLATFORM_BLACK_LIST, EGG_PLATFORM_BLACK_LIST),
+            (
+                python_tag._EGG_PYTHON_TAG_BLACK_LIST,
+                EGG_PYTHON_TAG_BLACK_LIST
+            ),
+        )
+
+        for egg_black_list, black_list in black_lists:
+            # When
+            checksums = dict(
+                (checksum, value)
+                for egg in egg_black_list.values()
+                for checksum, value in egg.items()
+            )
+
+            # Then
+            self.assertEqual(checksums, dict(black_list))
+
+    def test_unknown_attribute(self):
+        # When/Then
+        with self.assertRaises(AttributeError):
+            pkg_info_data.NOT_A_PKG_INFO
+        with self.assertRaises(AttributeError):
+            platform_tag.EGG_NAMES
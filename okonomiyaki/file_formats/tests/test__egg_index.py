@@ -0,0 +1,184 @@
+import unittest
+
+from okonomiyaki.platforms import (
+    EPDPlatform, PythonImplementation, supported_tags)
+from okonomiyaki.versions import EnpkgVersion
+
+from .._egg_index import EggIndex
+from .._egg_info import EggMetadata
+from .common import ENSTALLER_EGG, ETS_EGG, MKL_EGG, NUMEXPR_2_2_2_EGG
+
+
+def _record(raw_name, version, python_tag="cp311", abi_tag="cp311",
+            platform_tag="linux_x86_64"):
+    """ A dictionary as returned by EggMetadata.to_json_dict."""
+    return {
+        "metadata_version": "1.3",
+        "_raw_name": raw_name,
+        "version": version,
+        "epd_platform": None,
+        "python_tag": python_tag,
+        "abi_tag": abi_tag,
+        "platform_tag": platform_tag,
+        "platform_abi_tag": None,
+        "runtime_dependencies": [],
+        "summary": "",
+    }
+
+
+class TestEggIndex(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            _record("numpy", "1.26.4-1"),
+            _record("numpy", "1.21.6-2"),
+            _record("numpy", "1.26.4-1", platform_tag="win_amd64"),
+            _record("numpy", "1.24.4-3", "cp38", "cp38"),
+            _record("numpy", "2.0.0-1", "cp312", "cp312"),
+            _record("numpy", "1.26.4-2", "cp311", "abi3"),
+            _record("MKL", "2024.1-1", None, None),
+            _record("enstaller", "4.5.0-1", None, None, None),
+        ]
+        self.index = EggIndex(self.records)
+
+    def test_get(self):
+        # When
+        entries = self.index.get("numpy")
+
+        # Then
+        self.assertEqual(len(entries), 6)
+        self.assertEqual(entries[0], self.records[4])
+        self.assertEqual(
+            [EnpkgVersion.from_string(entry["version"]) for entry in entries],
+            sorted(
+                (EnpkgVersion.from_string(entry["version"])
+                 for entry in entries),
+                reverse=True
+            )
+        )
+        self.assertEqual(self.index.get("scipy"), [])
+
+    def test_get_tags(self):
+        # When
+        linux = self.index.get("numpy", platform_tag="linux_x86_64")
+        cp311 = self.index.get("numpy", python_tag="cp311", abi_tag="cp311")
+        exact = self.index.get(
+            "numpy", python_tag="cp311", abi_tag="cp311",
+            platform_tag="linux_x86_64")
+
+        # Then
+        self.assertEqual(len(linux), 5)
+        self.assertNotIn(self.records[2], linux)
+        self.assertEqual(cp311, [
+            self.records[2], self.records[0], self.records[1]])
+        self.assertEqual(exact, [self.records[0], self.records[1]])
+        self.assertEqual(
+            self.index.get("numpy", platform_tag="macosx_11_0_arm64"), [])
+
+    def test_latest(self):
+        # When/Then
+        self.assertEqual(self.index.latest("numpy"), self.records[4])
+        self.assertEqual(
+            self.index.latest("numpy", python_tag="cp311", abi_tag="cp311"),
+            self.records[2]
+        )
+        self.assertEqual(
+            self.index.latest("numpy", python_tag="cp311", abi_tag="cp311",
+                              platform_tag="linux_x86_64"),
+            self.records[0]
+        )
+        self.assertEqual(
+            self.index.latest(
+                "mkl", python_tag="none", platform_tag="linux_x86_64"),
+            self.records[6]
+        )
+        self.assertIsNone(self.index.latest("numpy", python_tag="cp27"))
+
+    def test_max_version(self):
+        # When
+        latest = self.index.latest("numpy", max_version="1.26.4-1")
+        older = self.index.get(
+            "numpy", platform_tag="linux_x86_64",
+            max_version=EnpkgVersion.from_string("1.24.4-3"))
+
+        # Then
+        self.assertIn(latest, (self.records[0], self.records[2]))
+        self.assertEqual(older, [self.records[3], self.records[1]])
+        self.assertIsNone(self.index.latest("numpy", max_version="1.0-1"))
+
+    def test_names(self):
+        # When/Then
+        self.assertEqual(len(self.index), 8)
+        self.assertEqual(
+            self.index.names(), set(["numpy", "mkl", "enstaller"]))
+        self.assertEqual(list(self.index)[0], self.records[7])
+
+    def test_add_replaces(self):
+        # Given
+        record = _record("NumPy", "1.26.4-1")
+
+        # When
+        self.index.add(record)
+
+        # Then
+        self.assertEqual(len(self.index), 8)
+        self.assertIs(
+            self.index.get("numpy", platform_tag="linux_x86_64")[2], record)
+
+    def test_remove(self):
+        # When
+        self.index.remove(_record("numpy", "2.0.0-1", "cp312", "cp312"))
+        self.index.remove(self.records[7])
+
+        # Then
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.latest("numpy"), self.records[5])
+        self.assertEqual(self.index.get("numpy", python_tag="cp312"), [])
+        self.assertEqual(self.index.names(), set(["numpy", "mkl"]))
+        with self.assertRaises(KeyError):
+            self.index.remove(self.records[7])
+        with self.assertRaises(KeyError):
+            self.index.remove(_record("numpy", "1.26.4-1", "cp38", "cp38"))
+
+    def test_best(self):
+        # Given
+        platform = EPDPlatform.from_string("rh7_x86_64")
+        implementation = PythonImplementation.from_string("cp311")
+        supported = list(supported_tags(platform, implementation, "cp311"))
+
+        # When/Then
+        self.assertEqual(
+            self.index.best("numpy", supported), self.records[5])
+        self.assertEqual(
+            self.index.best("numpy", supported, max_version="1.26.4-1"),
+            self.records[0]
+        )
+        self.assertEqual(self.index.best("MKL", supported), self.records[6])
+        self.assertEqual(
+            self.index.best("enstaller", supported), self.records[7])
+        self.assertIsNone(self.index.best("numpy", supported[-1:]))
+
+    def test_egg_metadata(self):
+        # Given
+        metadata = [
+            EggMetadata.from_egg(path)
+            for path in (ENSTALLER_EGG, ETS_EGG, MKL_EGG, NUMEXPR_2_2_2_EGG)
+        ]
+        newer = EggMetadata.from_egg_metadata(
+            metadata[3], version=EnpkgVersion.from_string("2.2.2-4"))
+
+        # When
+        index = EggIndex(metadata)
+        index.add(newer)
+
+        # Then
+        self.assertEqual(len(index), 5)
+        self.assertIs(index.latest("numexpr"), newer)
+        self.assertIs(
+            index.latest("mkl", platform_tag="macosx_10_6_x86_64"),
+            metadata[2])
+        self.assertIs(
+            index.latest("ets", python_tag="cp27", abi_tag="cp27m",
+                         platform_tag="linux_i686"),
+            metadata[1])
+        index.remove(metadata[3].to_json_dict())
+        self.assertEqual(index.get("numexpr"), [newer])
@@ -1,3 +1,4 @@
+import io
 import os
 import os.path as op
 import shutil
@@ -8,8 +9,8 @@ import unittest
 from unittest import mock
 
 from .._egg_info import (
-    Requirement, EggMetadata, LegacySpecDepend, parse_rawspec,
-    split_egg_name)
+    Requirement, EggMetadata, LegacySpecDepend, _read_head_members,
+    parse_rawspec, split_egg_name)
 from .common import (
     BROKEN_MCCABE_EGG, DATA_EGGS, ENSTALLER_EGG, ETS_EGG,
     FAKE_MEDIALOG_BOARDFILE_1_6_1_EGG, FAKE_MEDIALOG_BOARDFILE_1_6_1_PKG_INFO,
@@ -20,7 +21,8 @@ from okonomiyaki.errors import (
     InvalidRequirementStringHyphen)
 from okonomiyaki.utils import tempdir
 from okonomiyaki.utils.test_data import (
-    MKL_10_3_RH5_X86_64, NOSE_1_3_4_RH6_X86_64, NOSE_1_3_4_RH5_X86_64)
+    MKL_10_3_RH5_X86_64, NOSE_1_3_4_OSX_ARM64_cp311,
+    NOSE_1_3_4_RH6_X86_64, NOSE_1_3_4_RH5_X86_64, NUMPY_1_9_2_WIN_X86_64_cp311)
 from okonomiyaki.platforms import EPDPlatform, PlatformABI
 from okonomiyaki.versions import EnpkgVersion, MetadataVersion
 
@@ -310,7 +312,7 @@ packages = [
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             spec_depend = LegacySpecDepend.from_egg(egg)
@@ -320,7 +322,7 @@ packages = [
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             with zipfile2.ZipFile(egg) as zp:
@@ -329,6 +331,16 @@ packages = [
         # Then
         self.assertEqual(spec_depend._epd_platform.pep425_tag, "win32")
 
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+        ) as mocked_compute_sha256:
+            spec_depend = LegacySpecDepend.from_egg(egg, sha256=sha256sum)
+
+        # Then
+        self.assertFalse(mocked_compute_sha256.called)
+        self.assertEqual(spec_depend._epd_platform.pep425_tag, "win32")
+
     def test_missing_spec_depend(self):
         # When/Then
         with tempdir() as d:
@@ -1205,7 +1217,7 @@ class TestEggMetadata(unittest.TestCase):
                      "463a743a558fb1")
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             metadata = EggMetadata.from_egg(egg)
@@ -1216,7 +1228,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             with zipfile2.ZipFile(egg) as zp:
@@ -1233,7 +1245,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             metadata = EggMetadata.from_egg(egg)
@@ -1243,7 +1255,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=sha256sum
         ):
             with zipfile2.ZipFile(egg) as zp:
@@ -1257,13 +1269,65 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
         ) as mocked_compute_sha256:
             metadata = EggMetadata.from_egg(egg)
 
         # Then
         self.assertFalse(mocked_compute_sha256.called)
 
+    def test_blacklisted_platform_zipfile(self):
+        # Given
+        sha256sum = ("ca5f2c417dd9f6354db3c2999edb441382ed11c7a034"
+                     "ade1839d1871a78ab2e8")
+        with open(XZ_5_2_0_EGG, "rb") as fp:
+            data = fp.read()
+
+        # When
+        # Archives without a filename cannot be pre-checked by name
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+            return_value=sha256sum
+        ) as mocked_compute_sha256:
+            with zipfile2.ZipFile(io.BytesIO(data)) as zp:
+                metadata = EggMetadata.from_egg(zp)
+
+        # Then
+        self.assertTrue(mocked_compute_sha256.called)
+        self.assertEqual(metadata.platform_tag, "win32")
+
+        # Given
+        # An egg not in the blacklist
+        egg = BROKEN_MCCABE_EGG
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+        ) as mocked_compute_sha256:
+            with zipfile2.ZipFile(egg) as zp:
+                metadata = EggMetadata.from_egg(zp)
+
+        # Then
+        self.assertFalse(mocked_compute_sha256.called)
+        self.assertEqual(metadata, EggMetadata.from_egg(egg))
+
+    def test_blacklisted_platform_explicit_sha256(self):
+        # Given
+        egg = XZ_5_2_0_EGG
+        sha256sum = ("ca5f2c417dd9f6354db3c2999edb441382ed11c7a034"
+                     "ade1839d1871a78ab2e8")
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+        ) as mocked_compute_sha256:
+            with zipfile2.ZipFile(egg) as zp:
+                metadata = EggMetadata.from_egg(zp, sha256=sha256sum)
+
+        # Then
+        self.assertFalse(mocked_compute_sha256.called)
+        self.assertEqual(metadata.platform_tag, "win32")
+
     def test_blacklisted_pkg_info(self):
         # Given
         egg = FAKE_MEDIALOG_BOARDFILE_1_6_1_EGG
@@ -1272,7 +1336,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             metadata = EggMetadata.from_egg(egg)
@@ -1288,7 +1352,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             with zipfile2.ZipFile(egg) as zp:
@@ -1308,7 +1372,7 @@ class TestEggMetadata(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
         ) as mocked_compute_sha256:
             EggMetadata.from_egg(egg)
 
@@ -1369,7 +1433,7 @@ class TestEggMetadata(unittest.TestCase):
         )
 
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             r_metadata = EggMetadata.from_egg(egg)
@@ -1395,7 +1459,7 @@ class TestEggMetadata(unittest.TestCase):
         )
 
         with mock.patch(
-            "okonomiyaki.file_formats._egg_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             r_metadata = EggMetadata.from_egg(egg)
@@ -1470,6 +1534,86 @@ class TestEggMetadata(unittest.TestCase):
         )
 
         self.assertEqual(metadata, r_metadata)
+        self.assertEqual(metadata.platform, r_metadata.platform)
 
     def test_mkl_roundtrip(self):
         self._test_roundtrip(MKL_10_3_RH5_X86_64)
+
+    def test_osx_roundtrip(self):
+        self._test_roundtrip(NOSE_1_3_4_OSX_ARM64_cp311)
+
+    def test_win_roundtrip(self):
+        self._test_roundtrip(NUMPY_1_9_2_WIN_X86_64_cp311)
+
+
+class TestEggMetadataFromHead(unittest.TestCase):
+    def setUp(self):
+        self.prefix = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.prefix)
+
+    def test_no_central_directory(self):
+        # Given
+        egg = NOSE_1_3_4_RH5_X86_64
+        r_metadata = EggMetadata.from_egg(egg)
+
+        # When
+        with mock.patch(
+                "okonomiyaki.file_formats._egg_info._open_archive") as open_mock:
+            metadata = EggMetadata.from_egg(egg)
+
+        # Then
+        self.assertFalse(open_mock.called)
+        self.assertEqual(metadata, r_metadata)
+        self.assertEqual(metadata.pkg_info, r_metadata.pkg_info)
+
+    def test_fallback_metadata_not_first(self):
+        # Given
+        egg = op.join(self.prefix, op.basename(NOSE_1_3_4_RH5_X86_64))
+        with zipfile2.ZipFile(NOSE_1_3_4_RH5_X86_64) as source:
+            with zipfile2.ZipFile(egg, "w") as target:
+                target.writestr("EGG-INFO/top_level.txt", b"nose\n")
+                for arcname in source.namelist():
+                    target.writestr(arcname, source.read(arcname))
+
+        # When
+        metadata = EggMetadata.from_egg(egg)
+
+        # Then
+        self.assertEqual(metadata, EggMetadata.from_egg(NOSE_1_3_4_RH5_X86_64))
+
+    def test_fallback_missing_pkg_info(self):
+        # Given
+        egg = MKL_EGG
+
+        # When
+        with mock.patch(
+                "zipfile2.ZipFile",
+                wraps=zipfile2.ZipFile) as zipfile_mock:
+            metadata = EggMetadata.from_egg(egg)
+
+        # Then
+        self.assertTrue(zipfile_mock.called)
+        self.assertEqual(metadata.name, "mkl")
+
+    def test_fallback_corrupted_member(self):
+        # Given
+        egg = op.join(self.prefix, op.basename(NOSE_1_3_4_RH5_X86_64))
+        shutil.copy(NOSE_1_3_4_RH5_X86_64, egg)
+        with zipfile2.ZipFile(egg) as zp:
+            zinfo = zp.getinfo("EGG-INFO/spec/depend")
+
+        # Corrupt the CRC stored in the local file header
+        with open(egg, "r+b") as fp:
+            fp.seek(zinfo.header_offset + 14)
+            fp.write(b"\xff\xff\xff\xff")
+
+        # When
+        head = _read_head_members(egg)
+
+        # Then
+        self.assertIsNone(head)
+        self.assertEqual(
+            EggMetadata.from_egg(egg),
+            EggMetadata.from_egg(NOSE_1_3_4_RH5_X86_64))
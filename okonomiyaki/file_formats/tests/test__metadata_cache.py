@@ -0,0 +1,272 @@
+import os
+import os.path
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from .._egg_info import EggMetadata
+from .._metadata_cache import EggMetadataCache
+from .._scan import scan_eggs
+from .common import (
+    BROKEN_MCCABE_EGG, ENSTALLER_EGG, ETS_EGG, MKL_EGG, NUMEXPR_2_2_2_EGG,
+    UNICODE_DESCRIPTION_EGG)
+
+
+class TestEggMetadataCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tempdir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _copy(self, egg):
+        target = os.path.join(self.tempdir, os.path.basename(egg))
+        shutil.copy2(egg, target)
+        return target
+
+    def _copy_as(self, egg, basename):
+        target = os.path.join(self.tempdir, basename)
+        shutil.copy2(egg, target)
+        return target
+
+    def _last_used(self, cache):
+        connection = sqlite3.connect(cache.path)
+        try:
+            return dict(connection.execute(
+                "SELECT path, last_used FROM egg_metadata").fetchall())
+        finally:
+            connection.close()
+
+    def _assert_same_metadata(self, metadata, egg):
+        r_metadata = EggMetadata.from_egg(egg)
+        self.assertEqual(metadata, r_metadata)
+        self.assertEqual(metadata.platform, r_metadata.platform)
+        self.assertEqual(metadata.to_json_dict(), r_metadata.to_json_dict())
+
+    def test_warm_lookup_skips_zip_io(self):
+        # Given
+        eggs = [
+            ENSTALLER_EGG, ETS_EGG, MKL_EGG, NUMEXPR_2_2_2_EGG,
+            BROKEN_MCCABE_EGG, UNICODE_DESCRIPTION_EGG,
+        ]
+        with EggMetadataCache(self.directory) as cache:
+            for egg in eggs:
+                cache.from_egg(egg)
+
+        # When
+        with EggMetadataCache(self.directory) as cache:
+            with mock.patch(
+                "zipfile2.ZipFile",
+                side_effect=AssertionError("egg should not be opened")
+            ):
+                metadata = [cache.from_egg(egg) for egg in eggs]
+
+        # Then
+        for egg, egg_metadata in zip(eggs, metadata):
+            self._assert_same_metadata(egg_metadata, egg)
+
+    def test_invalidated_on_modification(self):
+        # Given
+        egg = self._copy(ETS_EGG)
+        cache = EggMetadataCache(self.directory)
+        self.addCleanup(cache.close)
+        cache.from_egg(egg)
+
+        # When
+        st = os.stat(egg)
+        os.utime(egg, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+        # Then
+        self.assertIsNone(cache.get(egg))
+        self.assertEqual(len(cache), 0)
+
+        # When
+        shutil.copy(ENSTALLER_EGG, egg)
+        metadata = cache.from_egg(egg)
+
+        # Then
+        self._assert_same_metadata(metadata, ENSTALLER_EGG)
+        self.assertEqual(len(cache), 1)
+
+    def test_verify_sha256(self):
+        # Given
+        egg = self._copy(ETS_EGG)
+        cache = EggMetadataCache(self.directory, verify_sha256=True)
+        self.addCleanup(cache.close)
+        cache.from_egg(egg)
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._metadata_cache.compute_sha256",
+            return_value="0" * 64
+        ):
+            metadata = cache.get(egg)
+
+        # Then
+        self.assertIsNone(metadata)
+
+        # When
+        cache.from_egg(egg)
+        metadata = cache.get(egg)
+
+        # Then
+        self._assert_same_metadata(metadata, ETS_EGG)
+
+    def test_lru_eviction(self):
+        # Given
+        cache = EggMetadataCache(self.directory, max_entries=2)
+        self.addCleanup(cache.close)
+
+        # When
+        cache.from_egg(ENSTALLER_EGG)
+        cache.from_egg(ETS_EGG)
+        cache.get(ENSTALLER_EGG)
+        cache.from_egg(MKL_EGG)
+
+        # Then
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(ENSTALLER_EGG))
+        self.assertIsNotNone(cache.get(MKL_EGG))
+        self.assertIsNone(cache.get(ETS_EGG))
+
+    def test_eviction_slack(self):
+        # Given
+        eggs = [
+            self._copy_as(ENSTALLER_EGG, "enstaller-4.5.0-{0}.egg".format(i))
+            for i in range(1, 24)
+        ]
+        cache = EggMetadataCache(self.directory, max_entries=20)
+        self.addCleanup(cache.close)
+
+        # When
+        for egg in eggs[:21]:
+            cache.from_egg(egg)
+
+        # Then
+        self.assertEqual(len(cache), 21)
+
+        # When
+        cache.from_egg(eggs[21])
+
+        # Then
+        self.assertEqual(len(cache), 20)
+        self.assertIsNone(cache.get(eggs[0]))
+        self.assertIsNone(cache.get(eggs[1]))
+        self.assertIsNotNone(cache.get(eggs[21]))
+
+    def test_hits_are_written_in_batches(self):
+        # Given
+        eggs = [ENSTALLER_EGG, ETS_EGG, MKL_EGG]
+        with EggMetadataCache(self.directory) as cache:
+            for egg in eggs:
+                cache.from_egg(egg)
+            r_last_used = self._last_used(cache)
+
+        # When
+        cache = EggMetadataCache(self.directory)
+        with mock.patch.object(
+            cache, "_commit", wraps=cache._commit
+        ) as commit:
+            for egg in eggs:
+                cache.get(egg)
+
+            # Then
+            self.assertEqual(commit.call_count, 0)
+            self.assertEqual(self._last_used(cache), r_last_used)
+
+            # When
+            cache.close()
+
+            # Then
+            self.assertEqual(commit.call_count, 1)
+
+        last_used = self._last_used(cache)
+        for egg in eggs:
+            self.assertGreater(last_used[egg], r_last_used[egg])
+        cache.close()
+
+    def test_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            EggMetadataCache(self.directory, max_entries=0)
+
+    def test_invalidate_and_clear(self):
+        # Given
+        cache = EggMetadataCache(self.directory)
+        self.addCleanup(cache.close)
+        cache.from_egg(ENSTALLER_EGG)
+        cache.from_egg(ETS_EGG)
+
+        # When
+        cache.invalidate(ETS_EGG)
+
+        # Then
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get(ETS_EGG))
+
+        # When
+        cache.clear()
+
+        # Then
+        self.assertEqual(len(cache), 0)
+
+    def test_strictness_is_part_of_the_key(self):
+        # Given
+        cache = EggMetadataCache(self.directory)
+        self.addCleanup(cache.close)
+        cache.from_egg(ETS_EGG, strict=True)
+
+        # When/Then
+        self.assertIsNone(cache.get(ETS_EGG, strict=False))
+        self.assertIsNotNone(cache.get(ETS_EGG, strict=True))
+
+    def test_pickling(self):
+        # Given
+        cache = EggMetadataCache(self.directory, max_entries=10)
+        self.addCleanup(cache.close)
+        cache.from_egg(ETS_EGG)
+
+        # When
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.addCleanup(unpickled.close)
+
+        # Then
+        self.assertEqual(unpickled.max_entries, 10)
+        self._assert_same_metadata(unpickled.get(ETS_EGG), ETS_EGG)
+
+    def test_scan_eggs(self):
+        # Given
+        eggs = [ENSTALLER_EGG, ETS_EGG, MKL_EGG]
+        cache = EggMetadataCache(self.directory)
+        self.addCleanup(cache.close)
+
+        # When
+        results = list(scan_eggs(eggs, workers=2, cache=cache))
+
+        # Then
+        self.assertEqual(len(cache), 3)
+        for egg, metadata in results:
+            self._assert_same_metadata(metadata, egg)
+
+    def test_scan_eggs_updates_recency(self):
+        # Given
+        eggs = [
+            self._copy(egg) for egg in (ENSTALLER_EGG, ETS_EGG, MKL_EGG)]
+        cache = EggMetadataCache(self.directory)
+        self.addCleanup(cache.close)
+        list(scan_eggs(eggs, workers=2, cache=cache))
+        r_last_used = self._last_used(cache)
+
+        # When
+        results = list(scan_eggs(eggs, workers=2, chunksize=2, cache=cache))
+
+        # Then
+        last_used = self._last_used(cache)
+        self.assertEqual(sorted(last_used), sorted(r_last_used))
+        for path in last_used:
+            self.assertGreater(last_used[path], r_last_used[path])
+        for egg, metadata in results:
+            self._assert_same_metadata(metadata, egg)
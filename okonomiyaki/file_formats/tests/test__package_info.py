@@ -1,14 +1,21 @@
+import glob
+import io
 import os.path
+import random
 import shutil
 import tempfile
+import zipfile
 import zipfile2
 import unittest
 from unittest import mock
 
+from .._blacklist import _data as blacklist_data
 from .._blacklist.pkg_info_data import PYSIDE_1_1_0_PKG_INFO
-from .._package_info import PKG_INFO_ENCODING, _PKG_INFO_LOCATION, PackageInfo
+from .._package_info import (
+    FIELDS, PKG_INFO_ENCODING, _PKG_INFO_LOCATION, PackageInfo,
+    _convert_if_needed, _parse, _parse_fast, _read_pkg_info_wheel)
 from .common import (
-    BROKEN_MCCABE_EGG, PIP_EGG, PKG_INFO_ENSTALLER_1_0_DESCRIPTION,
+    DATA_EGGS, DATA_WHLS, BROKEN_MCCABE_EGG, PIP_EGG, PKG_INFO_ENSTALLER_1_0_DESCRIPTION,
     PIP_PKG_INFO, PKG_INFO_ENSTALLER_1_0, PYMULTINEST_EGG, SUPERVISOR_EGG,
     UNICODE_DESCRIPTION_EGG, UNICODE_DESCRIPTION_TEXT, FAKE_PYSIDE_1_1_0_EGG,
     FAKE_PYSIDE_1_1_0_EGG_PKG_INFO, SETUPTOOLS_PKG_INFO_1_2,
@@ -238,7 +245,7 @@ class TestPackageInfo(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._package_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             pkg_info = PackageInfo.from_egg(egg)
@@ -252,7 +259,7 @@ class TestPackageInfo(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._package_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
             return_value=mock_sha256
         ):
             with zipfile2.ZipFile(egg) as zp:
@@ -271,13 +278,41 @@ class TestPackageInfo(unittest.TestCase):
 
         # When
         with mock.patch(
-            "okonomiyaki.file_formats._package_info.compute_sha256",
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
         ) as mocked_compute_sha256:
             pkg_info = PackageInfo.from_egg(egg)
 
         # Then
         self.assertFalse(mocked_compute_sha256.called)
 
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+        ) as mocked_compute_sha256:
+            with zipfile2.ZipFile(egg) as zp:
+                pkg_info = PackageInfo.from_egg(zp)
+
+        # Then
+        self.assertFalse(mocked_compute_sha256.called)
+
+    def test_blacklisted_egg_explicit_sha256(self):
+        # Given
+        egg = FAKE_PYSIDE_1_1_0_EGG
+        sha256 = ("5eff70cfb464c2d531e6f93f7601e8ef8255b3a1ab4"
+                  "dd533826cfdcd5b962b60")
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
+        ) as mocked_compute_sha256:
+            pkg_info = PackageInfo.from_egg(egg, sha256=sha256)
+
+        # Then
+        self.assertFalse(mocked_compute_sha256.called)
+        self.assertMultiLineEqual(
+            pkg_info.description, FAKE_PYSIDE_1_1_0_EGG_PKG_INFO
+        )
+
     def test_strictness(self):
         # Given
         egg = PYMULTINEST_EGG
@@ -350,7 +385,7 @@ class TestPackageInfo(unittest.TestCase):
             "5eff70cfb464c2d531e6f93f7601e8ef8255b3a1ab4dd533826cfdcd5b962b60")
 
         with mock.patch(
-                "okonomiyaki.file_formats._package_info.compute_sha256",
+                "okonomiyaki.file_formats._blacklist.checksum.compute_sha256",
                 return_value=mock_sha256):
             pkg_info = PackageInfo.from_egg(egg)
 
@@ -484,3 +519,257 @@ class TestPackageInfo(unittest.TestCase):
 
         self.assertEqual(pkg_info.description_content_type, r_description_content_type)
         self.assertEqual(pkg_info.provides_extra, r_provides_extra)
+
+
+class TestPackageInfoFields(unittest.TestCase):
+    def test_fields(self):
+        # Given
+        with zipfile2.ZipFile(SETUPTOOLS_75_8_0_WHL) as zp:
+            data = _read_pkg_info_wheel(zp)
+        full = PackageInfo.from_string(data.decode(PKG_INFO_ENCODING))
+        fields = ("summary", "requires_dist", "requires_python")
+
+        # When
+        pkg_info = PackageInfo.from_string(
+            data.decode(PKG_INFO_ENCODING), fields=fields)
+
+        # Then
+        self.assertEqual(pkg_info.metadata_version, "2.2")
+        self.assertEqual(pkg_info.name, "setuptools")
+        self.assertEqual(pkg_info.version, "75.8.0")
+        self.assertEqual(pkg_info.summary, full.summary)
+        self.assertEqual(pkg_info.requires_dist, full.requires_dist)
+        self.assertEqual(pkg_info.requires_python, ">=3.9")
+        self.assertEqual(pkg_info.classifiers, ())
+        self.assertEqual(pkg_info.description, "")
+        self.assertIsNotNone(pkg_info.description_offset)
+
+        # When
+        description = pkg_info.load_description(
+            data.decode(PKG_INFO_ENCODING))
+
+        # Then
+        self.assertEqual(description, full.description)
+        with self.assertRaises(ValueError):
+            pkg_info.load_description(data)
+
+    def test_fields_non_ascii_headers(self):
+        # Given
+        data = (
+            b"Metadata-Version: 2.1\nName: a\nVersion: 1.0\n"
+            b"Summary: caf\xe9\n\nthe body\n"
+        )
+        s = _convert_if_needed(data, None, strict=False)
+
+        # When
+        pkg_info = PackageInfo.from_string(s, fields=("summary",))
+
+        # Then
+        self.assertEqual(pkg_info.summary, u"caf\ufffd")
+        self.assertEqual(s[pkg_info.description_offset:], "the body\n")
+        self.assertEqual(pkg_info.load_description(s), "the body\n")
+        with self.assertRaises(ValueError):
+            pkg_info.load_description(data)
+        self.assertEqual(
+            pkg_info.load_description(s),
+            PackageInfo.from_string(s).description
+        )
+
+    def test_fields_with_description(self):
+        # Given
+        fields = ("description",)
+
+        # When
+        pkg_info = PackageInfo.from_path(SETUPTOOLS_75_8_0_WHL, fields=fields)
+
+        # Then
+        self.assertEqual(
+            pkg_info.description,
+            PackageInfo.from_path(SETUPTOOLS_75_8_0_WHL).description
+        )
+        self.assertIsNone(pkg_info.description_offset)
+        self.assertEqual(pkg_info.summary, "")
+
+    def test_fields_from_egg(self):
+        # Given
+        fields = ("summary",)
+
+        # When
+        pkg_info = PackageInfo.from_egg(PIP_EGG, fields=fields)
+
+        # Then
+        self.assertEqual(pkg_info.name, "pip")
+        self.assertEqual(
+            pkg_info.summary, PackageInfo.from_egg(PIP_EGG).summary)
+        self.assertEqual(pkg_info.description, "")
+        self.assertEqual(pkg_info.author, "")
+
+    def test_unknown_fields(self):
+        # When/Then
+        with self.assertRaises(ValueError):
+            PackageInfo.from_string(
+                SETUPTOOLS_PKG_INFO_2_1, fields=("summary", "not_a_field"))
+
+    def test_corpus(self):
+        # Given
+        fields = FIELDS - set(["description"])
+
+        for s in _metadata_corpus():
+            try:
+                full = PackageInfo.from_string(s)
+            except OkonomiyakiError:
+                continue
+
+            # When
+            pkg_info = PackageInfo.from_string(s, fields=fields)
+
+            # Then
+            self.assertEqual(pkg_info.description, "")
+            for attr_name in fields:
+                self.assertEqual(
+                    getattr(pkg_info, attr_name), getattr(full, attr_name),
+                    msg=attr_name
+                )
+            if pkg_info.description_offset is not None:
+                self.assertEqual(pkg_info.load_description(s), full.description)
+
+    def test_email_fallback(self):
+        # Given
+        s = (
+            "Metadata-Version: 2.1\nName: a\nVersion: 1.0\n"
+            "Content-Type: text/plain\n\nSome description\n"
+        )
+
+        # When
+        pkg_info = PackageInfo.from_string(s, fields=("summary",))
+
+        # Then
+        self.assertIsNone(pkg_info.description_offset)
+        self.assertEqual(
+            pkg_info.load_description(s), "Some description\n")
+
+
+def _metadata_corpus():
+    """ Every PKG-INFO/METADATA content of the test eggs and wheels, and of
+    the PKG-INFO blacklist.
+    """
+    paths = sorted(
+        glob.glob(os.path.join(DATA_EGGS, "**", "*.egg"), recursive=True)
+        + glob.glob(os.path.join(DATA_WHLS, "*.whl"))
+    )
+    for path in paths:
+        try:
+            with zipfile2.ZipFile(path) as zp:
+                for name in zp.namelist():
+                    if name.endswith(("/PKG-INFO", "/METADATA")):
+                        yield zp.read(name).decode("utf8", "replace")
+        except zipfile.BadZipFile:
+            continue
+    contents = blacklist_data._load_data()[blacklist_data.PKG_INFO_CONTENTS]
+    for content in contents.values():
+        yield content
+
+
+class TestParseFast(unittest.TestCase):
+    def assertSameAsEmail(self, s):
+        fast = _parse_fast(s)
+        self.assertIsNotNone(fast, msg=repr(s))
+        msg = _parse(io.StringIO(s))
+        names = set(name.lower() for name in msg.keys())
+        for name in names:
+            self.assertEqual(fast.get_all(name), msg.get_all(name), repr(s))
+            self.assertEqual(fast.get(name), msg.get(name), repr(s))
+            self.assertIn(name.upper(), fast)
+        self.assertEqual(set(fast._headers), names, repr(s))
+        self.assertEqual(fast.get_payload(), msg.get_payload(), repr(s))
+
+    def test_corpus(self):
+        # Given
+        corpus = list(_metadata_corpus())
+
+        for s in corpus:
+            # When/Then
+            self.assertSameAsEmail(s)
+
+            with mock.patch(
+                "okonomiyaki.file_formats._package_info._parse_fast",
+                return_value=None
+            ):
+                r_pkg_info = PackageInfo.from_string(s)
+            self.assertEqual(PackageInfo.from_string(s), r_pkg_info)
+
+    def test_edge_cases(self):
+        # Given
+        cases = [
+            "",
+            "\n",
+            "Name: a",
+            "Name: a\r\nVersion:  1.0\r\n\r\nbody\r\n",
+            "Name: a\rVersion: 1.0\r\rbody\r",
+            "Name: a\n  continued\n\tagain\n\nbody",
+            " leading continuation\nName: a\n",
+            "Name: a\nnot a header\nVersion: 1.0\n",
+            ":no name\n  continued\nName: a\n",
+            "Name:no space\nName:   second\n",
+            "Name: a\x0bb\x1cc\u2028d\n\nbody\x0b\n",
+            "Name: a\n\n\nbody with leading empty line\n",
+            "Description: a\n        |\n        b\n",
+            "Name: \u00e9t\u00e9\n\nbody \u00e9\n",
+        ]
+
+        for s in cases:
+            # When/Then
+            self.assertSameAsEmail(s)
+
+    def test_random(self):
+        # Given
+        fragments = [
+            "Name: a", "Name:b", " continued", "\tcontinued", ":no name",
+            "Version: 1.0", "not a header", "", "Summary: a\x0bb",
+            "Keywords:  x", "Bad name: x", "Z:   ", "Description: x",
+            "        y", "Name: \u00e9",
+        ]
+        separators = ["\n", "\r\n", "\r", ""]
+        rng = random.Random(0)
+
+        for _ in range(2000):
+            s = "".join(
+                rng.choice(fragments) + rng.choice(separators)
+                for _ in range(rng.randint(0, 8))
+            )
+
+            # When/Then
+            self.assertSameAsEmail(s)
+
+    def test_fallback(self):
+        # Given
+        cases = [
+            "From nobody\nName: a\nVersion: 1.0\n",
+            "Name: a\nVersion: 1.0\nContent-Type: multipart/mixed\n",
+        ]
+
+        for s in cases:
+            # When
+            msg = _parse_fast(s)
+
+            # Then
+            self.assertIsNone(msg)
+            self.assertEqual(PackageInfo.from_string(s).name, "a")
+
+        # When/Then
+        self.assertIsNone(_parse_fast("Name: a\nSummary: \udce9\n"))
+
+    def test_without_body(self):
+        # Given
+        s = "Name: a\nVersion: 1.0\nSummary: b\n\nSome \udce9 body\n"
+
+        # When
+        msg = _parse_fast(s, names=set(["name"]), with_body=False)
+
+        # Then
+        self.assertIsNone(_parse_fast(s))
+        self.assertEqual(msg.get_all("Name"), ["a"])
+        self.assertNotIn("Summary", msg)
+        self.assertEqual(msg.skipped, set(["version", "summary"]))
+        self.assertIsNone(msg.get_payload())
+        self.assertEqual(s[msg.body_offset:], "Some \udce9 body\n")
@@ -0,0 +1,107 @@
+import os.path
+import pickle
+import unittest
+
+from okonomiyaki.errors import (
+    InvalidMetadataField, MissingMetadata, OkonomiyakiError,
+    UnsupportedMetadata)
+from okonomiyaki.versions import MetadataVersion
+
+from .._egg_info import EggMetadata
+from .._scan import scan_eggs
+from .common import (
+    BROKEN_MCCABE_EGG, DATA_EGGS, ENSTALLER_EGG, ETS_EGG, MKL_EGG,
+    NUMEXPR_2_2_2_EGG, PIP_SETUPTOOLS_EGG, XZ_5_2_0_EGG)
+
+
+class TestScanEggs(unittest.TestCase):
+    def setUp(self):
+        self.eggs = [
+            ENSTALLER_EGG, ETS_EGG, MKL_EGG, NUMEXPR_2_2_2_EGG,
+            BROKEN_MCCABE_EGG,
+        ]
+
+    def _check_results(self, results):
+        for path, metadata in results:
+            self.assertIsInstance(metadata, EggMetadata)
+            self.assertEqual(metadata, EggMetadata.from_egg(path))
+            self.assertEqual(
+                metadata.to_json_dict(),
+                EggMetadata.from_egg(path).to_json_dict())
+
+    def test_in_process(self):
+        # When
+        results = list(scan_eggs(self.eggs, workers=1))
+
+        # Then
+        self.assertEqual([path for path, _ in results], self.eggs)
+        self._check_results(results)
+
+    def test_process_pool_ordered(self):
+        # When
+        results = list(scan_eggs(self.eggs, workers=2, chunksize=2))
+
+        # Then
+        self.assertEqual([path for path, _ in results], self.eggs)
+        self._check_results(results)
+
+    def test_process_pool_unordered(self):
+        # When
+        results = list(scan_eggs(self.eggs, workers=2, ordered=False))
+
+        # Then
+        self.assertCountEqual([path for path, _ in results], self.eggs)
+        self._check_results(results)
+
+    def test_errors_are_reported(self):
+        # Given
+        missing = os.path.join(DATA_EGGS, "dummy-1.0.0-1.egg")
+        paths = [
+            ETS_EGG, PIP_SETUPTOOLS_EGG, missing, XZ_5_2_0_EGG, ENSTALLER_EGG]
+
+        # When
+        results = dict(scan_eggs(paths, workers=2))
+
+        # Then
+        self.assertIsInstance(results[ETS_EGG], EggMetadata)
+        self.assertIsInstance(results[ENSTALLER_EGG], EggMetadata)
+        self.assertIsInstance(results[PIP_SETUPTOOLS_EGG], MissingMetadata)
+        self.assertIsInstance(results[missing], OSError)
+        # Unknown checksum, so the (invalid) platform is not fixed up
+        self.assertIsInstance(results[XZ_5_2_0_EGG], OkonomiyakiError)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            list(scan_eggs(self.eggs, workers=0))
+        with self.assertRaises(ValueError):
+            list(scan_eggs(self.eggs, chunksize=0))
+
+
+class TestErrorsPickling(unittest.TestCase):
+    def _roundtrip(self, e):
+        return pickle.loads(pickle.dumps(e))
+
+    def test_invalid_metadata_field(self):
+        # Given
+        e = InvalidMetadataField("python_tag", "dummy")
+        undefined = InvalidMetadataField(
+            "name", InvalidMetadataField.undefined)
+
+        # When/Then
+        self.assertEqual(str(self._roundtrip(e)), str(e))
+        self.assertEqual(self._roundtrip(e).name, "python_tag")
+        self.assertIs(
+            self._roundtrip(undefined).value, InvalidMetadataField.undefined)
+        self.assertEqual(str(self._roundtrip(undefined)), str(undefined))
+
+    def test_unsupported_metadata(self):
+        # Given
+        metadata_version = MetadataVersion.from_string("2.0")
+        e = UnsupportedMetadata(metadata_version)
+
+        # When
+        unpickled = self._roundtrip(e)
+
+        # Then
+        self.assertEqual(unpickled.metadata_version, metadata_version)
+        self.assertEqual(str(unpickled), str(e))
@@ -5,12 +5,16 @@ import stat
 import sys
 import tempfile
 import textwrap
+import threading
 import unittest
+import zipfile
 import zipfile2
 import os.path as op
+from unittest import mock
 
 from okonomiyaki.platforms import EPDPlatform
 from okonomiyaki.utils import compute_md5
+from okonomiyaki.utils._zip import _deflate_file
 from okonomiyaki.versions import EnpkgVersion
 from ..egg import EggBuilder, EggRewriter
 from .._egg_info import Dependencies, EggMetadata, LegacySpecDepend
@@ -161,6 +165,123 @@ packages = []
         with zipfile2.ZipFile(egg_path, "r") as fp:
             self.assertEqual(set(fp.namelist()), set(r_files))
 
+    def _create_tree(self, tree):
+        for i in range(20):
+            path = os.path.join(tree, "lib{0}".format(i % 3), "f{0}".format(i))
+            if not os.path.exists(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as fp:
+                fp.write(os.urandom(i * 1000) + b"a" * (i * 10000))
+        os.makedirs(os.path.join(tree, "empty"))
+        with open(os.path.join(tree, "empty_file"), "wb"):
+            pass
+        if sys.platform != "win32":
+            os.symlink("f1", os.path.join(tree, "lib1", "link"))
+
+    def test_add_tree_workers(self):
+        # Given
+        tree = os.path.join(self.d, "usr")
+        self._create_tree(tree)
+        metadata = self._create_fake_metadata()
+
+        def build(workers):
+            cwd = os.path.join(self.d, "workers_{0}".format(workers))
+            os.makedirs(cwd)
+            with EggBuilder(metadata, cwd=cwd) as fp:
+                fp.add_tree(tree, "EGG-INFO/usr", workers=workers)
+            return fp.path
+
+        # When
+        with mock.patch("time.time", return_value=1500000000.0):
+            paths = [build(workers) for workers in (None, 1, 4)]
+
+        # Then
+        with open(paths[0], "rb") as fp:
+            r_content = fp.read()
+        for path in paths[1:]:
+            with open(path, "rb") as fp:
+                self.assertEqual(fp.read(), r_content)
+
+        with zipfile2.ZipFile(paths[-1]) as fp:
+            self.assertIsNone(fp.testzip())
+            data = fp.read("EGG-INFO/usr/lib1/f10")
+        with open(os.path.join(tree, "lib1", "f10"), "rb") as fp:
+            self.assertEqual(data, fp.read())
+
+    def test_add_tree_workers_without_raw_members(self):
+        # Given
+        tree = os.path.join(self.d, "usr")
+        self._create_tree(tree)
+        metadata = self._create_fake_metadata()
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats.egg._supports_raw_members",
+            return_value=False
+        ):
+            with mock.patch(
+                "okonomiyaki.file_formats.egg._deflate_file",
+                side_effect=AssertionError("unexpected raw member")
+            ):
+                with EggBuilder(metadata, cwd=self.d) as fp:
+                    fp.add_tree(tree, "EGG-INFO/usr", workers=2)
+
+        # Then
+        with zipfile2.ZipFile(fp.path) as zp:
+            self.assertIsNone(zp.testzip())
+            data = zp.read("EGG-INFO/usr/lib1/f10")
+        with open(os.path.join(tree, "lib1", "f10"), "rb") as f:
+            self.assertEqual(data, f.read())
+
+    def test_add_tree_workers_error(self):
+        # Given
+        tree = os.path.join(self.d, "usr")
+        self._create_tree(tree)
+        metadata = self._create_fake_metadata()
+        compressed = []
+        done = threading.Semaphore(0)
+
+        def deflate_file(*a, **kw):
+            result = _deflate_file(*a, **kw)
+            compressed.append(result[1])
+            done.release()
+            return result
+
+        def iter_tree():
+            for i in range(4):
+                name = "f{0}".format(i)
+                yield os.path.join(tree, "lib{0}".format(i % 3), name), name
+            # Fail once every file is compressed, but none written
+            for i in range(4):
+                done.acquire(timeout=10)
+            raise RuntimeError("interrupted")
+
+        # When
+        with mock.patch(
+            "okonomiyaki.file_formats.egg._deflate_file",
+            side_effect=deflate_file
+        ):
+            with EggBuilder(metadata, cwd=self.d) as fp:
+                with self.assertRaises(RuntimeError):
+                    fp._add_concurrently(iter_tree(), 4)
+
+        # Then
+        self.assertEqual(len(compressed), 4)
+        for data in compressed:
+            self.assertTrue(data.closed)
+
+    def test_add_tree_workers_duplicate(self):
+        # Given
+        tree = os.path.join(self.d, "usr")
+        self._create_tree(tree)
+        metadata = self._create_fake_metadata()
+
+        # When/Then
+        with EggBuilder(metadata, cwd=self.d) as fp:
+            fp.add_tree(tree, "EGG-INFO/usr", workers=2)
+            with self.assertRaises(ValueError):
+                fp.add_tree(tree, "EGG-INFO/usr", workers=2)
+
     def test_add_file(self):
         # Given
         r_files = [
@@ -321,6 +442,8 @@ packages = []
 
 
 class TestEggRewriter(unittest.TestCase):
+    streaming = False
+
     def setUp(self):
         self.prefix = tempfile.mkdtemp()
 
@@ -370,6 +493,9 @@ class TestEggRewriter(unittest.TestCase):
             packages = []
             """)
 
+    def _rewriter(self, *a, **kw):
+        return EggRewriter(*a, streaming=self.streaming, **kw)
+
     def _create_metadata(self, spec_depend_string):
         spec_depend = LegacySpecDepend.from_string(spec_depend_string)
         pkg_info = None
@@ -404,7 +530,7 @@ class TestEggRewriter(unittest.TestCase):
         metadata = self._create_metadata(r_spec_depend)
 
         # When
-        with EggRewriter(metadata, egg, cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, cwd=self.prefix) as rewriter:
             pass
 
         # Then
@@ -432,12 +558,12 @@ class TestEggRewriter(unittest.TestCase):
 
         # When/Then
         with self.assertRaises(ValueError):
-            with EggRewriter(metadata, egg, cwd=self.prefix) as rewriter:
+            with self._rewriter(metadata, egg, cwd=self.prefix) as rewriter:
                 rewriter.add_file_as(__file__, "EGG-INFO/pbr.json")
 
         # When
-        with EggRewriter(metadata, egg, cwd=self.prefix,
-                         allow_overwrite=True) as rewriter:
+        with self._rewriter(metadata, egg, cwd=self.prefix,
+                            allow_overwrite=True) as rewriter:
             rewriter.add_file_as(__file__, "EGG-INFO/pbr.json")
 
         # Then
@@ -462,8 +588,8 @@ class TestEggRewriter(unittest.TestCase):
             return path != "EGG-INFO/pbr.json"
 
         # When
-        with EggRewriter(metadata, egg, accept=accept,
-                         cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, accept=accept,
+                            cwd=self.prefix) as rewriter:
             pass
 
         # Then
@@ -481,8 +607,8 @@ class TestEggRewriter(unittest.TestCase):
             return path != "EGG-INFO/pbr.json"
 
         # When
-        with EggRewriter(metadata, egg, accept=accept,
-                         cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, accept=accept,
+                            cwd=self.prefix) as rewriter:
             pass
 
         # Then
@@ -503,8 +629,8 @@ class TestEggRewriter(unittest.TestCase):
                 return arcname
 
         # When
-        with EggRewriter(metadata, egg, rename=rename,
-                         cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, rename=rename,
+                            cwd=self.prefix) as rewriter:
             pass
 
         # Then
@@ -540,8 +666,8 @@ class TestEggRewriter(unittest.TestCase):
                 return True
 
         # When
-        with EggRewriter(metadata, egg, rename=rename, accept=accept,
-                         cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, rename=rename, accept=accept,
+                            cwd=self.prefix) as rewriter:
             pass
 
         # Then
@@ -563,11 +689,100 @@ class TestEggRewriter(unittest.TestCase):
                 return True
 
         # When
-        with EggRewriter(metadata, egg, rename=rename, accept=accept,
-                         cwd=self.prefix) as rewriter:
+        with self._rewriter(metadata, egg, rename=rename, accept=accept,
+                            cwd=self.prefix) as rewriter:
             pass
 
         # Then
         with zipfile2.ZipFile(rewriter.path) as fp:
             self.assertFalse("EGG-INFO/pbr.json" in fp._filenames_set)
             self.assertTrue("EGG-INFO/pbr.json.bak" in fp._filenames_set)
+
+
+class TestEggRewriterStreaming(TestEggRewriter):
+    streaming = True
+
+    def test_no_temporary_directory(self):
+        # Given
+        egg = TRAITS_SETUPTOOLS_EGG
+        metadata = self._create_metadata(self._spec_depend_string())
+
+        # When
+        with mock.patch(
+                "okonomiyaki.file_formats.egg.tempfile.mkdtemp",
+                side_effect=AssertionError("unexpected temporary directory")):
+            with self._rewriter(metadata, egg, cwd=self.prefix) as rewriter:
+                pass
+
+        # Then
+        with zipfile2.ZipFile(egg) as source:
+            for arcname in source.namelist():
+                self.assertSameArchive(egg, rewriter.path, arcname)
+
+    def test_raw_copy(self):
+        # Given
+        egg = TRAITS_SETUPTOOLS_EGG
+        metadata = self._create_metadata(self._spec_depend_string())
+
+        # When
+        with self._rewriter(metadata, egg, cwd=self.prefix) as rewriter:
+            pass
+
+        # Then
+        with zipfile2.ZipFile(egg) as source:
+            with zipfile2.ZipFile(rewriter.path) as target:
+                self.assertIsNone(target.testzip())
+                for source_info in source.infolist():
+                    target_info = target.getinfo(source_info.filename)
+                    self.assertEqual(
+                        target_info.date_time, source_info.date_time)
+                    self.assertEqual(
+                        target_info.external_attr, source_info.external_attr)
+                    self.assertEqual(target_info.CRC, source_info.CRC)
+                    if source_info.compress_type == zipfile.ZIP_DEFLATED:
+                        # Copied as is, not recompressed
+                        self.assertEqual(
+                            target_info.compress_size,
+                            source_info.compress_size)
+
+    def test_no_compression(self):
+        # Given
+        egg = TRAITS_SETUPTOOLS_EGG
+        metadata = self._create_metadata(self._spec_depend_string())
+
+        # When
+        with self._rewriter(metadata, egg, compress=False,
+                            cwd=self.prefix) as rewriter:
+            pass
+
+        # Then
+        with zipfile2.ZipFile(rewriter.path) as target:
+            self.assertIsNone(target.testzip())
+            for target_info in target.infolist():
+                self.assertEqual(
+                    target_info.compress_type, zipfile.ZIP_STORED)
+        with zipfile2.ZipFile(egg) as source:
+            for arcname in source.namelist():
+                self.assertSameArchive(egg, rewriter.path, arcname)
+
+    def test_symlink(self):
+        # Given
+        path = TRAITS_SETUPTOOLS_EGG
+        egg = os.path.join(self.prefix, "source", os.path.basename(path))
+        os.makedirs(os.path.dirname(egg))
+        shutil.copy(path, egg)
+
+        with zipfile2.ZipFile(egg, "a") as zp:
+            zinfo = zipfile.ZipInfo("EGG-INFO/link.txt")
+            zinfo.create_system = 3
+            zinfo.external_attr = ZIP_SOFTLINK_ATTRIBUTE_MAGIC
+            zp.writestr(zinfo, b"top_level.txt")
+
+        metadata = self._create_metadata(self._spec_depend_string())
+
+        # When
+        with self._rewriter(metadata, egg, cwd=self.prefix) as rewriter:
+            pass
+
+        # Then
+        self.assertSameArchive(egg, rewriter.path, "EGG-INFO/link.txt")
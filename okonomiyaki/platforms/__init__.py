@@ -1,13 +1,38 @@
-# flake8: noqa
-from .abi import PlatformABI, default_abi
-from .epd_platform import EPDPlatform, applies
-from ._platform import Platform, OSKind, FamilyKind, NameKind
-from ._arch import X86, X86_64, ARM64, Arch
-from .pep425 import compute_abi_tag, compute_python_tag, compute_platform_tag
-from .python_implementation import PythonABI, PythonImplementation
+from okonomiyaki.utils._lazy import lazy_exports
+
+# Public names are imported on first access, see okonomiyaki.utils._lazy
+_EXPORTS = {
+    "PlatformABI": ".abi",
+    "default_abi": ".abi",
+    "EPDPlatform": ".epd_platform",
+    "applies": ".epd_platform",
+    "Platform": "._platform",
+    "OSKind": "._platform",
+    "FamilyKind": "._platform",
+    "NameKind": "._platform",
+    "X86": "._arch",
+    "X86_64": "._arch",
+    "ARM64": "._arch",
+    "Arch": "._arch",
+    "compute_abi_tag": ".pep425",
+    "compute_python_tag": ".pep425",
+    "compute_platform_tag": ".pep425",
+    "compute_pep425_tags": ".pep425",
+    "PEP425Tags": ".pep425",
+    "PEP425TagsCache": "._pep425_cache",
+    "HostSnapshot": "._host",
+    "clear_host_snapshot": "._host",
+    "host_snapshot": "._host",
+    "PythonABI": ".python_implementation",
+    "PythonImplementation": ".python_implementation",
+    "TagIndex": ".tags",
+    "supported_tags": ".tags",
+}
 
 
 __all__ = [
     'X86', 'X86_64', 'ARM64', 'EPDPlatform', 'Platform', 'PythonImplementation',
-    'default_abi','Arch'
+    'default_abi', 'Arch'
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -72,6 +72,10 @@ _NORMALIZED_NAMES = {}
 _NORMALIZED_NAMES.update(_64BIT_NAMES)
 _NORMALIZED_NAMES.update(_32BIT_NAMES)
 
+# Architecture of the running system, detected once per process. See
+# okonomiyaki.platforms._host
+_RUNNING_SYSTEM_ARCH = None
+
 
 @attributes(frozen=True)
 class Arch(object):
@@ -114,10 +118,13 @@ class Arch(object):
 
     @classmethod
     def from_running_system(cls):
-        if platform.system() == 'Darwin' and 'RELEASE_ARM64' in platform.uname().version:
-            return Arch.from_name('arm64')
-        else:
-            return Arch.from_name(platform.machine())
+        """ The architecture of the running system. It is only detected once
+        per process, see okonomiyaki.platforms.clear_host_snapshot.
+        """
+        global _RUNNING_SYSTEM_ARCH
+        if _RUNNING_SYSTEM_ARCH is None:
+            _RUNNING_SYSTEM_ARCH = _detect_running_system_arch()
+        return _RUNNING_SYSTEM_ARCH
 
     @property
     def bits(self):
@@ -153,3 +160,10 @@ X86 = Arch(ArchitectureKind.x86)
 X86_64 = Arch(ArchitectureKind.x86_64)
 ARM = Arch(ArchitectureKind.arm)
 ARM64 = Arch(ArchitectureKind.arm64)
+
+
+def _detect_running_system_arch():
+    if platform.system() == 'Darwin' and 'RELEASE_ARM64' in platform.uname().version:
+        return Arch.from_name('arm64')
+    else:
+        return Arch.from_name(platform.machine())
@@ -0,0 +1,149 @@
+import json
+import os
+import os.path
+import platform
+import sys
+import tempfile
+
+from attr import attr, attributes
+from attr.validators import instance_of
+
+from okonomiyaki.errors import OkonomiyakiError
+from . import _arch, _platform
+from ._arch import Arch
+from ._platform import FamilyKind, NameKind, OSKind
+
+
+_BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+
+@attributes(frozen=True)
+class HostSnapshot(object):
+    """ The details of the running system, as used by the from_running_system
+    constructors of Arch, Platform and EPDPlatform.
+    """
+    machine = attr(validator=instance_of(Arch))
+    os_kind = attr(validator=instance_of(OSKind))
+    family_kind = attr(validator=instance_of(FamilyKind))
+    name_kind = attr(validator=instance_of(NameKind))
+    release = attr(validator=instance_of(str))
+
+    @classmethod
+    def from_json_dict(cls, data):
+        return cls(
+            Arch.from_name(data["machine"]), OSKind[data["os_kind"]],
+            FamilyKind[data["family_kind"]], NameKind[data["name_kind"]],
+            data["release"],
+        )
+
+    def to_json_dict(self):
+        return {
+            "machine": self.machine.name,
+            "os_kind": self.os_kind.name,
+            "family_kind": self.family_kind.name,
+            "name_kind": self.name_kind.name,
+            "release": self.release,
+        }
+
+
+def host_snapshot(cache_path=None):
+    """ Returns the HostSnapshot of the running system.
+
+    The running system is only probed once per process, until
+    clear_host_snapshot is called.
+
+    Parameters
+    ----------
+    cache_path: str or None
+        If given, a json file in which the snapshot is persisted between
+        processes. The file is only trusted for the current boot of the
+        current kernel, and rewritten otherwise, even when the running
+        system was already probed in this process.
+    """
+    if cache_path is None:
+        return _probe_snapshot()
+
+    cached = _read_snapshot(cache_path)
+    if cached is None:
+        snapshot = _probe_snapshot()
+        _write_snapshot(cache_path, snapshot)
+        return snapshot
+    if not _is_probed():
+        _set_snapshot(cached)
+        return cached
+    return _probe_snapshot()
+
+
+def clear_host_snapshot():
+    """ Forget the snapshot of the running system, so that it is probed again
+    on next use. Persisted snapshots are left untouched.
+    """
+    _arch._RUNNING_SYSTEM_ARCH = None
+    _platform._HOST_DETAILS = None
+
+
+def _is_probed():
+    return (
+        _arch._RUNNING_SYSTEM_ARCH is not None
+        and _platform._HOST_DETAILS is not None
+    )
+
+
+def _probe_snapshot():
+    machine = Arch.from_running_system()
+    os_kind, family_kind, name_kind, release = _platform._host_details()
+    return HostSnapshot(machine, os_kind, family_kind, name_kind, release)
+
+
+def _set_snapshot(snapshot):
+    _arch._RUNNING_SYSTEM_ARCH = snapshot.machine
+    _platform._HOST_DETAILS = (
+        snapshot.os_kind, snapshot.family_kind, snapshot.name_kind,
+        snapshot.release,
+    )
+
+
+def _boot_key():
+    """ Returns a value which changes when the host reboots, or when its
+    kernel or OS is updated.
+    """
+    try:
+        with open(_BOOT_ID_PATH) as fp:
+            boot_id = fp.read().strip()
+    except OSError:
+        # Not available outside of linux
+        boot_id = ""
+    uname = platform.uname()
+    return [sys.platform, uname.system, uname.release, uname.version, boot_id]
+
+
+def _read_snapshot(path):
+    try:
+        with open(path) as fp:
+            data = json.load(fp)
+        if data["boot_key"] != _boot_key():
+            return None
+        return HostSnapshot.from_json_dict(data["snapshot"])
+    except (OkonomiyakiError, OSError, ValueError, KeyError, TypeError):
+        # Missing, corrupted or incompatible cache: probe again
+        return None
+
+
+def _write_snapshot(path, snapshot):
+    data = {"boot_key": _boot_key(), "snapshot": snapshot.to_json_dict()}
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename, so that concurrent processes never read a
+        # partial file
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fp:
+                json.dump(data, fp)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        # The cache is an optimization only
+        pass
@@ -0,0 +1,72 @@
+from okonomiyaki.utils._sqlite import SqliteCache
+
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS pep425_tags (
+    executable TEXT NOT NULL PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    python_tag TEXT NOT NULL,
+    abi_tag TEXT NOT NULL,
+    platform_tag TEXT NOT NULL
+)"""
+
+
+class PEP425TagsCache(SqliteCache):
+    """ A persistent, sqlite-backed cache of the PEP425 tags of python
+    executables.
+
+    Entries are keyed on the real path of the executable, and invalidated
+    when its size or modification time change.
+
+    Example::
+
+        with PEP425TagsCache(cache_directory) as cache:
+            tags = compute_pep425_tags(executable, cache=cache)
+
+    Parameters
+    ----------
+    directory: str
+        The directory holding the cache database. It is created if it does
+        not exist.
+    """
+    _DATABASE_NAME = "pep425_tags.sqlite"
+    _SCHEMA_VERSION = 1
+    _TABLE = "pep425_tags"
+    _SCHEMA = (_CREATE_TABLE,)
+
+    # Public methods
+    def get(self, executable, size, mtime_ns):
+        """ Return the cached (python_tag, abi_tag, platform_tag) tuple of
+        the given executable, or None if it is not in the cache, or has
+        changed since it was cached.
+
+        Parameters
+        ----------
+        executable: str
+            The real path of the executable.
+        size: int
+            The size of the executable.
+        mtime_ns: int
+            The modification time of the executable, in nanoseconds.
+        """
+        row = self._execute(
+            "SELECT size, mtime_ns, python_tag, abi_tag, platform_tag "
+            "FROM pep425_tags WHERE executable = ?", (executable,)
+        ).fetchone()
+        if row is None or tuple(row[:2]) != (size, mtime_ns):
+            return None
+        return tuple(row[2:])
+
+    def add(self, executable, size, mtime_ns, tags):
+        """ Record the (python_tag, abi_tag, platform_tag) tuple of the
+        given executable.
+        """
+        python_tag, abi_tag, platform_tag = tags
+        self._execute(
+            "INSERT OR REPLACE INTO pep425_tags "
+            "(executable, size, mtime_ns, python_tag, abi_tag, platform_tag) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (executable, size, mtime_ns, python_tag, abi_tag, platform_tag)
+        )
+        self._commit()
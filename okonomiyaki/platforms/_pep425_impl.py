@@ -4,6 +4,7 @@ from __future__ import absolute_import, print_function
 import sys
 import sysconfig
 import subprocess
+import warnings
 
 
 def get_config_var(var):
@@ -103,7 +104,10 @@ def _is_running_32bit():
 def get_platform():
     """Return our platform name 'win32', 'linux_x86_64'"""
     try:
-        import distutils.util
+        with warnings.catch_warnings():
+            # distutils is deprecated in python >= 3.10
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import distutils.util
     except ImportError:
         import sysconfig
         result = sysconfig.get_platform().replace(".", "_").replace("-", "_")
@@ -126,9 +130,15 @@ if __name__ == "__main__":
     p.add_argument("--python-tag", action="store_true")
     p.add_argument("--abi-tag", action="store_true")
     p.add_argument("--platform-tag", action="store_true")
+    p.add_argument("--all-tags", action="store_true")
     ns = p.parse_args()
 
-    if ns.abi_tag:
+    if ns.all_tags:
+        # One tag per line: python, abi and platform
+        print(get_impl_tag())
+        print(get_abi_tag())
+        print(get_platform())
+    elif ns.abi_tag:
         print(get_abi_tag())
     elif ns.python_tag:
         print(get_impl_tag())
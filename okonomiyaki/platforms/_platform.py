@@ -11,6 +11,11 @@ from okonomiyaki.versions import SemanticVersion
 from ._arch import Arch, X86, ARM
 
 
+# (os_kind, family_kind, name_kind, release) of the running system, detected
+# once per process. See okonomiyaki.platforms._host
+_HOST_DETAILS = None
+
+
 @enum.unique
 class OSKind(enum.Enum):
     darwin = 'Darwin'
@@ -224,11 +229,22 @@ def _guess_platform(arch):
     machine = Arch.from_running_system()
     if (machine == X86 and arch.bits == 64) or (machine == ARM and arch.bits == 64):
         raise OkonomiyakiError("Incompatible 32bit machine with a 64bit architecture")
-    os_kind = _guess_os_kind()
-    family_kind, name_kind, release = _guess_platform_details(os_kind)
+    os_kind, family_kind, name_kind, release = _host_details()
     return Platform(os_kind, name_kind, family_kind, release, arch, machine)
 
 
+def _host_details():
+    """ Returns the (os_kind, family_kind, name_kind, release) of the
+    running system, only guessing them on the first call.
+    """
+    global _HOST_DETAILS
+    if _HOST_DETAILS is None:
+        os_kind = _guess_os_kind()
+        family_kind, name_kind, release = _guess_platform_details(os_kind)
+        _HOST_DETAILS = (os_kind, family_kind, name_kind, release)
+    return _HOST_DETAILS
+
+
 def _linux_distribution():
     """ Get the linux distribution of the running system.
 
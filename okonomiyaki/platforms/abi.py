@@ -78,7 +78,7 @@ def default_abi(platform, implementation, implementation_version):
         implementation_version = RuntimeVersion.from_string(
             implementation_version)
     if isinstance(platform, str):
-        epd_platform = EPDPlatform.from_epd_string(
+        epd_platform = EPDPlatform.from_string(
             platform, implementation_version)
         platform = epd_platform.platform
 
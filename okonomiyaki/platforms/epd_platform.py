@@ -1,3 +1,4 @@
+import functools
 import re
 import warnings
 from collections import defaultdict
@@ -94,6 +95,10 @@ _WINDOWS_TAG_R = re.compile(r"^win_*(?P<arch>\S+)$")
 
 _ANY_PLATFORM_STRING = 'any'
 
+# Maximum number of (class, string, runtime version) entries kept by
+# EPDPlatform.from_string. Only a few dozens are seen in practice.
+_FROM_STRING_CACHE_SIZE = 1024
+
 
 def platform_validator():
     def wrapper(inst, attr, value):
@@ -111,7 +116,7 @@ class EPDPlatform(object):
 
     Example::
 
-        epd_platform = EPDPlatform.from_epd_string("rh5-32")
+        epd_platform = EPDPlatform.from_string("rh5-32")
         assert epd.name == "rh5"
         assert epd.arch_bits == "32"
         assert epd.arch == "x86"
@@ -156,6 +161,10 @@ class EPDPlatform(object):
     def from_string(cls, s, runtime_version=None):
         """ Create a new instance from an epd platform string.
 
+        Instances are immutable, and cached: calling this method several times
+        with the same arguments returns the same instance. See cache_info and
+        cache_clear.
+
         Parameters:
         s : string
            The platform string e.g. win-32. New, more explicit
@@ -166,6 +175,22 @@ class EPDPlatform(object):
            description taking into account the historical records of the
            Enthought python runtime releases.
         """
+        return _epd_platform_from_string(cls, s, runtime_version)
+
+    @staticmethod
+    def cache_info():
+        """ Statistics of the from_string cache, as a named tuple
+        (hits, misses, maxsize, currsize).
+        """
+        return _epd_platform_from_string.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        """ Empty the from_string cache, and reset its statistics."""
+        _epd_platform_from_string.cache_clear()
+
+    @classmethod
+    def _from_string(cls, s, runtime_version=None):
         m = _EPD_PLATFORM_STRING_RE.match(s)
         if m is None:
             raise OkonomiyakiError("Invalid epd string: {0}".format(s))
@@ -285,7 +310,7 @@ class EPDPlatform(object):
                 raise NotImplementedError(
                     "Unsupported platform '{0}'".format(platform_tag))
 
-            return cls.from_epd_string(epd_string)
+            return cls.from_string(epd_string)
 
     @property
     def arch(self):
@@ -417,7 +442,7 @@ def applies(platform_string, to='current'):
             to_platform = full.platform_name
             to_arch = full.arch
         elif '-' in to:
-            full = EPDPlatform.from_epd_string(to)
+            full = EPDPlatform.from_string(to)
             to_platform = full.platform_name
             to_arch = full.arch
         else:
@@ -456,6 +481,11 @@ def applies(platform_string, to='current'):
         return any(conditions)
 
 
+@functools.lru_cache(maxsize=_FROM_STRING_CACHE_SIZE)
+def _epd_platform_from_string(cls, s, runtime_version):
+    return cls._from_string(s, runtime_version)
+
+
 def _epd_name_and_python_to_quadruplet(name, runtime_version=None, arch=None):
     py38 = RuntimeVersion.from_string('3.8')
     py311 = RuntimeVersion.from_string('3.11')
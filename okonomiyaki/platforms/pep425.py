@@ -1,4 +1,6 @@
+import collections
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -8,41 +10,119 @@ from okonomiyaki.utils import decode_if_needed
 from ._pep425_impl import _PEP425_IMPL
 
 
+PEP425Tags = collections.namedtuple(
+    "PEP425Tags", ("python_tag", "abi_tag", "platform_tag")
+)
+
+# (real path) -> (size, mtime_ns, PEP425Tags) mapping of the executables
+# already probed by this process
+_TAGS_MEMO = {}
+
+
 def _run_pep425(executable, flag):
     with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as handle:
         handle.write(_PEP425_IMPL)
+    # Use the standard library distutils: the setuptools one is much slower
+    # to import, and gives the same platform
+    env = dict(os.environ, SETUPTOOLS_USE_DISTUTILS="stdlib")
     try:
-        out = subprocess.check_output([executable, handle.name, flag]).strip()
+        out = subprocess.check_output(
+            [executable, handle.name, flag], env=env).strip()
     finally:
         os.remove(handle.name)
     return decode_if_needed(out)
 
 
-def compute_abi_tag(python_executable=None):
-    """ Compute the PEP425 abi tag for the given python executable.
+def _executable_key(executable):
+    """ Returns the (real path, size, mtime_ns) of the given executable, or
+    None if it cannot be found.
+    """
+    path = shutil.which(executable)
+    if path is None:
+        return None
+    path = os.path.realpath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_size, st.st_mtime_ns
 
-    This will launch a subprocess.
+
+def compute_pep425_tags(python_executable=None, cache=None):
+    """ Compute the PEP425 python, abi and platform tags for the given
+    python executable.
+
+    This launches at most one subprocess. The tags are memoized for the
+    lifetime of the process, keyed on the real path, size and modification
+    time of the executable. The executable itself is run as given, so that
+    wrapper scripts and symlinked interpreters keep their behaviour.
+
+    Parameters
+    ----------
+    python_executable: str or None
+        The python executable. Defaults to the current interpreter.
+    cache: PEP425TagsCache or None
+        If given, the tags are also looked up in, and stored into, this
+        on-disk cache.
+
+    Returns
+    -------
+    tags: PEP425Tags
+        A (python_tag, abi_tag, platform_tag) named tuple.
     """
     if python_executable is None:
         python_executable = sys.executable
-    return _run_pep425(python_executable, "--abi-tag")
+
+    key = _executable_key(python_executable)
+    if key is None:
+        # Let the subprocess report the missing executable
+        return _probe_pep425_tags(python_executable)
+
+    path, size, mtime_ns = key
+    memoized = _TAGS_MEMO.get(path)
+    if memoized is not None and memoized[:2] == (size, mtime_ns):
+        return memoized[2]
+
+    tags = None
+    if cache is not None:
+        cached = cache.get(path, size, mtime_ns)
+        if cached is not None:
+            tags = PEP425Tags(*cached)
+    if tags is None:
+        tags = _probe_pep425_tags(python_executable)
+        if cache is not None:
+            cache.add(path, size, mtime_ns, tags)
+
+    _TAGS_MEMO[path] = (size, mtime_ns, tags)
+    return tags
+
+
+def _probe_pep425_tags(executable):
+    return PEP425Tags(*_run_pep425(executable, "--all-tags").split())
+
+
+def compute_abi_tag(python_executable=None):
+    """ Compute the PEP425 abi tag for the given python executable.
+
+    This will launch a subprocess, unless the tags of this executable were
+    already computed, see compute_pep425_tags.
+    """
+    return compute_pep425_tags(python_executable).abi_tag
 
 
 def compute_python_tag(python_executable=None):
     """ Compute the PEP425 python tag for the given python executable.
 
-    This will launch a subprocess.
+    This will launch a subprocess, unless the tags of this executable were
+    already computed, see compute_pep425_tags.
     """
-    if python_executable is None:
-        python_executable = sys.executable
-    return _run_pep425(python_executable, "--python-tag")
+    return compute_pep425_tags(python_executable).python_tag
 
 
 def compute_platform_tag(python_executable=None):
     """ Compute the PEP425 platform tag for the given python executable.
 
-    This will launch a subprocess.
+    This will launch a subprocess, unless the tags of this executable were
+    already computed, see compute_pep425_tags.
     """
-    if python_executable is None:
-        python_executable = sys.executable
-    return _run_pep425(python_executable, "--platform-tag")
+    return compute_pep425_tags(python_executable).platform_tag
@@ -1,3 +1,6 @@
+import functools
+import operator
+
 from attr import attr, attributes
 from attr.validators import instance_of, optional
 
@@ -8,6 +11,14 @@ from .epd_platform import EPDPlatform
 from ._platform import OSKind, FamilyKind, NameKind
 
 
+# Maximum number of legacy strings kept by
+# CompiledPlatformFilter.from_legacy_string
+_COMPILED_CACHE_SIZE = 1024
+
+# Maximum number of platforms whose result is memoized by a compiled filter
+_MAX_MEMOIZED_PLATFORMS = 256
+
+
 @attributes
 class PlatformLabel(object):
     """
@@ -49,7 +60,7 @@ class PlatformLabel(object):
             if name == "rh":
                 return (OSKind.linux, NameKind.rhel, FamilyKind.rhel, "")
             else:
-                platform = EPDPlatform.from_epd_string(name + "-32").platform
+                platform = EPDPlatform.from_string(name + "-32").platform
                 return (
                     platform.os_kind, platform.name_kind, platform.family_kind,
                     platform.release
@@ -123,6 +134,13 @@ class PlatformFilter(object):
 
         return cls(literals)
 
+    def compile(self):
+        """ Returns a CompiledPlatformFilter equivalent to this filter.
+        Later changes to this filter are not reflected in the compiled
+        filter.
+        """
+        return CompiledPlatformFilter(self)
+
     def matches(self, platform):
         for platform_label in self.platform_labels:
             if (
@@ -134,3 +152,120 @@ class PlatformFilter(object):
                 return False
 
         return True
+
+    def matches_many(self, platforms):
+        """ Returns the list of matches() results for the given platforms.
+
+        The compiled filter, and its memoized results, are cached on this
+        filter, and rebuilt when its labels change.
+        """
+        key = _literals_key(self.platform_labels)
+        compiled = getattr(self, "_compiled", None)
+        if compiled is None or compiled[0] != key:
+            compiled = (key, self.compile())
+            self._compiled = compiled
+        return compiled[1].matches_many(platforms)
+
+
+class CompiledPlatformFilter(object):
+    """ A PlatformFilter compiled for repeated evaluation.
+
+    Each label is flattened into a single comparison, and the result for a
+    given platform is memoized, so that evaluating the same filters over
+    the same platforms, e.g. a package x platform grid, does not compare
+    labels again.
+
+    Example::
+
+        platform_filter = CompiledPlatformFilter.from_legacy_string("!win")
+        platform_filter.matches_many(platforms)
+    """
+    @classmethod
+    def from_legacy_string(cls, s):
+        """ Create a compiled filter from a legacy pisi string, e.g. '!win'.
+
+        Compiled filters are cached: calling this method several times with
+        the same string returns the same instance.
+        """
+        return _compiled_from_legacy_string(cls, s)
+
+    def __init__(self, platform_filter):
+        self._literals = tuple(
+            (_compile_label(literal.label), literal.is_true)
+            for literal in platform_filter.platform_labels
+        )
+        # id(platform) -> (platform, result) mapping. Platforms are kept
+        # alive by the memo, so that their id cannot be reused
+        self._memo = {}
+
+    def matches(self, platform):
+        entry = self._memo.get(id(platform))
+        if entry is not None and entry[0] is platform:
+            return entry[1]
+        return self._memoize(platform)
+
+    def matches_many(self, platforms):
+        """ Returns the list of matches() results for the given platforms.
+        """
+        memo_get = self._memo.get
+        results = []
+        for platform in platforms:
+            entry = memo_get(id(platform))
+            if entry is not None and entry[0] is platform:
+                results.append(entry[1])
+            else:
+                results.append(self._memoize(platform))
+        return results
+
+    def _memoize(self, platform):
+        result = self._evaluate(platform)
+        if len(self._memo) >= _MAX_MEMOIZED_PLATFORMS:
+            self._memo.clear()
+        self._memo[id(platform)] = (platform, result)
+        return result
+
+    def _evaluate(self, platform):
+        signature = (
+            platform.os_kind, platform.family_kind, platform.name_kind,
+            platform.release, platform.arch
+        )
+        for label, is_true in self._literals:
+            matches = label is None or label[0](signature) == label[1]
+            if matches is not is_true:
+                return False
+        return True
+
+
+def _compile_label(label):
+    """ Returns None if the label matches any platform, and a (getter,
+    expected) pair otherwise: the label matches a platform iff getter applied
+    to the platform signature is equal to expected.
+    """
+    values = (
+        label.os_kind, label.family_kind, label.name_kind,
+        label.release or None, label.arch
+    )
+    positions = [i for i, value in enumerate(values) if value is not None]
+    if len(positions) == 0:
+        return None
+    expected = tuple(values[i] for i in positions)
+    if len(positions) == 1:
+        # itemgetter returns a single item, not a tuple
+        expected = expected[0]
+    return operator.itemgetter(*positions), expected
+
+
+def _literals_key(literals):
+    """ Returns a hashable snapshot of the given platform literals, equal for
+    literals which compile to the same filter.
+    """
+    return tuple(
+        (literal.is_true, literal.label.os_kind, literal.label.family_kind,
+         literal.label.name_kind, literal.label.release, literal.label.arch)
+        for literal in literals
+    )
+
+
+@functools.lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compiled_from_legacy_string(cls, s):
+    return cls(PlatformFilter.from_legacy_string(s))
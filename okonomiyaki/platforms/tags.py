@@ -0,0 +1,242 @@
+""" Ordered sets of PEP425 tags supported by a target, and an index of
+packages by tags.
+
+Tags are (python_tag, abi_tag, platform_tag) tuples of strings, using the
+same conventions as the egg metadata: 'none' for python and abi tags, and
+'any' for platform tags.
+"""
+import collections
+import re
+
+from okonomiyaki.errors import OkonomiyakiError
+
+from ._arch import X86, X86_64, ARM64
+from ._platform import OSKind
+from .python_implementation import PythonABI
+
+
+_ANY = u"any"
+_NONE = u"none"
+_ABI3 = u"abi3"
+
+_MACOSX_ARCHS = {
+    X86: u"i386",
+    X86_64: u"x86_64",
+    ARM64: u"arm64",
+}
+
+_RELEASE_R = re.compile(r"^(?P<major>\d+)(\.(?P<minor>\d+))?")
+
+
+def supported_tags(platform, implementation, abi=None):
+    """ Generates the (python_tag, abi_tag, platform_tag) tuples of the
+    packages installable on the given target, from the most to the least
+    preferred.
+
+    The order follows the one used by pip: interpreter specific tags first,
+    then the tags of compatible python versions, then the platform specific
+    tags of non-python packages ('none-none-<platform>'), then platform
+    independent tags, ending with 'none-none-any'.
+
+    Parameters
+    ----------
+    platform: EPDPlatform
+        The target platform.
+    implementation: PythonImplementation
+        The target python, e.g. PythonImplementation.from_string('cp311').
+    abi: PythonABI, str or None
+        The python abi of the target, e.g. 'cp311'. If None, only tags
+        with an abi independent of the target are generated.
+    """
+    if isinstance(abi, PythonABI):
+        abi = abi.pep425_tag
+    platform_tags = _platform_tags(platform)
+
+    seen = set()
+    for tag in _supported_tags(platform_tags, implementation, abi):
+        if tag not in seen:
+            seen.add(tag)
+            yield tag
+
+
+def _supported_tags(platform_tags, implementation, abi):
+    python_tag = implementation.pep425_tag
+    has_abi3 = _has_abi3(implementation)
+
+    # Interpreter specific tags
+    if abi is not None:
+        for platform_tag in platform_tags:
+            yield python_tag, abi, platform_tag
+    if has_abi3:
+        for platform_tag in platform_tags:
+            yield python_tag, _ABI3, platform_tag
+    for platform_tag in platform_tags:
+        yield python_tag, _NONE, platform_tag
+    if has_abi3:
+        for minor in range(implementation.minor - 1, 1, -1):
+            older = u"{0}{1}{2}".format(
+                implementation.abbreviated_implementation,
+                implementation.major, minor)
+            for platform_tag in platform_tags:
+                yield older, _ABI3, platform_tag
+
+    # Python version specific tags
+    for version in _python_versions(implementation):
+        for platform_tag in platform_tags:
+            yield version, _NONE, platform_tag
+
+    # Non-python packages
+    for platform_tag in platform_tags:
+        yield _NONE, _NONE, platform_tag
+
+    # Platform independent tags
+    yield python_tag, _NONE, _ANY
+    for version in _python_versions(implementation):
+        yield version, _NONE, _ANY
+    yield _NONE, _NONE, _ANY
+
+
+def _has_abi3(implementation):
+    return (
+        implementation.kind == u"cpython"
+        and (implementation.major, implementation.minor) >= (3, 2)
+    )
+
+
+def _python_versions(implementation):
+    """ Generic python tags compatible with the given implementation, e.g.
+    py38, py3, py37, ..., py30 for cpython 3.8.
+    """
+    major, minor = implementation.major, implementation.minor
+    yield u"py{0}{1}".format(major, minor)
+    yield u"py{0}".format(major)
+    for older in range(minor - 1, -1, -1):
+        yield u"py{0}{1}".format(major, older)
+
+
+def _platform_tags(platform):
+    """ The platform tags of the given EPDPlatform, from the most to the
+    least preferred.
+    """
+    tags = [platform.pep425_tag]
+    if platform.platform.os_kind == OSKind.darwin:
+        tags.extend(_macosx_tags(platform))
+    return list(collections.OrderedDict.fromkeys(tags))
+
+
+def _macosx_tags(platform):
+    """ The macosx platform tags of the older releases, which packages built
+    for those releases can be installed on the given platform.
+    """
+    arch = _MACOSX_ARCHS[platform.arch]
+    m = _RELEASE_R.match(platform.platform.release)
+    if m is None:
+        raise OkonomiyakiError(
+            "Invalid macOS release: {0!r}".format(platform.platform.release))
+    major = int(m.group("major"))
+    minor = int(m.group("minor") or 0)
+
+    if major >= 11:
+        for version in range(major, 10, -1):
+            yield u"macosx_{0}_0_{1}".format(version, arch)
+        minor = 16
+    if platform.arch == ARM64:
+        # No arm64 build before macOS 11
+        return
+    for version in range(minor, 3, -1):
+        yield u"macosx_10_{0}_{1}".format(version, arch)
+
+
+class TagIndex(object):
+    """ An index of package entries by (python_tag, abi_tag, platform_tag)
+    tuples.
+
+    Finding the best package for a target is a lookup of its supported
+    tags, in preference order, instead of a scan of every package.
+
+    Example::
+
+        index = TagIndex()
+        for metadata in metadata_list:
+            tag = (
+                metadata.python_tag_string, metadata.abi_tag_string,
+                metadata.platform_tag_string
+            )
+            index.add(tag, metadata)
+
+        tags = list(supported_tags(platform, implementation, abi))
+        best = index.best(tags, key=lambda metadata: metadata.version)
+    """
+    def __init__(self):
+        # tag -> (list of entries) mapping
+        self._entries = collections.defaultdict(list)
+        self._len = 0
+
+    # Public methods
+    def add(self, tag, entry):
+        """ Index the given entry under the given tag.
+
+        Parameters
+        ----------
+        tag: tuple
+            The (python_tag, abi_tag, platform_tag) tuple.
+        entry: object
+            The indexed value, e.g. an EggMetadata instance.
+        """
+        python_tag, abi_tag, platform_tag = tag
+        self._entries[(python_tag, abi_tag, platform_tag)].append(entry)
+        self._len += 1
+
+    def get(self, tag):
+        """ Returns the list of entries indexed under the given tag."""
+        entries = self._entries.get(tuple(tag))
+        if entries is None:
+            return []
+        return list(entries)
+
+    def compatible(self, supported):
+        """ Generates the (rank, tag, entry) tuples of the entries whose tag
+        is in supported, from the most to the least preferred tag. The rank
+        is the index of the tag in supported.
+
+        Parameters
+        ----------
+        supported: iterable
+            The supported tags, in preference order, e.g. as returned by
+            supported_tags.
+        """
+        for rank, tag in enumerate(supported):
+            for entry in self._entries.get(tag, ()):
+                yield rank, tag, entry
+
+    def best(self, supported, key=None):
+        """ Returns the entry with the most preferred supported tag, or None
+        if no entry is compatible.
+
+        Parameters
+        ----------
+        supported: iterable
+            The supported tags, in preference order.
+        key: callable or None
+            If given, ties between the entries of the most preferred tag are
+            broken by taking the maximum of key(entry). Otherwise, the first
+            added entry is returned.
+        """
+        for tag in supported:
+            entries = self._entries.get(tag)
+            if entries:
+                if key is None:
+                    return entries[0]
+                return max(entries, key=key)
+        return None
+
+    def tags(self):
+        """ Returns the set of indexed tags."""
+        return set(self._entries)
+
+    # Protocol implementations
+    def __contains__(self, tag):
+        return tuple(tag) in self._entries
+
+    def __len__(self):
+        return self._len
@@ -0,0 +1,169 @@
+import json
+import os.path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import _platform
+from .._arch import Arch, X86_64
+from .._host import HostSnapshot, clear_host_snapshot, host_snapshot
+from .._platform import FamilyKind, NameKind, OSKind, Platform
+from ..epd_platform import EPDPlatform
+from .common import mock_centos_7_6, mock_x86_64
+
+
+def _count_probes():
+    return mock.patch(
+        "okonomiyaki.platforms._platform._linux_distribution",
+        wraps=_platform._linux_distribution
+    )
+
+
+class TestHostSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tempdir, "cache", "host.json")
+        clear_host_snapshot()
+        self.addCleanup(clear_host_snapshot)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_probed_once(self):
+        # Given
+        with _count_probes() as probe:
+            # When
+            platform = Platform.from_running_system()
+            epd_platform = EPDPlatform.from_running_system()
+            Platform.from_running_python()
+            Arch.from_running_system()
+            snapshot = host_snapshot()
+
+            # Then
+            self.assertEqual(probe.call_count, 1)
+
+        self.assertEqual(platform.name_kind, NameKind.centos)
+        self.assertEqual(str(epd_platform), "rh7_x86_64")
+        self.assertEqual(
+            snapshot,
+            HostSnapshot(
+                X86_64, OSKind.linux, FamilyKind.rhel, NameKind.centos,
+                "7.6.1810"
+            )
+        )
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_clear(self):
+        # Given
+        self.assertEqual(host_snapshot().name_kind, NameKind.centos)
+
+        with mock.patch(
+            "okonomiyaki.platforms._platform._linux_distribution",
+            return_value=("ubuntu", "13.04", ["debian"])
+        ):
+            # When
+            name_kind = host_snapshot().name_kind
+            clear_host_snapshot()
+            cleared_name_kind = host_snapshot().name_kind
+
+        # Then
+        self.assertEqual(name_kind, NameKind.centos)
+        self.assertEqual(cleared_name_kind, NameKind.ubuntu)
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_cache_file(self):
+        # Given
+        r_snapshot = host_snapshot(self.cache_path)
+        clear_host_snapshot()
+
+        # When
+        with mock.patch(
+            "okonomiyaki.platforms._platform._linux_distribution",
+            side_effect=AssertionError("host probed")
+        ):
+            snapshot = host_snapshot(self.cache_path)
+            platform = Platform.from_running_system()
+
+        # Then
+        self.assertEqual(snapshot, r_snapshot)
+        self.assertEqual(platform.name_kind, NameKind.centos)
+        self.assertEqual(platform.release, "7.6.1810")
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_cache_file_stale(self):
+        # Given
+        host_snapshot(self.cache_path)
+        clear_host_snapshot()
+
+        # When
+        with mock.patch(
+            "okonomiyaki.platforms._host._boot_key",
+            return_value=["another", "boot"]
+        ):
+            with _count_probes() as probe:
+                host_snapshot(self.cache_path)
+
+        # Then
+        self.assertEqual(probe.call_count, 1)
+        with open(self.cache_path) as fp:
+            self.assertEqual(json.load(fp)["boot_key"], ["another", "boot"])
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_cache_file_corrupted(self):
+        # Given
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as fp:
+            fp.write("{\"boot_key\": ")
+
+        # When
+        with _count_probes() as probe:
+            snapshot = host_snapshot(self.cache_path)
+
+        # Then
+        self.assertEqual(probe.call_count, 1)
+        self.assertEqual(snapshot.name_kind, NameKind.centos)
+        clear_host_snapshot()
+        with mock.patch(
+            "okonomiyaki.platforms._platform._linux_distribution",
+            side_effect=AssertionError("host probed")
+        ):
+            self.assertEqual(host_snapshot(self.cache_path), snapshot)
+
+    @mock_centos_7_6
+    @mock_x86_64
+    def test_cache_file_already_probed(self):
+        # Given
+        r_snapshot = host_snapshot()
+
+        # When
+        with _count_probes() as probe:
+            snapshot = host_snapshot(self.cache_path)
+
+        # Then
+        self.assertEqual(probe.call_count, 0)
+        self.assertEqual(snapshot, r_snapshot)
+        self.assertTrue(os.path.exists(self.cache_path))
+        clear_host_snapshot()
+        with mock.patch(
+            "okonomiyaki.platforms._platform._linux_distribution",
+            side_effect=AssertionError("host probed")
+        ):
+            self.assertEqual(host_snapshot(self.cache_path), r_snapshot)
+
+    def test_json_dict(self):
+        # Given
+        snapshot = HostSnapshot(
+            X86_64, OSKind.linux, FamilyKind.debian, NameKind.ubuntu, "22.04")
+
+        # When
+        data = snapshot.to_json_dict()
+
+        # Then
+        self.assertEqual(HostSnapshot.from_json_dict(data), snapshot)
@@ -0,0 +1,61 @@
+import os.path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from .._pep425_cache import PEP425TagsCache
+
+
+class TestPEP425TagsCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tempdir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_simple(self):
+        # Given
+        executable = "/usr/bin/python3"
+        tags = ("cp311", "cp311", "linux_x86_64")
+
+        # When
+        with PEP425TagsCache(self.directory) as cache:
+            self.assertIsNone(cache.get(executable, 10, 20))
+            cache.add(executable, 10, 20, tags)
+
+            # Then
+            self.assertEqual(cache.get(executable, 10, 20), tags)
+            self.assertIsNone(cache.get(executable, 10, 21))
+            self.assertIsNone(cache.get(executable, 11, 20))
+            self.assertEqual(len(cache), 1)
+
+        # When
+        with PEP425TagsCache(self.directory) as cache:
+            cache.add(executable, 10, 21, ("cp312", "cp312", "linux_x86_64"))
+
+            # Then
+            self.assertIsNone(cache.get(executable, 10, 20))
+            self.assertEqual(len(cache), 1)
+
+            # When
+            cache.clear()
+
+            # Then
+            self.assertIsNone(cache.get(executable, 10, 21))
+            self.assertEqual(len(cache), 0)
+
+    def test_pickling(self):
+        # Given
+        tags = ("cp311", "cp311", "linux_x86_64")
+        cache = PEP425TagsCache(self.directory)
+        self.addCleanup(cache.close)
+        cache.add("/usr/bin/python3", 10, 20, tags)
+
+        # When
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.addCleanup(unpickled.close)
+
+        # Then
+        self.assertEqual(unpickled.get("/usr/bin/python3", 10, 20), tags)
@@ -402,6 +402,37 @@ class TestEPDPlatform(unittest.TestCase):
         with self.assertRaises(OkonomiyakiError):
             EPDPlatform.from_string(epd_platform_string)
 
+    def test_from_string_cache(self):
+        # Given
+        EPDPlatform.cache_clear()
+        py38 = RuntimeVersion.from_string("3.8")
+
+        # When
+        platform = EPDPlatform.from_string("osx_x86_64")
+        same_platform = EPDPlatform.from_string("osx_x86_64")
+        platform_py38 = EPDPlatform.from_string("osx_x86_64", py38)
+        same_platform_py38 = EPDPlatform.from_string(
+            "osx_x86_64", RuntimeVersion.from_string("3.8"))
+
+        # Then
+        self.assertIs(platform, same_platform)
+        self.assertIs(platform_py38, same_platform_py38)
+        self.assertEqual(platform.platform.release, "10.6")
+        self.assertEqual(platform_py38.platform.release, "10.14")
+        info = EPDPlatform.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+
+        # When
+        with self.assertRaises(OkonomiyakiError):
+            EPDPlatform.from_string("netbsd-32")
+        EPDPlatform.cache_clear()
+
+        # Then
+        info = EPDPlatform.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+        self.assertIsNot(EPDPlatform.from_string("osx_x86_64"), platform)
+        self.assertEqual(EPDPlatform.from_string("osx_x86_64"), platform)
+
     @parameterized.expand([
         ('linux_i686', 'rh8_x86'),
         ('linux_i386', 'rh8_x86'),
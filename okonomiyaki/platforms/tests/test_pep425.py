@@ -1,10 +1,19 @@
+import os
+import re
+import shutil
+import stat
 import sys
+import tempfile
 import unittest
-import re
+from unittest import mock
 
 from packaging import tags
 
-from ..pep425 import compute_abi_tag, compute_python_tag, compute_platform_tag
+from .. import pep425
+from .._pep425_cache import PEP425TagsCache
+from ..pep425 import (
+    compute_abi_tag, compute_python_tag, compute_platform_tag,
+    compute_pep425_tags)
 
 
 def _system_tags():
@@ -89,3 +98,92 @@ class TestPEP425(unittest.TestCase):
             platform_tag = re.sub('macosx_12_.', 'macosx_12_0', platform_tag)
         else:
             self.assertIn(platform_tag, self.compatible_platforms)
+
+
+class TestComputePEP425Tags(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self._clear_memo()
+        self.addCleanup(self._clear_memo)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _clear_memo(self):
+        pep425._TAGS_MEMO.clear()
+
+    def _count_subprocesses(self):
+        patcher = mock.patch(
+            "okonomiyaki.platforms.pep425.subprocess.check_output",
+            wraps=pep425.subprocess.check_output
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_single_subprocess(self):
+        # Given
+        check_output = self._count_subprocesses()
+
+        # When
+        tags = compute_pep425_tags(sys.executable)
+        python_tag = compute_python_tag(sys.executable)
+        abi_tag = compute_abi_tag()
+        platform_tag = compute_platform_tag(sys.executable)
+
+        # Then
+        self.assertEqual(check_output.call_count, 1)
+        self.assertEqual(tags, (python_tag, abi_tag, platform_tag))
+        self.assertEqual(tags.python_tag, python_tag)
+
+    def test_disk_cache(self):
+        # Given
+        directory = os.path.join(self.tempdir, "cache")
+        with PEP425TagsCache(directory) as cache:
+            r_tags = compute_pep425_tags(sys.executable, cache=cache)
+        self._clear_memo()
+
+        # When
+        with mock.patch(
+            "okonomiyaki.platforms.pep425.subprocess.check_output",
+            side_effect=AssertionError("subprocess launched")
+        ):
+            with PEP425TagsCache(directory) as cache:
+                tags = compute_pep425_tags(sys.executable, cache=cache)
+
+        # Then
+        self.assertEqual(tags, r_tags)
+
+    @unittest.skipIf(sys.platform == "win32", "Needs a shell script")
+    def test_modified_executable(self):
+        # Given
+        executable = os.path.join(self.tempdir, "python")
+        with open(executable, "w") as fp:
+            fp.write('#!/bin/sh\nexec "{0}" "$@"\n'.format(sys.executable))
+        os.chmod(executable, os.stat(executable).st_mode | stat.S_IXUSR)
+        check_output = self._count_subprocesses()
+        compute_pep425_tags(executable)
+
+        # When
+        st = os.stat(executable)
+        os.utime(executable, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        compute_pep425_tags(executable)
+        compute_pep425_tags(executable)
+
+        # Then
+        self.assertEqual(check_output.call_count, 2)
+
+    @unittest.skipIf(sys.platform == "win32", "Needs symlinks")
+    def test_symlinked_executable(self):
+        # Given
+        executable = os.path.join(self.tempdir, "python")
+        os.symlink(sys.executable, executable)
+        check_output = self._count_subprocesses()
+
+        # When
+        tags = compute_pep425_tags(executable)
+        r_tags = compute_pep425_tags(sys.executable)
+
+        # Then
+        self.assertEqual(check_output.call_count, 1)
+        self.assertEqual(check_output.call_args[0][0][0], executable)
+        self.assertEqual(tags, r_tags)
@@ -1,9 +1,12 @@
+import itertools
 import unittest
+from unittest import mock
 
 from .._arch import Arch
 from ..epd_platform import EPDPlatform
 from .._platform import OSKind, NameKind, FamilyKind, Platform
-from ..platform_filters import PlatformFilter, PlatformLabel, PlatformLiteral
+from ..platform_filters import (
+    CompiledPlatformFilter, PlatformFilter, PlatformLabel, PlatformLiteral)
 
 LABEL_WINDOWS_ANY = PlatformLabel()
 LABEL_WINDOWS_ANY.os_kind = OSKind.windows
@@ -217,3 +220,116 @@ class TestPlatformFilter(unittest.TestCase):
         self.assertTrue(filtre.matches(UBUNTU_12_10_X32))
         self.assertTrue(filtre.matches(UBUNTU_14_04_X32))
         self.assertTrue(filtre.matches(UBUNTU_14_04_X64))
+
+
+ALL_PLATFORMS = [
+    RH5_32, RH5_X86_64, OSX_32, WIN_X86_64, UBUNTU_12_10_X32,
+    UBUNTU_14_04_X32, UBUNTU_14_04_X64,
+    _platform_from_epd_string("rh7-64"), _platform_from_epd_string("win-32"),
+    _platform_from_epd_string("osx-64"),
+]
+
+LEGACY_STRINGS = [
+    "all", "!all", "win", "!win", "32", "64", "rh", "rh-64", "!rh-32",
+    "osx-32", "!win,!osx", "!win,rh-64", "rh5,rh6", "win-64,!32", "rh7",
+]
+
+
+class TestCompiledPlatformFilter(unittest.TestCase):
+    def test_same_as_filter(self):
+        for legacy_string in LEGACY_STRINGS:
+            # Given
+            filtre = PlatformFilter.from_legacy_string(legacy_string)
+            r_results = [filtre.matches(platform) for platform in ALL_PLATFORMS]
+
+            # When
+            compiled = filtre.compile()
+            results = [compiled.matches(platform) for platform in ALL_PLATFORMS]
+            memoized_results = compiled.matches_many(ALL_PLATFORMS)
+
+            # Then
+            self.assertEqual(results, r_results, msg=legacy_string)
+            self.assertEqual(memoized_results, r_results, msg=legacy_string)
+            self.assertEqual(
+                filtre.matches_many(ALL_PLATFORMS), r_results,
+                msg=legacy_string
+            )
+
+    def test_from_legacy_string(self):
+        # When
+        compiled = CompiledPlatformFilter.from_legacy_string("!win,rh-64")
+
+        # Then
+        self.assertIs(
+            CompiledPlatformFilter.from_legacy_string("!win,rh-64"), compiled)
+        self.assertEqual(
+            compiled.matches_many([RH5_32, RH5_X86_64, WIN_X86_64]),
+            [False, True, False]
+        )
+
+    def test_grid(self):
+        # Given
+        grid = list(itertools.product(LEGACY_STRINGS * 3, ALL_PLATFORMS))
+
+        # When
+        with mock.patch.object(
+            CompiledPlatformFilter, "_evaluate",
+            autospec=True, side_effect=CompiledPlatformFilter._evaluate
+        ) as evaluate:
+            results = [
+                CompiledPlatformFilter.from_legacy_string(s).matches(platform)
+                for s, platform in grid
+            ]
+
+        # Then
+        self.assertEqual(
+            results,
+            [
+                PlatformFilter.from_legacy_string(s).matches(platform)
+                for s, platform in grid
+            ]
+        )
+        self.assertLessEqual(
+            evaluate.call_count, len(LEGACY_STRINGS) * len(ALL_PLATFORMS))
+
+    def test_memo_bounded(self):
+        # Given
+        compiled = PlatformFilter.from_legacy_string("rh").compile()
+
+        # When
+        with mock.patch(
+            "okonomiyaki.platforms.platform_filters._MAX_MEMOIZED_PLATFORMS", 4
+        ):
+            results = compiled.matches_many(ALL_PLATFORMS)
+
+        # Then
+        self.assertLessEqual(len(compiled._memo), 4)
+        self.assertEqual(results, [
+            PlatformFilter.from_legacy_string("rh").matches(platform)
+            for platform in ALL_PLATFORMS
+        ])
+
+    def test_matches_many_cached(self):
+        # Given
+        filtre = PlatformFilter.from_legacy_string("rh")
+        r_results = filtre.matches_many(ALL_PLATFORMS)
+
+        # When
+        with mock.patch.object(
+            CompiledPlatformFilter, "_evaluate",
+            autospec=True, side_effect=CompiledPlatformFilter._evaluate
+        ) as evaluate:
+            results = filtre.matches_many(ALL_PLATFORMS)
+
+        # Then
+        self.assertEqual(evaluate.call_count, 0)
+        self.assertEqual(results, r_results)
+
+        # When
+        filtre.platform_labels[0].is_true = False
+
+        # Then
+        self.assertEqual(
+            filtre.matches_many(ALL_PLATFORMS),
+            [not result for result in r_results]
+        )
@@ -0,0 +1,177 @@
+import unittest
+
+from packaging import tags
+
+from okonomiyaki.versions import RuntimeVersion
+from ..epd_platform import EPDPlatform
+from ..python_implementation import PythonABI, PythonImplementation
+from ..tags import TagIndex, supported_tags
+
+
+def _packaging_tags(python_version, abi, platforms):
+    """ The tags supported by a cpython target, according to packaging.
+    """
+    supported = list(tags.cpython_tags(python_version, [abi], platforms))
+    supported.extend(tags.compatible_tags(
+        python_version, "cp{0}{1}".format(*python_version), platforms))
+    return [(tag.interpreter, tag.abi, tag.platform) for tag in supported]
+
+
+class TestSupportedTags(unittest.TestCase):
+    def test_linux(self):
+        # Given
+        platform = EPDPlatform.from_string("rh7_x86_64")
+        implementation = PythonImplementation.from_string("cp311")
+
+        # When
+        supported = list(
+            supported_tags(platform, implementation, PythonABI("cp311")))
+
+        # Then
+        self.assertEqual(supported[0], ("cp311", "cp311", "linux_x86_64"))
+        self.assertEqual(supported[-1], ("none", "none", "any"))
+        self.assertEqual(len(supported), len(set(supported)))
+        self.assertEqual(
+            [tag for tag in supported if tag[0] != "none"],
+            _packaging_tags((3, 11), "cp311", ["linux_x86_64"])
+        )
+        self.assertLess(
+            supported.index(("none", "none", "linux_x86_64")),
+            supported.index(("py3", "none", "any")),
+        )
+        tail = supported[supported.index(("none", "none", "linux_x86_64")):]
+        self.assertEqual(tail, [
+            ("none", "none", "linux_x86_64"),
+            ("cp311", "none", "any"),
+            ("py311", "none", "any"),
+            ("py3", "none", "any"),
+        ] + [
+            ("py3{0}".format(minor), "none", "any")
+            for minor in range(10, -1, -1)
+        ] + [
+            ("none", "none", "any"),
+        ])
+
+    def test_macos(self):
+        # Given
+        platform = EPDPlatform.from_string(
+            "osx_x86_64", RuntimeVersion.from_string("3.8"))
+        implementation = PythonImplementation.from_string("cp38")
+        platforms = ["macosx_10_{0}_x86_64".format(minor)
+                     for minor in range(14, 3, -1)]
+
+        # When
+        supported = list(supported_tags(platform, implementation, "cp38"))
+
+        # Then
+        self.assertEqual(
+            [tag for tag in supported if tag[0] != "none"],
+            _packaging_tags((3, 8), "cp38", platforms)
+        )
+
+    def test_macos_arm64(self):
+        # Given
+        platform = EPDPlatform.from_string(
+            "osx_arm64", RuntimeVersion.from_string("3.11"))
+        implementation = PythonImplementation.from_string("cp311")
+
+        # When
+        supported = list(supported_tags(platform, implementation, "cp311"))
+
+        # Then
+        self.assertEqual(
+            set(tag[2] for tag in supported),
+            set(["macosx_12_0_arm64", "macosx_11_0_arm64", "any"])
+        )
+
+    def test_python_2(self):
+        # Given
+        platform = EPDPlatform.from_string("win_x86_64")
+        implementation = PythonImplementation.from_string("cp27")
+
+        # When
+        supported = list(supported_tags(platform, implementation, "cp27m"))
+
+        # Then
+        self.assertEqual(supported[:2], [
+            ("cp27", "cp27m", "win_amd64"), ("cp27", "none", "win_amd64")])
+        self.assertNotIn("abi3", set(tag[1] for tag in supported))
+
+    def test_without_abi(self):
+        # Given
+        platform = EPDPlatform.from_string("rh7_x86_64")
+        implementation = PythonImplementation.from_string("cp311")
+
+        # When
+        supported = list(supported_tags(platform, implementation))
+
+        # Then
+        self.assertEqual(supported[0], ("cp311", "abi3", "linux_x86_64"))
+        self.assertNotIn("cp311", set(tag[1] for tag in supported))
+
+
+class TestTagIndex(unittest.TestCase):
+    def setUp(self):
+        platform = EPDPlatform.from_string("rh7_x86_64")
+        implementation = PythonImplementation.from_string("cp311")
+        self.supported = list(
+            supported_tags(platform, implementation, "cp311"))
+
+    def test_best(self):
+        # Given
+        index = TagIndex()
+        index.add(("cp311", "cp311", "linux_x86_64"), ("numpy", 1))
+        index.add(("cp311", "cp311", "linux_x86_64"), ("numpy", 2))
+        index.add(("py3", "none", "any"), ("numpy", 3))
+        index.add(("cp311", "cp311", "win_amd64"), ("numpy", 4))
+
+        # When
+        best = index.best(self.supported)
+        best_version = index.best(self.supported, key=lambda entry: entry[1])
+
+        # Then
+        self.assertEqual(best, ("numpy", 1))
+        self.assertEqual(best_version, ("numpy", 2))
+        self.assertEqual(len(index), 4)
+
+    def test_best_fallback(self):
+        # Given
+        index = TagIndex()
+        index.add(("cp27", "cp27m", "linux_x86_64"), "old")
+        index.add(("none", "none", "any"), "any")
+
+        # When/Then
+        self.assertEqual(index.best(self.supported), "any")
+        self.assertIsNone(TagIndex().best(self.supported))
+
+    def test_compatible(self):
+        # Given
+        index = TagIndex()
+        index.add(("py3", "none", "any"), "pure")
+        index.add(("cp311", "abi3", "linux_x86_64"), "abi3")
+        index.add(("cp27", "cp27m", "linux_x86_64"), "old")
+
+        # When
+        compatible = list(index.compatible(self.supported))
+
+        # Then
+        self.assertEqual(
+            [entry for _, _, entry in compatible], ["abi3", "pure"])
+        self.assertEqual(
+            [rank for rank, _, _ in compatible],
+            [self.supported.index(tag) for _, tag, _ in compatible]
+        )
+
+    def test_get(self):
+        # Given
+        tag = ("cp311", "cp311", "linux_x86_64")
+        index = TagIndex()
+        index.add(tag, "a")
+        index.add(list(tag), "b")
+
+        # When/Then
+        self.assertEqual(index.get(tag), ["a", "b"])
+        self.assertEqual(index.get(("py3", "none", "any")), [])
+        self.assertIn(tag, index)
+        self.assertNotIn(("py3", "none", "any"), index)
+        self.assertEqual(index.tags(), set([tag]))
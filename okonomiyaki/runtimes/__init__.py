@@ -1,2 +1,14 @@
-# flake8: noqa
-from .runtime_metadata import IRuntimeMetadata, is_runtime_path_valid
+from okonomiyaki.utils._lazy import lazy_exports
+
+# Public names are imported on first access, see okonomiyaki.utils._lazy
+_EXPORTS = {
+    "IRuntimeMetadata": ".runtime_metadata",
+    "is_runtime_path_valid": ".runtime_metadata",
+    "runtime_metadata_from_paths": ".runtime_metadata",
+    "RUNTIME_METADATA_ERRORS": ".runtime_metadata",
+    "RuntimeValidationCache": "._validation_cache",
+}
+
+__all__ = sorted(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,65 @@
+from okonomiyaki.utils._sqlite import SqliteCache
+
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS validated_runtimes (
+    sha256 TEXT NOT NULL,
+    schema TEXT NOT NULL,
+    PRIMARY KEY (sha256, schema)
+)"""
+
+
+class RuntimeValidationCache(SqliteCache):
+    """ A persistent, sqlite-backed record of the runtimes whose metadata
+    has already been validated against their json schema.
+
+    Passing it to runtime_metadata_factory, together with the sha256 of the
+    runtime, enables the trusted mode: the metadata of a runtime whose sha256
+    is recorded is not validated again.
+    Runtimes are recorded per schema, so that a schema change invalidates
+    previous validations.
+
+    Example::
+
+        with RuntimeValidationCache(cache_directory) as cache:
+            metadata = runtime_metadata_factory(
+                path, sha256=sha256, validation_cache=cache)
+
+    Parameters
+    ----------
+    directory: str
+        The directory holding the cache database. It is created if it does
+        not exist.
+    """
+    _DATABASE_NAME = "runtime_validation.sqlite"
+    _SCHEMA_VERSION = 1
+    _TABLE = "validated_runtimes"
+    _SCHEMA = (_CREATE_TABLE,)
+
+    # Public methods
+    def is_validated(self, sha256, schema):
+        """ Returns True if the runtime with the given sha256 was recorded
+        as valid for the given schema.
+
+        Parameters
+        ----------
+        sha256: str
+            The sha256 of the runtime.
+        schema: str
+            The schema identifier, as returned by the metadata class.
+        """
+        row = self._execute(
+            "SELECT 1 FROM validated_runtimes "
+            "WHERE sha256 = ? AND schema = ?", (sha256, schema)
+        ).fetchone()
+        return row is not None
+
+    def add(self, sha256, schema):
+        """ Record the runtime with the given sha256 as valid for the given
+        schema.
+        """
+        self._execute(
+            "INSERT OR IGNORE INTO validated_runtimes (sha256, schema) "
+            "VALUES (?, ?)", (sha256, schema)
+        )
+        self._commit()
@@ -1,16 +1,19 @@
 import abc
+import functools
+import hashlib
 import os.path
 import json
-
-import jsonschema
-import zipfile2
+import zipfile
 
 from attr import attr, attributes
 from attr.validators import instance_of
 
-from okonomiyaki.errors import InvalidMetadata, MissingMetadata, UnsupportedMetadata
+from okonomiyaki.errors import (
+    InvalidMetadata, MissingMetadata, OkonomiyakiError, UnsupportedMetadata)
 from okonomiyaki.platforms import EPDPlatform, Platform
 from okonomiyaki.platforms.abi import _PLATFORM_ABI_NONE
+from okonomiyaki.utils._parallel import _map_paths
+from okonomiyaki.utils.archives import _open_archive
 from okonomiyaki.versions import MetadataVersion, RuntimeVersion
 
 from .common import _platform_string
@@ -19,6 +22,19 @@ from .runtime_schemas import _JULIA_V1, _PYTHON_V1
 
 _METADATA_ARCNAME = "enthought/runtime.json"
 
+RUNTIME_METADATA_ERRORS = (
+    OkonomiyakiError, zipfile.BadZipFile, OSError, UnicodeDecodeError,
+    json.JSONDecodeError
+)
+""" Exceptions reported per runtime by runtime_metadata_from_paths instead
+of aborting the scan."""
+
+# (metadata class) -> (json schema validator) mapping, filled on first
+# validation
+_VALIDATORS = {}
+# (metadata class) -> (json schema identifier) mapping
+_SCHEMA_IDS = {}
+
 
 @attributes
 class IRuntimeMetadata(metaclass=abc.ABCMeta):
@@ -38,7 +54,7 @@ class IRuntimeMetadata(metaclass=abc.ABCMeta):
 
     @classmethod
     @abc.abstractmethod
-    def _from_path(cls, path):
+    def _from_path(cls, path, sha256=None, validation_cache=None):
         """Create an instance of the given runtime metadata class from a
         path.
 
@@ -91,28 +107,76 @@ class IRuntimeMetadataV1(IRuntimeMetadata):
     _json_schema = None
 
     @classmethod
-    def _from_path(cls, path_or_file):
+    def _from_path(cls, path_or_file, sha256=None, validation_cache=None):
         if isinstance(path_or_file, str):
             # We don't use the parsed metadata here, but that allows us to
             # sanity check against old runtimes
             _parse_from_path(path_or_file)
-            with zipfile2.ZipFile(path_or_file) as zp:
-                metadata_s = _read_runtime_metadata_json(zp)
-        else:
-            metadata_s = _read_runtime_metadata_json(path_or_file)
-
-        metadata_dict = json.loads(metadata_s)
-        try:
-            jsonschema.validate(metadata_dict, cls._json_schema)
-        except jsonschema.ValidationError as e:
-            msg = "Invalid metadata: {0!r}".format(e.message)
-            raise InvalidMetadata(msg)
+        metadata_dict = _read_runtime_metadata(path_or_file)
+        return cls._from_metadata_dict(
+            metadata_dict, path_or_file, sha256, validation_cache
+        )
+
+    @classmethod
+    def _from_metadata_dict(cls, metadata_dict, path_or_file, sha256=None,
+                            validation_cache=None):
+        """ Validate the given runtime.json content, read from path_or_file,
+        and create an instance from it.
+        """
+        if validation_cache is None or sha256 is None:
+            # Hashing the runtime would cost as much as validating it
+            cls._validate(metadata_dict)
+        elif not validation_cache.is_validated(sha256, cls._schema_id()):
+            cls._validate(metadata_dict)
+            validation_cache.add(sha256, cls._schema_id())
+
         metadata_version = metadata_dict["metadata_version"]
         if metadata_version != "1.0":
             raise UnsupportedMetadata(metadata_version)
 
         return cls._from_json_dict(metadata_dict)
 
+    @classmethod
+    def _validator(cls):
+        """ Returns the validator for this class' json schema.
+
+        The validator is built, and the schema itself checked, only once per
+        class.
+        """
+        validator = _VALIDATORS.get(cls)
+        if validator is None:
+            # Deferred, as jsonschema is slow to import
+            import jsonschema.validators
+
+            schema = cls._json_schema
+            klass = jsonschema.validators.validator_for(schema)
+            klass.check_schema(schema)
+            validator = _VALIDATORS[cls] = klass(schema)
+        return validator
+
+    @classmethod
+    def _schema_id(cls):
+        """ Returns an identifier of this class' json schema, under which
+        validated runtimes are recorded.
+        """
+        schema_id = _SCHEMA_IDS.get(cls)
+        if schema_id is None:
+            schema_id = _SCHEMA_IDS[cls] = hashlib.sha256(
+                json.dumps(cls._json_schema, sort_keys=True).encode("utf8")
+            ).hexdigest()
+        return schema_id
+
+    @classmethod
+    def _validate(cls, metadata_dict):
+        from jsonschema.exceptions import best_match
+
+        validator = cls._validator()
+        # Same error as jsonschema.validate would raise
+        error = best_match(validator.iter_errors(metadata_dict))
+        if error is not None:
+            msg = "Invalid metadata: {0!r}".format(error.message)
+            raise InvalidMetadata(msg)
+
     @classmethod
     def _from_json_dict(cls, data):
         args = cls._from_json_dict_impl(data)
@@ -182,13 +246,23 @@ _METADATA_KLASS_FACTORY = {
 }
 
 
-def runtime_metadata_factory(path_or_file):
+def runtime_metadata_factory(path_or_file, sha256=None,
+                             validation_cache=None):
     """ Creates metadata object of the appropriate class from the given path.
 
     Parameters
     ----------
     path_or_file: str or ZipFile
         The path to the runtime package. May be a ZipFile instance.
+    sha256: str or None
+        The sha256 of the runtime package, if known. Required by the trusted
+        mode.
+    validation_cache: RuntimeValidationCache or None
+        If given together with sha256, enables the trusted mode: the
+        metadata is not validated against its json schema if the runtime was
+        already validated and recorded in the cache. The sha256 is recorded
+        after a successful validation. The cache is not used when sha256 is
+        None.
     """
     def _factory_key_from_metadata(json_dict):
         for k in ("metadata_version", "implementation"):
@@ -201,20 +275,72 @@ def runtime_metadata_factory(path_or_file):
             json_dict["implementation"]
         )
 
-    if isinstance(path_or_file, str):
-        with zipfile2.ZipFile(path_or_file) as zp:
-            metadata = _read_runtime_metadata_json(zp)
-    else:
-        metadata = _read_runtime_metadata_json(path_or_file)
-
-    json_dict = json.loads(metadata)
+    # The archive is only opened, and its metadata parsed, once
+    json_dict = _read_runtime_metadata(path_or_file)
     key = _factory_key_from_metadata(json_dict)
     klass = _METADATA_KLASS_FACTORY.get(key)
     if klass is None:
         msg = "No support for language '{1}' (metadata version '{0}')".format(*key)
         raise UnsupportedMetadata(key[0], msg)
     else:
-        return klass._from_path(path_or_file)
+        if isinstance(path_or_file, str):
+            # Sanity check against old runtimes, see IRuntimeMetadataV1
+            _parse_from_path(path_or_file)
+        return klass._from_metadata_dict(
+            json_dict, path_or_file, sha256, validation_cache
+        )
+
+
+def _runtime_metadata(path_and_sha256, validation_cache):
+    path, sha256 = path_and_sha256
+    return runtime_metadata_factory(
+        path, sha256=sha256, validation_cache=validation_cache)
+
+
+def _path_and_sha256(item):
+    if isinstance(item, str):
+        return item, None
+    else:
+        path, sha256 = item
+        return path, sha256
+
+
+def runtime_metadata_from_paths(paths, workers=None, ordered=True,
+                                chunksize=1, validation_cache=None):
+    """ Extract the metadata of many runtimes, using a pool of processes.
+
+    Yields (path, result) pairs, where result is either a runtime metadata
+    instance, or the exception raised while reading that runtime (any of
+    RUNTIME_METADATA_ERRORS, e.g. MissingMetadata or UnsupportedMetadata).
+    Other exceptions abort the scan.
+
+    Parameters
+    ----------
+    paths: iterable
+        Paths of the runtimes to read, or (path, sha256) pairs when the
+        sha256 of the runtimes are known, e.g. from a repository index.
+    workers: int or None
+        Number of worker processes. If None, use as many processes as there
+        are CPUs. If 1, runtimes are read in the calling process.
+    ordered: bool
+        If True (the default), results are yielded in the order of paths.
+        Otherwise, results are yielded as they complete.
+    chunksize: int
+        The number of runtimes sent to a worker at once.
+    validation_cache: RuntimeValidationCache or None
+        If given, passed through to runtime_metadata_factory (trusted mode),
+        together with the sha256 of each runtime.
+    """
+    func = functools.partial(
+        _runtime_metadata, validation_cache=validation_cache)
+    results = _map_paths(
+        func, (_path_and_sha256(item) for item in paths),
+        RUNTIME_METADATA_ERRORS, workers, ordered, chunksize
+    )
+    return (
+        (path_and_sha256[0], result)
+        for path_and_sha256, result in results
+    )
 
 
 def is_runtime_path_valid(path):
@@ -252,11 +378,20 @@ def _parse_from_path(path):
         abi = abi_string
 
     version = RuntimeVersion.from_string(version_string)
-    epd_platform = EPDPlatform.from_epd_string(platform_string, version)
+    epd_platform = EPDPlatform.from_string(platform_string, version)
 
     return implementation, version, epd_platform.platform, abi
 
 
+def _read_runtime_metadata(path_or_file):
+    if isinstance(path_or_file, str):
+        with _open_archive(path_or_file) as zp:
+            metadata_s = _read_runtime_metadata_json(zp)
+    else:
+        metadata_s = _read_runtime_metadata_json(path_or_file)
+    return json.loads(metadata_s)
+
+
 def _read_runtime_metadata_json(zp):
     try:
         return zp.read(_METADATA_ARCNAME).decode()
@@ -0,0 +1,57 @@
+import os.path
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from .._validation_cache import RuntimeValidationCache
+
+
+class TestRuntimeValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tempdir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_simple(self):
+        # Given
+        sha256 = "a" * 64
+
+        # When
+        with RuntimeValidationCache(self.directory) as cache:
+            self.assertFalse(cache.is_validated(sha256, "schema"))
+            cache.add(sha256, "schema")
+            cache.add(sha256, "schema")
+
+            # Then
+            self.assertTrue(cache.is_validated(sha256, "schema"))
+            self.assertFalse(cache.is_validated(sha256, "other schema"))
+            self.assertEqual(len(cache), 1)
+
+        # When
+        with RuntimeValidationCache(self.directory) as cache:
+            # Then
+            self.assertTrue(cache.is_validated(sha256, "schema"))
+
+            # When
+            cache.clear()
+
+            # Then
+            self.assertFalse(cache.is_validated(sha256, "schema"))
+            self.assertEqual(len(cache), 0)
+
+    def test_pickling(self):
+        # Given
+        sha256 = "a" * 64
+        cache = RuntimeValidationCache(self.directory)
+        self.addCleanup(cache.close)
+        cache.add(sha256, "schema")
+
+        # When
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.addCleanup(unpickled.close)
+
+        # Then
+        self.assertTrue(unpickled.is_validated(sha256, "schema"))
@@ -1,6 +1,7 @@
 import os.path
 import shutil
 import unittest
+from unittest import mock
 
 import zipfile2
 from parameterized import parameterized
@@ -8,7 +9,7 @@ from parameterized import parameterized
 
 from okonomiyaki.errors import (
     InvalidMetadata, MissingMetadata, UnsupportedMetadata)
-from okonomiyaki.utils import tempdir
+from okonomiyaki.utils import compute_sha256, tempdir
 from okonomiyaki.utils.test_data import (
     INVALID_RUNTIME_NO_METADATA_VERSION, JULIA_DEFAULT_0_3_11_RH5_X86_64,
     PYTHON_CPYTHON_2_7_10_RH5_X86_64, PYTHON_CPYTHON_2_7_10_RH5_X86_64_INVALID,
@@ -22,9 +23,11 @@ from okonomiyaki.versions import MetadataVersion
 from okonomiyaki.platforms import (
     Platform, OSKind, FamilyKind, NameKind, X86_64, X86, ARM64)
 
+from .._validation_cache import RuntimeValidationCache
 from ..runtime_metadata import (
-    JuliaRuntimeMetadataV1, PythonRuntimeMetadataV1, RuntimeVersion,
-    is_runtime_path_valid, runtime_metadata_factory)
+    _VALIDATORS, JuliaRuntimeMetadataV1, PythonRuntimeMetadataV1,
+    RuntimeVersion, _parse_from_path, is_runtime_path_valid,
+    runtime_metadata_factory, runtime_metadata_from_paths)
 
 
 class TestPythonMetadataV1(unittest.TestCase):
@@ -337,3 +340,252 @@ class TestRuntimeMetadataFactory(unittest.TestCase):
                 MissingMetadata,
                 r"^Missing runtime metadata field 'metadata_version'$"):
             runtime_metadata_factory(path)
+
+    def test_single_open(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+
+        # When
+        with mock.patch("zipfile2.ZipFile", wraps=zipfile2.ZipFile) as m:
+            with mock.patch(
+                "okonomiyaki.runtimes.runtime_metadata._parse_from_path",
+                wraps=_parse_from_path
+            ) as parse_from_path:
+                metadata = runtime_metadata_factory(path)
+
+        # Then
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(parse_from_path.call_count, 1)
+        self.assertEqual(metadata, PythonRuntimeMetadataV1._from_path(path))
+
+    def test_invalid_filename(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+
+        with tempdir() as d:
+            target = os.path.join(d, "python.runtime")
+            shutil.copy(path, target)
+
+            # When/Then
+            with self.assertRaisesRegex(InvalidMetadata, "Invalid format"):
+                runtime_metadata_factory(target)
+
+
+class TestRuntimeMetadataFromPaths(unittest.TestCase):
+    def setUp(self):
+        self.paths = [
+            PYTHON_CPYTHON_2_7_10_RH5_X86_64, JULIA_DEFAULT_0_3_11_RH5_X86_64,
+            PYTHON_PYPY_2_6_0_RH5_X86_64, PYTHON_CPYTHON_3_8_8_WIN_X86_64,
+        ]
+
+    def _check_results(self, results):
+        for path, metadata in results:
+            self.assertEqual(metadata, runtime_metadata_factory(path))
+
+    def test_in_process(self):
+        # When
+        results = list(runtime_metadata_from_paths(self.paths, workers=1))
+
+        # Then
+        self.assertEqual([path for path, _ in results], self.paths)
+        self._check_results(results)
+
+    def test_process_pool(self):
+        # When
+        results = list(runtime_metadata_from_paths(
+            self.paths, workers=2, chunksize=2))
+
+        # Then
+        self.assertEqual([path for path, _ in results], self.paths)
+        self._check_results(results)
+
+        # When
+        results = list(runtime_metadata_from_paths(
+            self.paths, workers=2, ordered=False))
+
+        # Then
+        self.assertCountEqual([path for path, _ in results], self.paths)
+        self._check_results(results)
+
+    def test_errors_are_reported(self):
+        # Given
+        missing = os.path.join(
+            os.path.dirname(PYTHON_CPYTHON_2_7_10_RH5_X86_64),
+            "cpython-1.0.0+1-rh5_x86_64-gnu.runtime"
+        )
+        paths = [
+            PYTHON_CPYTHON_2_7_10_RH5_X86_64, R_DEFAULT_3_0_0_RH5_X86_64,
+            missing, INVALID_RUNTIME_NO_METADATA_VERSION,
+        ]
+
+        # When
+        results = dict(runtime_metadata_from_paths(paths, workers=2))
+
+        # Then
+        self.assertIsInstance(
+            results[PYTHON_CPYTHON_2_7_10_RH5_X86_64], PythonRuntimeMetadataV1)
+        self.assertIsInstance(
+            results[R_DEFAULT_3_0_0_RH5_X86_64], UnsupportedMetadata)
+        self.assertIsInstance(results[missing], OSError)
+        self.assertIsInstance(
+            results[INVALID_RUNTIME_NO_METADATA_VERSION], MissingMetadata)
+
+    def test_validation_cache(self):
+        # Given
+        paths_and_sha256 = [(path, compute_sha256(path)) for path in self.paths]
+
+        with tempdir() as d:
+            with RuntimeValidationCache(d) as cache:
+                # When
+                results = list(runtime_metadata_from_paths(
+                    paths_and_sha256, workers=2, validation_cache=cache))
+
+                # Then
+                self._check_results(results)
+                self.assertEqual(len(cache), len(self.paths))
+                for (path, sha256), (_, metadata) in zip(
+                        paths_and_sha256, results):
+                    self.assertTrue(cache.is_validated(
+                        sha256, type(metadata)._schema_id()))
+
+                # When
+                with mock.patch(
+                    "okonomiyaki.runtimes.runtime_metadata."
+                    "IRuntimeMetadataV1._validate",
+                    side_effect=AssertionError("should not be validated")
+                ):
+                    results = list(runtime_metadata_from_paths(
+                        paths_and_sha256, workers=1, validation_cache=cache))
+
+                # Then
+                self.assertEqual([path for path, _ in results], self.paths)
+                self._check_results(results)
+
+
+class TestRuntimeMetadataValidation(unittest.TestCase):
+    def test_validator_built_once(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+
+        # When
+        with mock.patch.dict(_VALIDATORS, clear=True):
+            with mock.patch(
+                "jsonschema.validate",
+                side_effect=AssertionError("schema should not be rechecked")
+            ):
+                first = runtime_metadata_factory(path)
+                validator = PythonRuntimeMetadataV1._validator()
+                second = runtime_metadata_factory(path)
+
+            # Then
+            self.assertEqual(list(_VALIDATORS), [PythonRuntimeMetadataV1])
+            self.assertIs(PythonRuntimeMetadataV1._validator(), validator)
+            self.assertEqual(first, second)
+
+    def test_invalid_message(self):
+        # Given
+        import jsonschema
+
+        data = {"metadata_version": "1.0", "implementation": 1}
+        with self.assertRaises(jsonschema.ValidationError) as e:
+            jsonschema.validate(data, PythonRuntimeMetadataV1._json_schema)
+        r_message = "Invalid metadata: {0!r}".format(e.exception.message)
+
+        # When/Then
+        with self.assertRaises(InvalidMetadata) as e:
+            PythonRuntimeMetadataV1._validate(data)
+        self.assertEqual(str(e.exception), r_message)
+
+    def test_trusted_mode(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+        sha256 = compute_sha256(path)
+        r_metadata = runtime_metadata_factory(path)
+
+        with tempdir() as d:
+            with RuntimeValidationCache(d) as cache:
+                # When
+                metadata = runtime_metadata_factory(
+                    path, sha256=sha256, validation_cache=cache)
+
+                # Then
+                self.assertEqual(metadata, r_metadata)
+                self.assertEqual(len(cache), 1)
+
+                # When
+                with mock.patch.object(
+                    PythonRuntimeMetadataV1, "_validate",
+                    side_effect=AssertionError("should not be validated")
+                ):
+                    metadata = runtime_metadata_factory(
+                        path, sha256=sha256, validation_cache=cache)
+                    with zipfile2.ZipFile(path) as zp:
+                        zip_metadata = runtime_metadata_factory(
+                            zp, sha256=sha256, validation_cache=cache)
+
+                # Then
+                self.assertEqual(metadata, r_metadata)
+                self.assertEqual(zip_metadata, r_metadata)
+
+    def test_trusted_mode_without_sha256(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+        r_metadata = runtime_metadata_factory(path)
+        PythonRuntimeMetadataV1._schema_id()
+
+        with tempdir() as d:
+            with RuntimeValidationCache(d) as cache:
+                # When
+                with mock.patch(
+                    "hashlib.sha256",
+                    side_effect=AssertionError("should not be hashed")
+                ):
+                    with mock.patch.object(
+                        PythonRuntimeMetadataV1, "_validate"
+                    ) as validate:
+                        metadata = runtime_metadata_factory(
+                            path, validation_cache=cache)
+
+                # Then
+                self.assertEqual(metadata, r_metadata)
+                self.assertTrue(validate.called)
+                self.assertEqual(len(cache), 0)
+
+    def test_trusted_mode_schema_change(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+        sha256 = compute_sha256(path)
+
+        with tempdir() as d:
+            with RuntimeValidationCache(d) as cache:
+                cache.add(sha256, "previous schema")
+
+                # When
+                with mock.patch.object(
+                    PythonRuntimeMetadataV1, "_validate"
+                ) as validate:
+                    runtime_metadata_factory(
+                        path, sha256=sha256, validation_cache=cache)
+
+                # Then
+                self.assertTrue(validate.called)
+                self.assertTrue(cache.is_validated(
+                    sha256, PythonRuntimeMetadataV1._schema_id()))
+
+    def test_trusted_mode_invalid(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64_INVALID
+
+        with tempdir() as d:
+            target = os.path.join(
+                d, os.path.basename(path).replace('.invalid', '')
+            )
+            shutil.copy(path, target)
+
+            with RuntimeValidationCache(os.path.join(d, "cache")) as cache:
+                # When/Then
+                with self.assertRaises(InvalidMetadata):
+                    runtime_metadata_factory(
+                        target, sha256=compute_sha256(target),
+                        validation_cache=cache)
+                self.assertEqual(len(cache), 0)
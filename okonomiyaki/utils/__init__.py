@@ -1,8 +1,18 @@
 import hashlib
 
-from .misc import (
-    parse_assignments, substitute_variable, substitute_variables, tempdir,
-    decode_if_needed, encode_if_needed)
+from ._lazy import lazy_exports
+
+# Public names are imported on first access, see okonomiyaki.utils._lazy
+_EXPORTS = {
+    "ArchivePool": ".archives",
+    "ArchiveView": ".archives",
+    "parse_assignments": ".misc",
+    "substitute_variable": ".misc",
+    "substitute_variables": ".misc",
+    "tempdir": ".misc",
+    "decode_if_needed": ".misc",
+    "encode_if_needed": ".misc",
+}
 
 
 def compute_md5(path):
@@ -52,6 +62,9 @@ def _compute_hash(path, m):
 
 
 __all__ = [
-    "compute_md5", "decode_if_needed", "encode_if_needed", "parse_assignments",
-    "substitute_variable", "substitute_variables", "tempdir"
+    "ArchivePool", "ArchiveView", "compute_md5", "decode_if_needed",
+    "encode_if_needed", "parse_assignments", "substitute_variable",
+    "substitute_variables", "tempdir"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
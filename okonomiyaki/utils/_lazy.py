@@ -0,0 +1,74 @@
+""" Lazy module attributes, e.g. the public names of a package.
+
+Importing a package only imports the submodule defining a name the first time
+that name is accessed, so that e.g. `import okonomiyaki.file_formats` does not
+pay for the platform, archive and validation machinery it may never use.
+"""
+import importlib
+import sys
+
+
+def lazy_attributes(module_name, loaders):
+    """ Returns the module level __getattr__ and __dir__ functions computing
+    the given attributes on first access.
+
+    On python < 3.7, where module level __getattr__ is not supported, the
+    attributes are computed eagerly instead.
+
+    Parameters
+    ----------
+    module_name: str
+        The fully qualified name of the module, i.e. its __name__.
+    loaders: dict
+        A (name) -> (callable without arguments returning the value)
+        mapping.
+    """
+    def __getattr__(name):
+        try:
+            loader = loaders[name]
+        except KeyError:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(
+                    module_name, name)
+            ) from None
+        value = loader()
+        # Cache the value, so that __getattr__ is only called once per name
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(loaders))
+
+    if sys.version_info < (3, 7):
+        for name in loaders:
+            __getattr__(name)
+
+    return __getattr__, __dir__
+
+
+def lazy_exports(package, exports):
+    """ Returns the module level __getattr__ and __dir__ functions exporting
+    the given names lazily.
+
+    On python < 3.7, where module level __getattr__ is not supported, the
+    names are imported eagerly instead.
+
+    Parameters
+    ----------
+    package: str
+        The fully qualified name of the package, i.e. its __name__.
+    exports: dict
+        A (name) -> (relative module name) mapping, e.g.
+        {"EggMetadata": "._egg_info"}.
+    """
+    def _loader(name, module_name):
+        def load():
+            module = importlib.import_module(module_name, package)
+            return getattr(module, name)
+        return load
+
+    loaders = dict(
+        (name, _loader(name, module_name))
+        for name, module_name in exports.items()
+    )
+    return lazy_attributes(package, loaders)
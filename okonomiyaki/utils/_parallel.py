@@ -0,0 +1,89 @@
+""" Helpers to fan out per-path work over a pool of processes.
+"""
+import concurrent.futures
+import functools
+import itertools
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _apply_to_chunk(func, errors, chunk, chunk_done=None):
+    results = []
+    try:
+        for item in chunk:
+            try:
+                results.append((item, func(item)))
+            except errors as e:
+                results.append((item, e))
+    finally:
+        if chunk_done is not None:
+            chunk_done()
+    return results
+
+
+def _map_paths(func, paths, errors, workers=None, ordered=True, chunksize=1,
+               chunk_done=None):
+    """ Apply func to every path, and yield (path, result) pairs.
+
+    Exceptions of the given types are yielded in place of the result instead
+    of being raised, so that one bad path does not abort the whole batch.
+
+    Parameters
+    ----------
+    func: callable
+        A picklable callable taking a path as its only argument.
+    paths: iterable
+        The paths to process.
+    errors: tuple
+        The exception types to report alongside the results.
+    workers: int or None
+        Number of worker processes. If None, use as many processes as there
+        are CPUs. If 1, every path is processed in the calling process.
+    ordered: bool
+        If True, results are yielded in the same order as paths. Otherwise,
+        they are yielded as soon as they are available.
+    chunksize: int
+        The number of paths sent to a worker at once.
+    chunk_done: callable or None
+        If given, called without arguments in the worker process once a
+        chunk is processed, e.g. to write and release per-process state
+        shared with func. It is not called when every path is processed in
+        the calling process.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("Invalid number of workers: {0!r}".format(workers))
+    if chunksize < 1:
+        raise ValueError("Invalid chunk size: {0!r}".format(chunksize))
+
+    chunks = _chunks(paths, chunksize)
+
+    if workers == 1:
+        for chunk in chunks:
+            for result in _apply_to_chunk(func, errors, chunk):
+                yield result
+        return
+
+    # func and chunk_done are pickled together, so that they share their
+    # state in the worker
+    worker = functools.partial(
+        _apply_to_chunk, func, errors, chunk_done=chunk_done)
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        if ordered:
+            results = executor.map(worker, chunks)
+        else:
+            futures = [executor.submit(worker, chunk) for chunk in chunks]
+            results = (
+                future.result()
+                for future in concurrent.futures.as_completed(futures)
+            )
+        for chunk_results in results:
+            for result in chunk_results:
+                yield result
@@ -0,0 +1,113 @@
+""" Shared implementation of the persistent, sqlite-backed caches.
+"""
+import os
+import os.path
+import sqlite3
+
+
+class SqliteCache(object):
+    """ Base class of the sqlite-backed caches.
+
+    The database is opened on first use, so that instances may be pickled
+    and sent to worker processes, each of them opening its own connection.
+
+    Subclasses define the class attributes below.
+    """
+    _DATABASE_NAME = None
+    """ The file name of the database, inside the cache directory."""
+
+    _SCHEMA_VERSION = None
+    """ Stored as the database user_version. Databases of another version are
+    emptied when opened."""
+
+    _TABLE = None
+    """ The table holding the cache entries."""
+
+    _SCHEMA = ()
+    """ The CREATE ... IF NOT EXISTS statements of the table and its
+    indexes."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._connection = None
+
+    @property
+    def path(self):
+        """ The path of the underlying sqlite database."""
+        return os.path.join(self.directory, self._DATABASE_NAME)
+
+    # Public methods
+    def clear(self):
+        """ Remove every entry from the cache."""
+        self._execute("DELETE FROM " + self._TABLE)
+        self._commit()
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # Protocol implementations
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a, **kw):
+        self.close()
+
+    def __len__(self):
+        return self._execute(
+            "SELECT COUNT(*) FROM " + self._TABLE).fetchone()[0]
+
+    def __getstate__(self):
+        # Connections cannot be pickled: each process opens its own
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+    # Private methods
+    def _execute(self, sql, parameters=()):
+        return self._connect().execute(sql, parameters)
+
+    def _commit(self):
+        self._connect().commit()
+
+    def _connect(self):
+        if self._connection is None:
+            os.makedirs(self.directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60)
+            try:
+                connection.execute("PRAGMA synchronous = NORMAL")
+                # Lock the database while checking the schema, so that
+                # concurrent processes do not drop each other's entries
+                connection.execute("BEGIN IMMEDIATE")
+                version = connection.execute(
+                    "PRAGMA user_version").fetchone()[0]
+                if version != self._SCHEMA_VERSION:
+                    # Stale or incompatible cache: start afresh
+                    connection.execute("DROP TABLE IF EXISTS " + self._TABLE)
+                    connection.execute(
+                        "PRAGMA user_version = {0:d}".format(
+                            self._SCHEMA_VERSION))
+                for statement in self._SCHEMA:
+                    connection.execute(statement)
+                connection.commit()
+                _enable_wal(connection)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+
+def _enable_wal(connection):
+    """ Switch the database to write-ahead logging, which lets readers and a
+    writer work concurrently.
+    """
+    mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    if mode.lower() != "wal":
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError:
+            # Another process holds a lock, e.g. while switching the mode
+            # itself: the default journal mode works as well
+            pass
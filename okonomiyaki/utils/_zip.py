@@ -0,0 +1,309 @@
+""" Low-level helpers to write zip members whose compressed data is produced
+outside of ZipFile, e.g. copied as is from another archive, or compressed in
+a worker thread.
+
+Those rely on a few internals of the stdlib zipfile module (the write lock,
+start_dir and _writecheck), which have been stable since python 3.6, and of
+zipfile2 (its duplicate names check). Callers check _supports_raw_members
+first, and fall back to ZipFile.write if they are missing.
+"""
+import shutil
+import struct
+import tempfile
+import zipfile
+import zlib
+
+
+_BLOCK_SIZE = 1024 * 1024
+# Chunk size used by ZipFile.write. Feeding the compressor with the same
+# chunks guarantees the same compressed stream.
+_WRITE_BLOCK_SIZE = 8 * 1024
+# Compressed data bigger than this is spooled to disk.
+_MAX_IN_MEMORY_SIZE = 16 * 1024 ** 2
+
+# Data descriptor flag: sizes and CRC are stored after the data. As we know
+# them beforehand, they are written in the local header instead.
+_MASK_USE_DATA_DESCRIPTOR = 0x08
+# Filename encoding flag, set again by ZipInfo.FileHeader as needed.
+_MASK_UTF_FILENAME = 0x800
+_MASK_ENCRYPTED = 0x01
+
+# zipfile.ZipFile internals used by _write_raw_member
+_ZIPFILE_INTERNALS = (
+    "_lock", "_writing", "_seekable", "_didModify", "_writecheck",
+    "start_dir", "filelist", "NameToInfo",
+)
+# zipfile2.ZipFile internals used to keep its duplicate names check
+_ZIPFILE2_INTERNALS = (
+    "_normalize_arcname", "_ensure_uniqueness", "_filenames_set",
+)
+
+
+def _iter_raw_data(source, zinfo, block_size=_BLOCK_SIZE):
+    """ Yield the compressed data of the given member, in chunks of at most
+    block_size bytes.
+
+    Parameters
+    ----------
+    source: ZipFile
+        The archive to read from, opened in read mode.
+    zinfo: ZipInfo
+        The member to read.
+    """
+    fp = source.fp
+    fp.seek(zinfo.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    if len(header) != zipfile.sizeFileHeader:
+        raise zipfile.BadZipFile("Truncated file header")
+    fields = struct.unpack(zipfile.structFileHeader, header)
+    if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile("Bad magic number for file header")
+    fp.seek(
+        fields[zipfile._FH_FILENAME_LENGTH]
+        + fields[zipfile._FH_EXTRA_FIELD_LENGTH],
+        1
+    )
+
+    remaining = zinfo.compress_size
+    while remaining > 0:
+        data = fp.read(min(block_size, remaining))
+        if not data:
+            raise EOFError(
+                "Truncated data for member {0!r}".format(zinfo.filename))
+        remaining -= len(data)
+        yield data
+
+
+def _read_leading_members(fp, names):
+    """ Read the given members by streaming local file headers from the
+    start of the archive, without parsing the central directory.
+
+    This only succeeds if the archive starts with those members, in any
+    order, as written by the egg builders.
+
+    Parameters
+    ----------
+    fp: file object
+        The archive, opened for reading in binary mode, positioned at its
+        start.
+    names: iterable
+        The archive names of the members to read.
+
+    Returns
+    -------
+    members: dict or None
+        A mapping from archive name to uncompressed content, or None if the
+        archive does not start with exactly those members, or if they are
+        stored in a way this reader does not support (zip64, data
+        descriptors, encryption, compression other than deflate). Callers
+        are expected to fall back to ZipFile then.
+    """
+    names = set(names)
+    members = {}
+    while len(members) < len(names):
+        header = fp.read(zipfile.sizeFileHeader)
+        if len(header) != zipfile.sizeFileHeader:
+            return None
+        fields = struct.unpack(zipfile.structFileHeader, header)
+        if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            return None
+
+        flag_bits = fields[zipfile._FH_GENERAL_PURPOSE_FLAG_BITS]
+        compress_size = fields[zipfile._FH_COMPRESSED_SIZE]
+        filename = fp.read(fields[zipfile._FH_FILENAME_LENGTH])
+        if flag_bits & _MASK_UTF_FILENAME:
+            filename = filename.decode("utf-8")
+        else:
+            filename = filename.decode("cp437")
+
+        if filename not in names or filename in members:
+            return None
+        if flag_bits & (_MASK_ENCRYPTED | _MASK_USE_DATA_DESCRIPTOR):
+            return None
+        if compress_size == 0xFFFFFFFF:
+            return None
+
+        fp.seek(fields[zipfile._FH_EXTRA_FIELD_LENGTH], 1)
+        data = fp.read(compress_size)
+        if len(data) != compress_size:
+            return None
+
+        compress_type = fields[zipfile._FH_COMPRESSION_METHOD]
+        if compress_type == zipfile.ZIP_DEFLATED:
+            try:
+                data = zlib.decompress(data, -15)
+            except zlib.error:
+                return None
+        elif compress_type != zipfile.ZIP_STORED:
+            return None
+
+        if (len(data) != fields[zipfile._FH_UNCOMPRESSED_SIZE]
+                or zlib.crc32(data) != fields[zipfile._FH_CRC]):
+            return None
+        members[filename] = data
+
+    return members
+
+
+def _deflate_file(path, arcname, max_in_memory_size=_MAX_IN_MEMORY_SIZE):
+    """ Compress the given file exactly as ZipFile.write would with
+    ZIP_DEFLATED, so that the compression may be done outside the archive,
+    e.g. in a worker thread.
+
+    Returns
+    -------
+    zinfo: ZipInfo
+        The ZipInfo of the member, with CRC and sizes set.
+    data: file object
+        File object holding the compressed data, positioned at the start.
+        The caller is responsible for closing it.
+    zip64: bool
+        Whether ZipFile.write would have written zip64 extensions.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.flag_bits = 0
+    zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+    )
+    crc = file_size = compress_size = 0
+
+    data = tempfile.SpooledTemporaryFile(max_size=max_in_memory_size)
+    try:
+        with open(path, "rb") as fp:
+            while True:
+                chunk = fp.read(_WRITE_BLOCK_SIZE)
+                if not chunk:
+                    break
+                file_size += len(chunk)
+                crc = zlib.crc32(chunk, crc)
+                chunk = compressor.compress(chunk)
+                compress_size += len(chunk)
+                data.write(chunk)
+        chunk = compressor.flush()
+        compress_size += len(chunk)
+        data.write(chunk)
+        data.seek(0)
+    except BaseException:
+        data.close()
+        raise
+
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = compress_size
+    return zinfo, data, zip64
+
+
+def _iter_file(fp, block_size=_BLOCK_SIZE):
+    return iter(lambda: fp.read(block_size), b"")
+
+
+def _raw_zip_info(zinfo, arcname):
+    """ Returns a copy of the given member's ZipInfo suitable to write its
+    compressed data as is under the given archive name.
+    """
+    new_info = zipfile.ZipInfo(arcname, zinfo.date_time)
+    new_info.compress_type = zinfo.compress_type
+    new_info.comment = zinfo.comment
+    new_info.create_system = zinfo.create_system
+    new_info.internal_attr = zinfo.internal_attr
+    new_info.external_attr = zinfo.external_attr
+    new_info.flag_bits = zinfo.flag_bits & ~(
+        _MASK_USE_DATA_DESCRIPTOR | _MASK_UTF_FILENAME
+    )
+    new_info.CRC = zinfo.CRC
+    new_info.compress_size = zinfo.compress_size
+    new_info.file_size = zinfo.file_size
+    return new_info
+
+
+def _write_raw_member(target, zinfo, chunks, zip64=False):
+    """ Write already compressed data in the given archive.
+
+    Parameters
+    ----------
+    target: ZipFile
+        The archive to write to, opened in write or append mode.
+    zinfo: ZipInfo
+        The member to write. Its CRC, compress_size, file_size and
+        compress_type must describe the data.
+    chunks: iterable
+        Iterable of bytes, the compressed data.
+    zip64: bool
+        If True, write zip64 extensions even if the member is small enough
+        not to need them.
+    """
+    zip64 = (
+        zip64
+        or zinfo.file_size > zipfile.ZIP64_LIMIT
+        or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    )
+    with target._lock:
+        if target._writing:
+            raise ValueError(
+                "Can't write to the ZIP file while there is another write "
+                "handle open on it."
+            )
+        if target._seekable:
+            target.fp.seek(target.start_dir)
+        zinfo.header_offset = target.fp.tell()
+        target._writecheck(zinfo)
+        target._didModify = True
+
+        target.fp.write(zinfo.FileHeader(zip64))
+        written = 0
+        for chunk in chunks:
+            target.fp.write(chunk)
+            written += len(chunk)
+        if written != zinfo.compress_size:
+            raise ValueError(
+                "Expected {0} bytes of compressed data for {1!r}, got {2}"
+                .format(zinfo.compress_size, zinfo.filename, written))
+
+        target.start_dir = target.fp.tell()
+        target.filelist.append(zinfo)
+        target.NameToInfo[zinfo.filename] = zinfo
+
+
+def _supports_raw_members(target):
+    """ Returns True if the zipfile and zipfile2 internals used to add raw
+    members are available on the given archive.
+
+    Parameters
+    ----------
+    target: zipfile2.ZipFile
+        The archive to write to, opened in write or append mode.
+    """
+    return all(
+        hasattr(target, name)
+        for name in _ZIPFILE_INTERNALS + _ZIPFILE2_INTERNALS
+    )
+
+
+def _normalize_arcname(target, arcname):
+    """ Returns the given archive name as zipfile2.ZipFile.write would store
+    it.
+    """
+    return target._normalize_arcname(arcname)
+
+
+def _add_raw_member(target, zinfo, chunks, zip64=False):
+    """ Same as _write_raw_member, for a zipfile2.ZipFile archive, whose
+    duplicate names check is kept up to date.
+    """
+    target._ensure_uniqueness(zinfo.filename)
+    _write_raw_member(target, zinfo, chunks, zip64)
+    target._filenames_set.add(zinfo.filename)
+
+
+def _add_member_from_file(target, zinfo, fp):
+    """ Compress the content of the given file object as the given member of
+    a zipfile2.ZipFile archive, keeping its duplicate names check up to
+    date.
+    """
+    target._ensure_uniqueness(zinfo.filename)
+    with target.open(zinfo, "w") as target_fp:
+        shutil.copyfileobj(fp, target_fp)
+    target._filenames_set.add(zinfo.filename)
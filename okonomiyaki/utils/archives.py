@@ -0,0 +1,444 @@
+import array
+import collections
+import contextlib
+import mmap
+import os
+import struct
+import threading
+import zipfile
+import zlib
+
+
+# Maximum size of the end of central directory record, comment included.
+_MAX_END_RECORD_SIZE = zipfile.sizeEndCentDir + 2 ** 16 - 1
+_MAX_32_BITS = 0xFFFFFFFF
+_ZIP64_EXTRA_ID = 0x0001
+_MASK_ENCRYPTED = 0x01
+
+
+class ArchiveView(object):
+    """ A read-only, memory-mapped view of a zip archive, optimized for
+    repeated member lookups.
+
+    The central directory is only parsed on first access, into compact
+    arrays of offsets and sizes, plus a dictionary from archive names to
+    indices in those arrays. Stored members can be accessed as memoryview
+    slices of the mapped file, without any copy.
+
+    Instances may be used in place of a ZipFile by the file_formats readers,
+    e.g. EggMetadata.from_egg or PackageInfo.from_egg.
+
+    Example::
+
+        with ArchiveView("numpy-1.9.2-1.egg") as view:
+            metadata = EggMetadata.from_egg(view)
+            data = view.read("EGG-INFO/spec/depend")
+
+    Parameters
+    ----------
+    filename: str
+        The path to the archive.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+
+        self.fp = open(filename, "rb")
+        try:
+            self._mmap = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            self.fp.close()
+            raise zipfile.BadZipFile("File is not a zip file")
+
+        self._indices = None
+        self._header_offsets = None
+        self._compress_sizes = None
+        self._file_sizes = None
+        self._crcs = None
+        self._compress_types = None
+        self._flag_bits = None
+
+    # Public API
+    def namelist(self):
+        """ Return the list of archive names, in central directory order."""
+        return list(self._get_indices())
+
+    def read(self, name):
+        """ Return the uncompressed content of the given member, as bytes.
+
+        Raises KeyError if there is no such member, as ZipFile.read.
+        """
+        index = self._get_index(name)
+        data = self._uncompressed_data(index)
+        if not isinstance(data, bytes):
+            data = data.tobytes()
+        if zlib.crc32(data) != self._crcs[index]:
+            raise zipfile.BadZipFile("Bad CRC-32 for file {0!r}".format(name))
+        return data
+
+    def view(self, name):
+        """ Return the uncompressed content of the given member.
+
+        For stored members, this is a memoryview of the mapped archive, and
+        no data is copied or checked. Compressed members are decompressed
+        and returned as bytes. Memoryviews must be released before the view
+        is closed for the underlying memory map to be released.
+        """
+        return self._uncompressed_data(self._get_index(name))
+
+    def getsize(self, name):
+        """ Return the uncompressed size of the given member."""
+        index = self._get_index(name)
+        return self._file_sizes[index]
+
+    def close(self):
+        mm, self._mmap = self._mmap, None
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                # Memoryviews are still alive, the map will be released with
+                # the last of them.
+                pass
+        self.fp.close()
+
+    # Protocol implementations
+    def __contains__(self, name):
+        return name in self._get_indices()
+
+    def __len__(self):
+        return len(self._get_indices())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a, **kw):
+        self.close()
+
+    # Private methods
+    def _get_index(self, name):
+        return self._get_indices()[name]
+
+    def _get_indices(self):
+        if self._indices is None:
+            self._parse_central_directory()
+        return self._indices
+
+    def _uncompressed_data(self, index):
+        if self._mmap is None:
+            raise ValueError("I/O operation on closed archive view")
+        if self._flag_bits[index] & _MASK_ENCRYPTED:
+            raise RuntimeError("Encrypted members are not supported")
+
+        start = self._data_offset(index)
+        end = start + self._compress_sizes[index]
+        if end > len(self._mmap):
+            raise zipfile.BadZipFile("Truncated member data")
+
+        compress_type = self._compress_types[index]
+        if compress_type == zipfile.ZIP_STORED:
+            return memoryview(self._mmap)[start:end]
+        elif compress_type == zipfile.ZIP_DEFLATED:
+            return zlib.decompress(self._mmap[start:end], -15)
+        else:
+            decompressor = zipfile._get_decompressor(compress_type)
+            return decompressor.decompress(self._mmap[start:end])
+
+    def _data_offset(self, index):
+        header_offset = self._header_offsets[index]
+        header = self._mmap[header_offset:header_offset + zipfile.sizeFileHeader]
+        if len(header) != zipfile.sizeFileHeader:
+            raise zipfile.BadZipFile("Truncated file header")
+        fields = struct.unpack(zipfile.structFileHeader, header)
+        if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile("Bad magic number for file header")
+        return (
+            header_offset + zipfile.sizeFileHeader
+            + fields[zipfile._FH_FILENAME_LENGTH]
+            + fields[zipfile._FH_EXTRA_FIELD_LENGTH]
+        )
+
+    def _find_central_directory(self):
+        """ Returns (offset of the central directory, its size, number of
+        entries, offset of the archive start in the file).
+        """
+        mm = self._mmap
+        size = len(mm)
+        end_offset = mm.rfind(
+            zipfile.stringEndArchive, max(0, size - _MAX_END_RECORD_SIZE)
+        )
+        if end_offset < 0 or end_offset + zipfile.sizeEndCentDir > size:
+            raise zipfile.BadZipFile("File is not a zip file")
+
+        end_record = struct.unpack(
+            zipfile.structEndArchive,
+            mm[end_offset:end_offset + zipfile.sizeEndCentDir]
+        )
+        count = end_record[zipfile._ECD_ENTRIES_TOTAL]
+        cd_size = end_record[zipfile._ECD_SIZE]
+        cd_offset = end_record[zipfile._ECD_OFFSET]
+        record_offset = end_offset
+
+        locator_offset = end_offset - zipfile.sizeEndCentDir64Locator
+        if (locator_offset >= 0
+                and mm[locator_offset:locator_offset + 4]
+                == zipfile.stringEndArchive64Locator):
+            record_offset = locator_offset - zipfile.sizeEndCentDir64
+            if record_offset < 0:
+                raise zipfile.BadZipFile("Truncated zip64 end record")
+            end_record64 = struct.unpack(
+                zipfile.structEndArchive64,
+                mm[record_offset:locator_offset]
+            )
+            if end_record64[0] != zipfile.stringEndArchive64:
+                raise zipfile.BadZipFile("Bad zip64 end record")
+            count, cd_size, cd_offset = end_record64[7:10]
+
+        # Data prepended to the archive, e.g. self-extracting archives
+        concat = record_offset - cd_size - cd_offset
+        if concat < 0:
+            raise zipfile.BadZipFile("Bad offset for central directory")
+        return cd_offset + concat, cd_size, count, concat
+
+    def _parse_central_directory(self):
+        if self._mmap is None:
+            raise ValueError("I/O operation on closed archive view")
+        mm = self._mmap
+        cd_offset, cd_size, count, concat = self._find_central_directory()
+
+        indices = {}
+        header_offsets = array.array("Q")
+        compress_sizes = array.array("Q")
+        file_sizes = array.array("Q")
+        crcs = array.array("L")
+        compress_types = array.array("H")
+        flag_bits = array.array("H")
+
+        offset = cd_offset
+        end = cd_offset + cd_size
+        while offset < end:
+            fields = struct.unpack(
+                zipfile.structCentralDir,
+                mm[offset:offset + zipfile.sizeCentralDir]
+            )
+            if fields[zipfile._CD_SIGNATURE] != zipfile.stringCentralDir:
+                raise zipfile.BadZipFile("Bad magic number for central directory")
+            offset += zipfile.sizeCentralDir
+
+            filename_length = fields[zipfile._CD_FILENAME_LENGTH]
+            extra_length = fields[zipfile._CD_EXTRA_FIELD_LENGTH]
+            filename = mm[offset:offset + filename_length]
+            offset += filename_length
+            extra = mm[offset:offset + extra_length]
+            offset += extra_length + fields[zipfile._CD_COMMENT_LENGTH]
+
+            flags = fields[zipfile._CD_FLAG_BITS]
+            if flags & 0x800:
+                filename = filename.decode("utf-8")
+            else:
+                filename = filename.decode("cp437")
+
+            file_size = fields[zipfile._CD_UNCOMPRESSED_SIZE]
+            compress_size = fields[zipfile._CD_COMPRESSED_SIZE]
+            header_offset = fields[zipfile._CD_LOCAL_HEADER_OFFSET]
+            if _MAX_32_BITS in (file_size, compress_size, header_offset):
+                file_size, compress_size, header_offset = _parse_zip64_extra(
+                    extra, file_size, compress_size, header_offset
+                )
+
+            indices[filename] = len(header_offsets)
+            header_offsets.append(header_offset + concat)
+            compress_sizes.append(compress_size)
+            file_sizes.append(file_size)
+            crcs.append(fields[zipfile._CD_CRC])
+            compress_types.append(fields[zipfile._CD_COMPRESS_TYPE])
+            flag_bits.append(flags)
+
+        if len(header_offsets) != count:
+            raise zipfile.BadZipFile(
+                "Expected {0} central directory entries, found {1}"
+                .format(count, len(header_offsets)))
+
+        self._header_offsets = header_offsets
+        self._compress_sizes = compress_sizes
+        self._file_sizes = file_sizes
+        self._crcs = crcs
+        self._compress_types = compress_types
+        self._flag_bits = flag_bits
+        self._indices = indices
+
+
+def _parse_zip64_extra(extra, file_size, compress_size, header_offset):
+    """ Returns the actual (file_size, compress_size, header_offset) given
+    the zip64 extra field of a central directory entry.
+    """
+    while len(extra) >= 4:
+        extra_id, length = struct.unpack("<HH", extra[:4])
+        if extra_id == _ZIP64_EXTRA_ID:
+            values = list(
+                struct.unpack("<{0}Q".format(length // 8), extra[4:4 + length])
+            )
+            try:
+                if file_size == _MAX_32_BITS:
+                    file_size = values.pop(0)
+                if compress_size == _MAX_32_BITS:
+                    compress_size = values.pop(0)
+                if header_offset == _MAX_32_BITS:
+                    header_offset = values.pop(0)
+            except IndexError:
+                break
+            return file_size, compress_size, header_offset
+        extra = extra[4 + length:]
+    raise zipfile.BadZipFile("Corrupt zip64 extra field")
+
+
+class _PoolEntry(object):
+    def __init__(self, archive):
+        self.archive = archive
+        self.users = 0
+        self.evicted = False
+
+
+class ArchivePool(object):
+    """ A bounded LRU of open zip archives, keyed by path and stat.
+
+    While a pool is active, i.e. within its with block, the metadata readers
+    (EggMetadata.from_egg, PackageInfo.from_egg, PackageInfo.from_wheel,
+    LegacySpecDepend.from_egg, runtime_metadata_factory, ...) get their
+    archives from it instead of opening and closing them on each call.
+    Archives modified on disk are reopened.
+
+    The pool is thread-safe, and an active pool is shared by every thread,
+    so that concurrent workers reuse the same handles. Archives in use are
+    only closed once released.
+
+    Example::
+
+        with ArchivePool(max_size=64):
+            metadata = EggMetadata.from_egg(path)
+            pkg_info = PackageInfo.from_egg(path)  # reuses the handle
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum number of archives kept open.
+    """
+    def __init__(self, max_size=32):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def open(self, path):
+        """ Context manager returning an open ZipFile for the given path,
+        reusing an already open one if possible.
+        """
+        entry = self._acquire(path)
+        try:
+            yield entry.archive
+        finally:
+            self._release(entry)
+
+    def close(self):
+        """ Close every archive not in use, the others being closed when
+        released."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                self._evict(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __enter__(self):
+        with _ACTIVE_POOLS_LOCK:
+            _ACTIVE_POOLS.append(self)
+        return self
+
+    def __exit__(self, *a, **kw):
+        with _ACTIVE_POOLS_LOCK:
+            _ACTIVE_POOLS.remove(self)
+        self.close()
+
+    def _acquire(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime_ns, st.st_ino)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.users += 1
+                return entry
+
+        # Opening parses the central directory, so do it without holding
+        # the lock
+        archive = _open_zipfile(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Forget older versions of the same archive
+                for other_key in list(self._entries):
+                    if other_key[0] == path:
+                        self._evict(self._entries.pop(other_key))
+                entry = self._entries[key] = _PoolEntry(archive)
+                while len(self._entries) > self.max_size:
+                    _, oldest = self._entries.popitem(last=False)
+                    self._evict(oldest)
+            else:
+                # Another thread opened it in the meantime
+                archive.close()
+                self._entries.move_to_end(key)
+            entry.users += 1
+            return entry
+
+    def _release(self, entry):
+        with self._lock:
+            entry.users -= 1
+            if entry.evicted and entry.users == 0:
+                entry.archive.close()
+
+    def _evict(self, entry):
+        # Must be called with the lock held
+        entry.evicted = True
+        if entry.users == 0:
+            entry.archive.close()
+
+
+# Stack of active pools, shared by all threads
+_ACTIVE_POOLS = []
+_ACTIVE_POOLS_LOCK = threading.Lock()
+
+
+def _active_archive_pool():
+    """ Returns the innermost active ArchivePool, or None."""
+    with _ACTIVE_POOLS_LOCK:
+        if len(_ACTIVE_POOLS) > 0:
+            return _ACTIVE_POOLS[-1]
+        else:
+            return None
+
+
+def _open_zipfile(path):
+    # zipfile2 is only required by the file formats
+    import zipfile2
+    return zipfile2.ZipFile(path)
+
+
+@contextlib.contextmanager
+def _open_archive(path):
+    """ Context manager returning an open ZipFile for the given path, taken
+    from the active ArchivePool if any.
+    """
+    pool = _active_archive_pool()
+    if pool is None:
+        with _open_zipfile(path) as archive:
+            yield archive
+    else:
+        with pool.open(path) as archive:
+            yield archive
@@ -1,5 +1,6 @@
 import ast
 import contextlib
+import keyword
 import re
 import shutil
 import string
@@ -37,6 +38,80 @@ class _AssignmentParser(ast.NodeVisitor):
                 self._data[target.id] = value
 
 
+_SIMPLE_STRING = r"""(?:'[^'\\\r\n\0]*'|"[^"\\\r\n\0]*")"""
+
+# Blank or comment-only line
+_BLANK_LINE_RE = re.compile(r"[ \t]*(?:\#[^\r\n]*)?(?:\n|\Z)")
+
+# The restricted subset of python used by spec/depend and similar files: one
+# assignment per line, whose value is a string without escapes, a decimal
+# integer, None/True/False, or a (possibly multi-line) list of such strings.
+_SIMPLE_ASSIGNMENT_RE = re.compile(r"""
+    (?P<name>[A-Za-z_][A-Za-z0-9_]*) [ \t]* = [ \t]*
+    (?:
+        (?P<string>{string})
+      | (?P<integer>0|[1-9][0-9]*)
+      | (?P<constant>None|True|False)
+      | \[ (?P<list>
+            (?:[ \t\n]* {string} [ \t\n]* ,)*
+            [ \t\n]* (?:{string} [ \t\n]*)?
+        ) \]
+    )
+    [ \t]* (?:\#[^\r\n]*)? (?:\n|\Z)
+""".format(string=_SIMPLE_STRING), re.VERBOSE)
+
+_SIMPLE_STRING_RE = re.compile(_SIMPLE_STRING)
+
+_CONSTANTS = {"None": None, "True": True, "False": False}
+
+
+def _parse_simple_assignments(s):
+    """ Parse the given string if it only contains simple assignments (see
+    _SIMPLE_ASSIGNMENT_RE), without going through the python parser.
+
+    Returns None for anything else, in which case the caller should fall back
+    to _AssignmentParser.
+    """
+    data = {}
+    position = 0
+    end = len(s)
+    while position < end:
+        m = _BLANK_LINE_RE.match(s, position)
+        if m is not None and m.end() > position:
+            position = m.end()
+            continue
+
+        m = _SIMPLE_ASSIGNMENT_RE.match(s, position)
+        if m is None:
+            return None
+
+        name = m.group("name")
+        if keyword.iskeyword(name):
+            return None
+
+        if m.group("string") is not None:
+            value = m.group("string")[1:-1]
+        elif m.group("integer") is not None:
+            value = int(m.group("integer"))
+        elif m.group("constant") is not None:
+            value = _CONSTANTS[m.group("constant")]
+        else:
+            value = [
+                item[1:-1]
+                for item in _SIMPLE_STRING_RE.findall(m.group("list"))
+            ]
+        data[name] = value
+        position = m.end()
+    return data
+
+
+def _parse_assignments_string(s):
+    data = _parse_simple_assignments(s)
+    if data is None:
+        data = _AssignmentParser().parse(s)
+    return data
+
+
 def parse_assignments(file_or_filename):
     """
     Parse files which contain only python assignements, and returns the
@@ -49,9 +124,9 @@ def parse_assignments(file_or_filename):
     """
     if isinstance(file_or_filename, str):
         with open(file_or_filename) as fp:
-            return _AssignmentParser().parse(fp.read())
+            return _parse_assignments_string(fp.read())
     else:
-        return _AssignmentParser().parse(file_or_filename.read())
+        return _parse_assignments_string(file_or_filename.read())
 
 
 @contextlib.contextmanager
@@ -1,9 +1,32 @@
+import functools
+
 from okonomiyaki.errors import OkonomiyakiError
 
 
+def _clear_host_snapshot():
+    from okonomiyaki.platforms._host import clear_host_snapshot
+    clear_host_snapshot()
+
+
+def _with_fresh_host_snapshot(func):
+    """ Decorate func so that the running system is probed again within it,
+    as patchers typically mock the running system.
+    """
+    @functools.wraps(func)
+    def wrapper(*a, **kw):
+        _clear_host_snapshot()
+        try:
+            return func(*a, **kw)
+        finally:
+            _clear_host_snapshot()
+    return wrapper
+
+
 class Patcher(object):
     """ A dumb class to allow a mock.patch object to be used as a decorator and
-    a context manager
+    a context manager. The snapshot of the running system is cleared when
+    entering and exiting the patcher, see
+    okonomiyaki.platforms.clear_host_snapshot.
 
     Typical usage::
 
@@ -24,13 +47,18 @@ class Patcher(object):
         self._patcher = patcher
 
     def __call__(self, func):
-        return self._patcher(func)
+        return self._patcher(_with_fresh_host_snapshot(func))
 
     def __enter__(self):
-        return self._patcher.__enter__()
+        ret = self._patcher.__enter__()
+        _clear_host_snapshot()
+        return ret
 
     def __exit__(self, *a, **kw):
-        return self._patcher.__exit__(*a, **kw)
+        try:
+            return self._patcher.__exit__(*a, **kw)
+        finally:
+            _clear_host_snapshot()
 
 
 class MultiPatcher(object):
@@ -40,17 +68,22 @@ class MultiPatcher(object):
         self._patchers = patchers
 
     def __call__(self, func):
-        ret = func
+        ret = _with_fresh_host_snapshot(func)
         for patcher in self._patchers:
             ret = patcher(ret)
         return ret
 
     def __enter__(self):
-        return [patcher.__enter__() for patcher in self._patchers]
+        ret = [patcher.__enter__() for patcher in self._patchers]
+        _clear_host_snapshot()
+        return ret
 
     def __exit__(self, *a, **kw):
-        for patcher in self._patchers:
-            patcher.__exit__(*a, **kw)
+        try:
+            for patcher in self._patchers:
+                patcher.__exit__(*a, **kw)
+        finally:
+            _clear_host_snapshot()
 
 
 def known_system():
@@ -0,0 +1,330 @@
+import concurrent.futures
+import glob
+import os
+import os.path
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import zipfile2
+
+from okonomiyaki.file_formats import EggMetadata, PackageInfo
+from okonomiyaki.file_formats._egg_info import LegacySpecDepend
+from okonomiyaki.file_formats.tests.common import (
+    DATA_EGGS, MKL_EGG, SETUPTOOLS_75_8_0_WHL, TRAITS_SETUPTOOLS_EGG)
+from okonomiyaki.runtimes.runtime_metadata import runtime_metadata_factory
+from okonomiyaki.utils.test_data import (
+    NOSE_1_3_4_RH5_X86_64, PYTHON_CPYTHON_2_7_10_RH5_X86_64)
+
+from ..archives import ArchivePool, ArchiveView, _active_archive_pool
+
+
+class TestArchiveView(unittest.TestCase):
+    def setUp(self):
+        self.prefix = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.prefix)
+
+    def assertSameContent(self, path):
+        with zipfile.ZipFile(path) as zp:
+            with ArchiveView(path) as view:
+                self.assertEqual(view.namelist(), zp.namelist())
+                self.assertEqual(len(view), len(zp.namelist()))
+                for zinfo in zp.infolist():
+                    self.assertIn(zinfo.filename, view)
+                    self.assertEqual(
+                        view.read(zinfo.filename), zp.read(zinfo))
+                    self.assertEqual(
+                        view.getsize(zinfo.filename), zinfo.file_size)
+
+    def test_same_as_zipfile(self):
+        for path in sorted(glob.glob(os.path.join(DATA_EGGS, "*.egg"))):
+            self.assertSameContent(path)
+        self.assertSameContent(SETUPTOOLS_75_8_0_WHL)
+
+    def test_getsize_first_access(self):
+        # Given
+        with zipfile.ZipFile(MKL_EGG) as zp:
+            zinfo = zp.getinfo("EGG-INFO/spec/depend")
+
+        # When
+        with ArchiveView(MKL_EGG) as view:
+            size = view.getsize("EGG-INFO/spec/depend")
+
+        # Then
+        self.assertEqual(size, zinfo.file_size)
+
+    def test_missing_member(self):
+        # Given
+        with ArchiveView(TRAITS_SETUPTOOLS_EGG) as view:
+            # When/Then
+            with self.assertRaises(KeyError):
+                view.read("EGG-INFO/spec/depend")
+            self.assertNotIn("EGG-INFO/spec/depend", view)
+
+    def test_view_stored(self):
+        # Given
+        path = os.path.join(self.prefix, "stored.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zp:
+            zp.writestr("data", b"some data")
+            zp.writestr("compressed", b"a" * 1000, zipfile.ZIP_DEFLATED)
+
+        # When
+        with ArchiveView(path) as view:
+            data = view.view("data")
+            compressed = view.view("compressed")
+
+            # Then
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(data.tobytes(), b"some data")
+            self.assertEqual(compressed, b"a" * 1000)
+            data.release()
+
+    def test_close_with_live_memoryview(self):
+        # Given
+        path = os.path.join(self.prefix, "stored.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zp:
+            zp.writestr("data", b"some data")
+
+        view = ArchiveView(path)
+        data = view.view("data")
+
+        # When
+        view.close()
+
+        # Then
+        self.assertEqual(data.tobytes(), b"some data")
+        with self.assertRaises(ValueError):
+            view.read("data")
+
+    def test_zip64(self):
+        # Given
+        path = os.path.join(self.prefix, "zip64.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zp:
+            with zp.open("big", "w", force_zip64=True) as fp:
+                fp.write(b"b" * 100)
+            zp.writestr("small", b"s")
+
+        # When/Then
+        self.assertSameContent(path)
+
+    def test_prepended_data(self):
+        # Given
+        path = os.path.join(self.prefix, "prepended.zip")
+        with open(path, "wb") as target:
+            target.write(b"#!/bin/sh\nexit 0\n")
+            with open(TRAITS_SETUPTOOLS_EGG, "rb") as source:
+                shutil.copyfileobj(source, target)
+
+        # When/Then
+        self.assertSameContent(path)
+
+    def test_corrupted_crc(self):
+        # Given
+        path = os.path.join(self.prefix, "corrupted.zip")
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zp:
+            zp.writestr("data", b"some data")
+        with open(path, "r+b") as fp:
+            content = fp.read()
+            fp.seek(content.index(b"some data"))
+            fp.write(b"SOME")
+
+        # When/Then
+        with ArchiveView(path) as view:
+            with self.assertRaises(zipfile.BadZipFile):
+                view.read("data")
+
+    def test_not_a_zip(self):
+        for content in (b"", b"not a zip file"):
+            # Given
+            path = os.path.join(self.prefix, "invalid.zip")
+            with open(path, "wb") as fp:
+                fp.write(content)
+
+            # When/Then
+            with self.assertRaises(zipfile.BadZipFile):
+                with ArchiveView(path) as view:
+                    view.namelist()
+
+    def test_file_formats_readers(self):
+        # Given
+        egg = NOSE_1_3_4_RH5_X86_64
+
+        # When
+        with ArchiveView(egg) as view:
+            metadata = EggMetadata.from_egg(view)
+            spec_depend = LegacySpecDepend.from_egg(view)
+            pkg_info = PackageInfo.from_egg(view)
+
+        # Then
+        self.assertEqual(metadata, EggMetadata.from_egg(egg))
+        self.assertEqual(spec_depend, LegacySpecDepend.from_egg(egg))
+        self.assertEqual(pkg_info, PackageInfo.from_egg(egg))
+
+        # When
+        with ArchiveView(SETUPTOOLS_75_8_0_WHL) as view:
+            pkg_info = PackageInfo.from_wheel(view)
+
+        # Then
+        self.assertEqual(pkg_info, PackageInfo.from_wheel(SETUPTOOLS_75_8_0_WHL))
+
+
+class TestArchivePool(unittest.TestCase):
+    def setUp(self):
+        self.prefix = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.prefix)
+
+    def _read_all_metadata(self, egg):
+        return (
+            EggMetadata.from_egg(egg),
+            LegacySpecDepend.from_egg(egg),
+            PackageInfo.from_egg(egg),
+        )
+
+    def test_shared_handle(self):
+        # Given
+        egg = MKL_EGG
+        r_metadata = self._read_all_metadata(egg)
+
+        # When
+        with mock.patch("zipfile2.ZipFile", wraps=zipfile2.ZipFile) as m:
+            with ArchivePool():
+                metadata = self._read_all_metadata(egg)
+
+        # Then
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(metadata, r_metadata)
+
+        # When
+        with mock.patch("zipfile2.ZipFile", wraps=zipfile2.ZipFile) as m:
+            self._read_all_metadata(egg)
+
+        # Then
+        self.assertEqual(m.call_count, 3)
+
+    def test_runtime_metadata_factory(self):
+        # Given
+        path = PYTHON_CPYTHON_2_7_10_RH5_X86_64
+
+        # When
+        with mock.patch("zipfile2.ZipFile", wraps=zipfile2.ZipFile) as m:
+            with ArchivePool():
+                first = runtime_metadata_factory(path)
+                second = runtime_metadata_factory(path)
+
+        # Then
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_active(self):
+        # Given
+        pool = ArchivePool()
+
+        # When/Then
+        self.assertIsNone(_active_archive_pool())
+        with pool:
+            self.assertIs(_active_archive_pool(), pool)
+            with ArchivePool() as inner:
+                self.assertIs(_active_archive_pool(), inner)
+            self.assertIs(_active_archive_pool(), pool)
+        self.assertIsNone(_active_archive_pool())
+
+    def test_lru(self):
+        # Given
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.prefix, "egg{0}.egg".format(i))
+            shutil.copy(TRAITS_SETUPTOOLS_EGG, path)
+            paths.append(path)
+
+        with ArchivePool(max_size=2) as pool:
+            with pool.open(paths[0]) as first:
+                pass
+
+            # When
+            with pool.open(paths[1]):
+                pass
+            with pool.open(paths[0]) as archive:
+                self.assertIs(archive, first)
+            with pool.open(paths[2]):
+                pass
+
+            # Then
+            self.assertEqual(len(pool), 2)
+            with pool.open(paths[0]) as archive:
+                self.assertIs(archive, first)
+
+        self.assertEqual(len(pool), 0)
+        self.assertIsNone(first.fp)
+
+    def test_evicted_while_in_use(self):
+        # Given
+        paths = []
+        for i in range(2):
+            path = os.path.join(self.prefix, "egg{0}.egg".format(i))
+            shutil.copy(TRAITS_SETUPTOOLS_EGG, path)
+            paths.append(path)
+
+        with ArchivePool(max_size=1) as pool:
+            with pool.open(paths[0]) as first:
+                # When
+                with pool.open(paths[1]):
+                    pass
+
+                # Then
+                self.assertIsNotNone(first.fp)
+                first.read("EGG-INFO/PKG-INFO")
+
+            self.assertIsNone(first.fp)
+
+    def test_modified_archive(self):
+        # Given
+        path = os.path.join(self.prefix, os.path.basename(MKL_EGG))
+        shutil.copy(MKL_EGG, path)
+
+        with ArchivePool() as pool:
+            with pool.open(path) as first:
+                pass
+
+            # When
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+            with pool.open(path) as second:
+                pass
+
+            # Then
+            self.assertIsNot(second, first)
+            self.assertIsNone(first.fp)
+            self.assertEqual(len(pool), 1)
+
+    def test_threads(self):
+        # Given
+        egg = NOSE_1_3_4_RH5_X86_64
+        with zipfile2.ZipFile(egg) as zp:
+            r_contents = dict((name, zp.read(name)) for name in zp.namelist())
+
+        def read_all(pool):
+            with pool.open(egg) as archive:
+                return dict(
+                    (name, archive.read(name)) for name in archive.namelist()
+                )
+
+        # When
+        with mock.patch("zipfile2.ZipFile", wraps=zipfile2.ZipFile) as m:
+            with ArchivePool() as pool:
+                with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                    results = list(executor.map(read_all, [pool] * 50))
+
+        # Then
+        for contents in results:
+            self.assertEqual(contents, r_contents)
+        self.assertLessEqual(m.call_count, 8)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ArchivePool(max_size=0)
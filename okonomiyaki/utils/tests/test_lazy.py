@@ -0,0 +1,125 @@
+import subprocess
+import sys
+import textwrap
+import types
+import unittest
+from unittest import mock
+
+import okonomiyaki.file_formats
+import okonomiyaki.platforms
+import okonomiyaki.runtimes
+import okonomiyaki.utils
+import okonomiyaki.versions
+
+from .._lazy import lazy_attributes
+
+
+# Modules which are slow to import, and should only be imported when needed
+HEAVY_MODULES = ("attr", "distro", "jsonschema", "numpy", "zipfile2")
+
+
+def _imported_heavy_modules(code):
+    """ Runs the given code in a fresh interpreter, and returns the heavy
+    modules imported by it.
+    """
+    code = textwrap.dedent(code) + textwrap.dedent("""
+        import sys
+        print(" ".join(m for m in {0!r} if m in sys.modules))
+    """).format(HEAVY_MODULES)
+    process = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE,
+        universal_newlines=True, check=True,
+    )
+    return process.stdout.split()
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_package_import(self):
+        for package in (
+            "okonomiyaki.file_formats", "okonomiyaki.platforms",
+            "okonomiyaki.runtimes", "okonomiyaki.utils",
+            "okonomiyaki.versions",
+        ):
+            # When
+            modules = _imported_heavy_modules("import {0}".format(package))
+
+            # Then
+            self.assertEqual(modules, [], msg=package)
+
+    def test_deferred_dependencies(self):
+        # When
+        modules = _imported_heavy_modules("""\
+            from okonomiyaki.runtimes import IRuntimeMetadata
+            from okonomiyaki.versions import EnpkgVersion
+        """)
+
+        # Then
+        self.assertNotIn("jsonschema", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_exports(self):
+        for package in (
+            okonomiyaki.file_formats, okonomiyaki.platforms,
+            okonomiyaki.runtimes, okonomiyaki.utils, okonomiyaki.versions,
+        ):
+            for name in package._EXPORTS:
+                # When
+                value = getattr(package, name)
+
+                # Then
+                self.assertIs(vars(package)[name], value)
+                self.assertIn(name, dir(package))
+
+    def test_star_import(self):
+        # Given
+        namespace = {}
+
+        # When
+        exec("from okonomiyaki.file_formats import *", namespace)
+
+        # Then
+        self.assertIs(
+            namespace["EggMetadata"], okonomiyaki.file_formats.EggMetadata
+        )
+        self.assertTrue(
+            set(okonomiyaki.file_formats._EXPORTS).issubset(namespace)
+        )
+
+    def test_unknown_attribute(self):
+        # When/Then
+        with self.assertRaises(AttributeError):
+            okonomiyaki.file_formats.NotAnExport
+        self.assertFalse(hasattr(okonomiyaki.platforms, "NotAnExport"))
+
+
+class TestLazyAttributes(unittest.TestCase):
+    def setUp(self):
+        self.module = types.ModuleType("_okonomiyaki_lazy_dummy")
+        sys.modules[self.module.__name__] = self.module
+        self.loader = mock.Mock(return_value=42)
+
+    def tearDown(self):
+        del sys.modules[self.module.__name__]
+
+    def test_lazy(self):
+        # When
+        getattr_, dir_ = lazy_attributes(
+            self.module.__name__, {"ANSWER": self.loader})
+
+        # Then
+        self.loader.assert_not_called()
+        self.assertIn("ANSWER", dir_())
+        self.assertEqual(getattr_("ANSWER"), 42)
+        self.assertEqual(vars(self.module)["ANSWER"], 42)
+        self.loader.assert_called_once_with()
+        with self.assertRaises(AttributeError):
+            getattr_("QUESTION")
+
+    def test_eager_without_module_getattr(self):
+        # When
+        with mock.patch.object(sys, "version_info", (3, 6, 15)):
+            lazy_attributes(self.module.__name__, {"ANSWER": self.loader})
+
+        # Then
+        self.loader.assert_called_once_with()
+        self.assertEqual(self.module.ANSWER, 42)
@@ -3,7 +3,9 @@ import unittest
 from io import StringIO
 
 from okonomiyaki.errors import OkonomiyakiError
-from ..misc import parse_assignments, substitute_variables, substitute_variable
+from ..misc import (
+    _AssignmentParser, _parse_simple_assignments, parse_assignments,
+    substitute_variables, substitute_variable)
 
 
 class TestParseAssignments(unittest.TestCase):
@@ -22,6 +24,75 @@ class TestParseAssignments(unittest.TestCase):
         with self.assertRaises(OkonomiyakiError):
             parse_assignments(StringIO("1 + 2"))
 
+    def test_parse_spec_depend(self):
+        # Given
+        s = textwrap.dedent("""\
+        metadata_version = '1.3'
+        name = 'numpy'
+        version = '1.9.2'
+        build = 1
+
+        arch = 'amd64'
+        platform = 'linux2'
+        osdist = 'RedHat_5'
+        python = "2.7"  # comment
+
+        packages = [
+          'MKL 10.3-1',
+          "nose",
+        ]
+        empty = []
+        strict = False
+        """)
+        r_data = {
+            "metadata_version": "1.3", "name": "numpy", "version": "1.9.2",
+            "build": 1, "arch": "amd64", "platform": "linux2",
+            "osdist": "RedHat_5", "python": "2.7",
+            "packages": ["MKL 10.3-1", "nose"], "empty": [], "strict": False,
+        }
+
+        # When
+        data = _parse_simple_assignments(s)
+
+        # Then
+        self.assertEqual(data, r_data)
+        self.assertEqual(data, _AssignmentParser().parse(s))
+        self.assertEqual(parse_assignments(StringIO(s)), r_data)
+
+    def test_parse_fallback(self):
+        # Given
+        s = textwrap.dedent("""\
+        name = 'dummy' 'suffix'
+        escaped = 'a\\'b'
+        number = 1.5
+        packages = [1, u"nose"]
+        a = b = None
+        """)
+        r_data = {
+            "name": "dummysuffix", "escaped": "a'b", "number": 1.5,
+            "packages": [1, "nose"], "a": None, "b": None,
+        }
+
+        # When
+        data = parse_assignments(StringIO(s))
+
+        # Then
+        self.assertIsNone(_parse_simple_assignments(s))
+        self.assertEqual(data, r_data)
+
+    def test_parse_fallback_invalid(self):
+        # Given
+        invalid = [
+            "class = 1", "  name = 'dummy'", "build = 01", "packages = [,]",
+            "name = 'a\0b'",
+        ]
+
+        # When/Then
+        for s in invalid:
+            self.assertIsNone(_parse_simple_assignments(s))
+            with self.assertRaises(SyntaxError):
+                parse_assignments(StringIO(s))
+
 
 class TestSubstitute(unittest.TestCase):
     def test_simple(self):
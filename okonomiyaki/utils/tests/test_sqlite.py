@@ -0,0 +1,81 @@
+import multiprocessing
+import os.path
+import pickle
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from .._sqlite import SqliteCache
+
+
+class _Cache(SqliteCache):
+    _DATABASE_NAME = "dummy.sqlite"
+    _SCHEMA_VERSION = 2
+    _TABLE = "dummy"
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS dummy (key TEXT NOT NULL PRIMARY KEY)",
+    )
+
+    def add(self, key):
+        self._execute("INSERT OR IGNORE INTO dummy (key) VALUES (?)", (key,))
+        self._commit()
+
+
+def _add(directory, key):
+    with _Cache(directory) as cache:
+        cache.add(key)
+
+
+class TestSqliteCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tempdir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_simple(self):
+        # Given
+        with _Cache(self.directory) as cache:
+            cache.add("a")
+            cache.add("b")
+
+        # When
+        with _Cache(self.directory) as cache:
+            n = len(cache)
+            unpickled = pickle.loads(pickle.dumps(cache))
+            cache.clear()
+
+        # Then
+        self.assertEqual(n, 2)
+        self.assertIsNone(unpickled._connection)
+        self.assertEqual(len(unpickled), 0)
+        unpickled.close()
+
+    def test_schema_version_mismatch(self):
+        # Given
+        with _Cache(self.directory) as cache:
+            cache.add("a")
+        connection = sqlite3.connect(cache.path)
+        connection.execute("PRAGMA user_version = 1")
+        connection.close()
+
+        # When
+        with _Cache(self.directory) as cache:
+            n = len(cache)
+
+        # Then
+        self.assertEqual(n, 0)
+
+    def test_concurrent_creation(self):
+        # Given
+        keys = [str(i) for i in range(8)]
+
+        # When
+        with multiprocessing.Pool(4) as pool:
+            pool.starmap(_add, [(self.directory, key) for key in keys])
+
+        # Then
+        with _Cache(self.directory) as cache:
+            self.assertEqual(len(cache), len(keys))
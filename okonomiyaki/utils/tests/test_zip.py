@@ -0,0 +1,60 @@
+import os.path
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+import zipfile2
+
+from .._zip import (
+    _add_raw_member, _iter_raw_data, _raw_zip_info, _supports_raw_members)
+
+
+class TestZipInternals(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, "test.zip")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_internals(self):
+        # Given
+        names = (
+            "sizeFileHeader", "structFileHeader", "stringFileHeader",
+            "_FH_SIGNATURE", "_FH_GENERAL_PURPOSE_FLAG_BITS",
+            "_FH_COMPRESSION_METHOD", "_FH_CRC", "_FH_COMPRESSED_SIZE",
+            "_FH_UNCOMPRESSED_SIZE", "_FH_FILENAME_LENGTH",
+            "_FH_EXTRA_FIELD_LENGTH",
+        )
+
+        # When/Then
+        for name in names:
+            self.assertTrue(hasattr(zipfile, name), msg=name)
+        with zipfile2.ZipFile(self.path, "w") as zp:
+            self.assertTrue(_supports_raw_members(zp))
+
+    def test_add_raw_member(self):
+        # Given
+        source_path = os.path.join(self.tempdir, "source.zip")
+        with zipfile2.ZipFile(source_path, "w", zipfile.ZIP_DEFLATED) as zp:
+            zp.writestr("a", b"a" * 1000)
+
+        # When
+        with zipfile2.ZipFile(source_path) as source:
+            zinfo = source.getinfo("a")
+            with zipfile2.ZipFile(self.path, "w") as target:
+                _add_raw_member(
+                    target, _raw_zip_info(zinfo, "b"),
+                    _iter_raw_data(source, zinfo))
+
+                # Then
+                with self.assertRaises(ValueError):
+                    _add_raw_member(
+                        target, _raw_zip_info(zinfo, "b"),
+                        _iter_raw_data(source, zinfo))
+
+        with zipfile2.ZipFile(self.path) as zp:
+            self.assertIsNone(zp.testzip())
+            self.assertEqual(zp.namelist(), ["b"])
+            self.assertEqual(zp.read("b"), b"a" * 1000)
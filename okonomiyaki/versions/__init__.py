@@ -1,11 +1,24 @@
-from .enpkg import EnpkgVersion
-from .metadata_version import MetadataVersion
-from .pep386_workaround import PEP386WorkaroundVersion
-from .pep440 import PEP440Version
-from .runtime_version import RuntimeVersion
-from .semver import SemanticVersion
+from okonomiyaki.utils._lazy import lazy_exports
+
+# Public names are imported on first access, see okonomiyaki.utils._lazy. This
+# notably avoids importing numpy unless VersionArray is used.
+_EXPORTS = {
+    "EnpkgVersion": ".enpkg",
+    "max_version": ".enpkg",
+    "sorted_versions": ".enpkg",
+    "VersionInterner": ".interning",
+    "MetadataVersion": ".metadata_version",
+    "PEP386WorkaroundVersion": ".pep386_workaround",
+    "PEP440Version": ".pep440",
+    "RuntimeVersion": ".runtime_version",
+    "SemanticVersion": ".semver",
+    "VersionArray": ".version_array",
+}
 
 __all__ = [
     "EnpkgVersion", "MetadataVersion", "PEP386WorkaroundVersion",
-    "PEP440Version", "RuntimeVersion", "SemanticVersion"
+    "PEP440Version", "RuntimeVersion", "SemanticVersion", "VersionArray",
+    "VersionInterner", "max_version", "sorted_versions"
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,39 @@
+""" Flattening of nested comparison tuples into flat tuples of ints.
+
+The encoding is prefix-free, and preserves the ordering of the encoded
+values: for values a and b whose elements are only compared to elements of
+the same type, a < b if and only if _flatten(a) < _flatten(b).
+
+* a sequence is encoded as the encoding of each of its items, followed by
+  _END. As _END is smaller than any tag, a sequence sorts before any longer
+  sequence it is a prefix of.
+* each item is encoded as a tag followed by its payload: the integer itself
+  for ints, the code points of its characters (shifted by one, so that they
+  are never smaller than _END) followed by _END for strings, and the encoding
+  of the sequence for tuples.
+"""
+_END = 0
+_INT = 1
+_STR = 2
+_TUPLE = 3
+
+
+def _flatten(parts, key=None):
+    """ Return the flat encoding of the given sequence, appended to key if
+    given.
+    """
+    if key is None:
+        key = []
+    for part in parts:
+        if isinstance(part, int):
+            key.append(_INT)
+            key.append(part)
+        elif isinstance(part, str):
+            key.append(_STR)
+            key.extend(ord(c) + 1 for c in part)
+            key.append(_END)
+        else:
+            key.append(_TUPLE)
+            _flatten(part, key)
+    key.append(_END)
+    return key
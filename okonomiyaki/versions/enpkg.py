@@ -3,6 +3,8 @@ from .pep386_workaround import IrrationalVersionError, PEP386WorkaroundVersion
 
 
 class EnpkgVersion(object):
+    __slots__ = ("upstream", "build", "_parts", "_sort_key")
+
     @classmethod
     def from_upstream_and_build(cls, upstream, build):
         """ Creates a new EnpkgVersion from the upstream string and the
@@ -63,6 +65,18 @@ class EnpkgVersion(object):
         self.build = build
 
         self._parts = upstream, build
+        self._sort_key = None
+
+    @property
+    def sort_key(self):
+        """ A flat tuple of ints which orders exactly like this version, to
+        be used as a key for sorting large number of versions.
+
+        It is computed on first access, and cached.
+        """
+        if self._sort_key is None:
+            self._sort_key = self.upstream.sort_key + (self.build,)
+        return self._sort_key
 
     def __str__(self):
         return str(self.upstream) + "-" + str(self.build)
@@ -97,3 +111,24 @@ class EnpkgVersion(object):
 
     def __ge__(self, other):
         return not self.__lt__(other)
+
+
+def _sort_key(version):
+    return version.sort_key
+
+
+def sorted_versions(iterable, reverse=False):
+    """ Sort the given EnpkgVersion instances, using their sort_key.
+
+    This is equivalent to, but much faster than, sorted(iterable).
+    """
+    return sorted(iterable, key=_sort_key, reverse=reverse)
+
+
+def max_version(iterable):
+    """ Return the highest of the given EnpkgVersion instances, using their
+    sort_key.
+
+    Raises a ValueError if iterable is empty.
+    """
+    return max(iterable, key=_sort_key)
@@ -0,0 +1,43 @@
+from .enpkg import EnpkgVersion
+
+
+class VersionInterner(object):
+    """ A version factory which returns the same instance for equal version
+    strings.
+
+    Version objects are immutable, so sharing them is safe. This saves a lot
+    of memory when the same versions are parsed many times, e.g. when loading
+    the indexes of several repositories. Interned versions live as long as
+    the interner, or until clear is called.
+
+    Example::
+
+        interner = VersionInterner(EnpkgVersion)
+        assert interner.from_string("1.0-1") is interner.from_string("1.0-1")
+
+    Parameters
+    ----------
+    version_class: class
+        Any version class with a from_string class method, e.g.
+        EnpkgVersion, PEP440Version or SemanticVersion.
+    """
+    def __init__(self, version_class=EnpkgVersion):
+        self.version_class = version_class
+        self._versions = {}
+
+    def from_string(self, s):
+        """ Returns the version for the given string, creating it if this is
+        the first time it is seen.
+        """
+        try:
+            return self._versions[s]
+        except KeyError:
+            version = self._versions[s] = self.version_class.from_string(s)
+            return version
+
+    def clear(self):
+        """ Forget every interned version."""
+        self._versions.clear()
+
+    def __len__(self):
+        return len(self._versions)
@@ -177,10 +177,12 @@ class NormalizedVersion(object):
         # XXX This doesn't check for invalid tuples
         main, prerel, postdev = parts
         s = '.'.join(str(v) for v in main)
-        if prerel is not FINAL_MARKER:
+        # Compare by value, as unpickled parts do not share the marker
+        # instance
+        if prerel != FINAL_MARKER:
             s += prerel[0]
             s += '.'.join(str(v) for v in prerel[1:])
-        if postdev and postdev is not FINAL_MARKER:
+        if postdev and postdev != FINAL_MARKER:
             if postdev[0] == 'f':
                 postdev = postdev[1:]
             if postdev[-1] == 'f':
@@ -1,3 +1,4 @@
+from ._sort_key import _flatten
 from .pep386 import IrrationalVersionError, NormalizedVersion
 
 
@@ -12,6 +13,9 @@ class PEP386WorkaroundVersion(object):
         * exactly one of them is valid: the valid one is always considered
           to be greather than the invalid one
     """
+    __slots__ = (
+        "_parts", "_comparable_parts", "_is_worked_around", "_sort_key")
+
     @classmethod
     def from_string(cls, s):
         try:
@@ -42,15 +46,33 @@ class PEP386WorkaroundVersion(object):
                 # ?
                 prerel_parts = tuple(['`'] + list(prerel_parts[1:]))
 
-            comparable_parts = (tuple(numdot), prerel_parts, parts[2])
+            numdot = tuple(numdot)
+            if numdot == parts[0] and prerel_parts is parts[1]:
+                # Nothing to normalize: share the parts to save memory
+                comparable_parts = tuple(parts)
+            else:
+                comparable_parts = (numdot, prerel_parts, parts[2])
 
         self._comparable_parts = comparable_parts
         self._is_worked_around = is_worked_around
+        self._sort_key = None
 
     @property
     def is_worked_around(self):
         return self._is_worked_around
 
+    @property
+    def sort_key(self):
+        """ A flat tuple of ints which orders exactly like this version.
+
+        It is computed on first access, and cached.
+        """
+        if self._sort_key is None:
+            # Worked around versions sort before any PEP386 version
+            prefix = [0 if self._is_worked_around else 1]
+            self._sort_key = tuple(_flatten(self._comparable_parts, prefix))
+        return self._sort_key
+
     def __str__(self):
         if self._is_worked_around:
             return ".".join(self._parts)
@@ -13,6 +13,8 @@ PEP440_VERSION_RE = re.compile(r'^v?(\d+!)?(\d+(\.\d+)*)((a|b|rc)(\d+))?'
 
 
 class _Min(object):
+    __slots__ = ()
+
     def __hash__(self):
         return hash(self.__class__)
 
@@ -36,6 +38,8 @@ class _Min(object):
 
 
 class _Max(object):
+    __slots__ = ()
+
     def __hash__(self):
         return hash(self.__class__)
 
@@ -67,6 +71,9 @@ class PEP440Version(object):
 
     Note: replacements are not supported yet.
     """
+    __slots__ = (
+        "_release_clause", "_parts", "_normalized_string", "_string")
+
     @classmethod
     def from_string(cls, s):
         m = PEP440_VERSION_RE.match(s)
@@ -2,6 +2,8 @@ from .pep440 import PEP440Version
 
 
 class RuntimeVersion(object):
+    __slots__ = ("_pep440_version",)
+
     @classmethod
     def from_string(cls, s):
         return cls(PEP440Version.from_string(s))
@@ -36,6 +38,18 @@ class RuntimeVersion(object):
     def normalized_string(self):
         return self._pep440_version.normalized_string
 
+    @property
+    def sort_key(self):
+        """ A tuple which orders exactly like this version."""
+        return self._pep440_version._parts
+
+    @property
+    def upstream_sort_key(self):
+        """ A tuple which orders like this version without its local part,
+        i.e. without the runtime build number.
+        """
+        return self._pep440_version._parts[:5]
+
     @property
     def _nums(self):
         return self._pep440_version._parts[1]
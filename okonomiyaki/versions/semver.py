@@ -51,6 +51,8 @@ class _PrereleaseParts(object):
     """ Private class used to compare the pre release and build parts. We need
     this as an empty tuple need to compare greated than any non empty tuple.
     """
+    __slots__ = ("_comparable_parts",)
+
     def __init__(self, parts):
         self._comparable_parts = tuple(_convert_pre_release(p) for p in parts)
 
@@ -111,6 +113,10 @@ class SemanticVersion(object):
 
     This class takes care of parsing and comparing semver objects.
     """
+    __slots__ = (
+        "major", "minor", "patch", "pre_release", "build",
+        "_comparable_parts_value")
+
     @classmethod
     def from_string(cls, s):
         m = _SEMVER_R.match(s)
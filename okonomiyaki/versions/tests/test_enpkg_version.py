@@ -1,6 +1,7 @@
+import itertools
 import unittest
 
-from ..enpkg import EnpkgVersion
+from ..enpkg import EnpkgVersion, max_version, sorted_versions
 from ..pep386_workaround import PEP386WorkaroundVersion
 from okonomiyaki.errors import InvalidEnpkgVersion
 
@@ -172,3 +173,61 @@ class TestEnpkgVersionMisc(unittest.TestCase):
 
         # Then
         self.assertEqual(version_string, r_version_string)
+
+
+_UPSTREAMS = [
+    "0.9", "1", "1.0", "1.0.0", "1.0.1", "1.0a1", "1.0a1.dev2", "1.0a2",
+    "1.0b1", "1.0c1", "1.0rc1", "1.0rc1.post1", "1.0.dev1", "1.0.dev2",
+    "1.0.post1", "1.0.post1.dev2", "1.0.post2", "1.10", "1.2.3.4",
+    "2013.1.3", "2013.01.03", "1.0_foo", "1.0.foo", "1.0.a", "abc", "ab", "1.0.post1a",
+]
+
+
+class TestEnpkgVersionSortKey(unittest.TestCase):
+    def setUp(self):
+        self.versions = [
+            EnpkgVersion.from_string("{0}-{1}".format(upstream, build))
+            for upstream, build in itertools.product(_UPSTREAMS, (0, 1, 10))
+        ]
+
+    def test_same_ordering(self):
+        for left, right in itertools.product(self.versions, repeat=2):
+            # When/Then
+            self.assertEqual(
+                left < right, left.sort_key < right.sort_key, (left, right))
+            self.assertEqual(
+                left == right, left.sort_key == right.sort_key,
+                (left, right))
+
+    def test_flat_and_cached(self):
+        # Given
+        version = EnpkgVersion.from_string("1.0rc1.post1-2")
+
+        # When
+        sort_key = version.sort_key
+
+        # Then
+        self.assertTrue(all(isinstance(part, int) for part in sort_key))
+        self.assertIs(version.sort_key, sort_key)
+
+    def test_sorted_versions(self):
+        # Given
+        versions = self.versions[::-1]
+
+        # When/Then
+        self.assertEqual(sorted_versions(versions), sorted(versions))
+        self.assertEqual(
+            sorted_versions(versions, reverse=True),
+            sorted(versions, reverse=True))
+
+    def test_max_version(self):
+        # When
+        version = max_version(self.versions)
+
+        # Then
+        self.assertEqual(version, max(self.versions))
+        self.assertEqual(str(version), "2013.1.3-10")
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            max_version([])
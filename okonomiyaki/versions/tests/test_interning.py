@@ -0,0 +1,113 @@
+import pickle
+import unittest
+
+from okonomiyaki.errors import InvalidEnpkgVersion
+
+from .. import (
+    EnpkgVersion, PEP386WorkaroundVersion, PEP440Version, RuntimeVersion,
+    SemanticVersion, VersionInterner)
+
+
+class TestVersionInterner(unittest.TestCase):
+    def test_same_instance(self):
+        # Given
+        interner = VersionInterner()
+
+        # When
+        v1 = interner.from_string("1.3.0-1")
+        v2 = interner.from_string("1.3.0-1")
+        v3 = interner.from_string("1.3.0-2")
+
+        # Then
+        self.assertIsInstance(v1, EnpkgVersion)
+        self.assertIs(v1, v2)
+        self.assertIsNot(v1, v3)
+        self.assertEqual(v1, EnpkgVersion.from_string("1.3.0-1"))
+        self.assertEqual(len(interner), 2)
+
+    def test_spelling_is_preserved(self):
+        # Given
+        interner = VersionInterner()
+
+        # When
+        v1 = interner.from_string("1.0-1")
+        v2 = interner.from_string("1.0.0-1")
+
+        # Then
+        self.assertEqual(v1, v2)
+        self.assertEqual(str(v1), "1.0-1")
+        self.assertEqual(str(v2), "1.0.0-1")
+
+    def test_other_version_classes(self):
+        for klass, s in (
+            (PEP440Version, "1.2.0rc1"),
+            (RuntimeVersion, "3.11.2"),
+            (SemanticVersion, "1.2.3-rc.1"),
+        ):
+            # Given
+            interner = VersionInterner(klass)
+
+            # When
+            version = interner.from_string(s)
+
+            # Then
+            self.assertIsInstance(version, klass)
+            self.assertIs(interner.from_string(s), version)
+
+    def test_clear(self):
+        # Given
+        interner = VersionInterner()
+        version = interner.from_string("1.3.0-1")
+
+        # When
+        interner.clear()
+
+        # Then
+        self.assertEqual(len(interner), 0)
+        self.assertIsNot(interner.from_string("1.3.0-1"), version)
+
+    def test_invalid(self):
+        # Given
+        interner = VersionInterner()
+
+        # When/Then
+        with self.assertRaises(InvalidEnpkgVersion):
+            interner.from_string("1.3.0-a")
+        self.assertEqual(len(interner), 0)
+
+
+class TestCompactVersions(unittest.TestCase):
+    def test_no_instance_dict(self):
+        # Given
+        versions = [
+            EnpkgVersion.from_string("1.3.0-1"),
+            PEP386WorkaroundVersion.from_string("1.3.0"),
+            PEP386WorkaroundVersion.from_string("1.3.0-foo"),
+            PEP440Version.from_string("1.2.0.post1"),
+            RuntimeVersion.from_string("3.11.2"),
+            SemanticVersion.from_string("1.2.3-rc.1"),
+        ]
+
+        for version in versions:
+            # When/Then
+            self.assertFalse(hasattr(version, "__dict__"))
+            with self.assertRaises(AttributeError):
+                version.dummy = 1
+
+    def test_pickling(self):
+        # Given
+        versions = [
+            EnpkgVersion.from_string("1.3.0rc1-1"),
+            EnpkgVersion.from_string("1.3.0_foo-1"),
+            PEP440Version.from_string("1.2.0.dev1"),
+            RuntimeVersion.from_string("3.11.2"),
+            SemanticVersion.from_string("1.2.3-rc.1+2"),
+        ]
+
+        for version in versions:
+            # When
+            unpickled = pickle.loads(pickle.dumps(version))
+
+            # Then
+            self.assertEqual(unpickled, version)
+            self.assertEqual(str(unpickled), str(version))
@@ -79,3 +79,28 @@ class TestRuntimeVersion(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             self.assertTrue(V("1.2.0") == "1.2")
+
+    def test_sort_key(self):
+        # Given
+        versions = [
+            V(s) for s in (
+                "1.0b2", "1.0rc1", "1.0", "1.0+1", "1.0+2", "1.0.post1",
+                "1.2.0", "1.2.3+10", "2!0.1",
+            )
+        ]
+
+        # When/Then
+        for left in versions:
+            for right in versions:
+                self.assertEqual(
+                    left < right, left.sort_key < right.sort_key,
+                    (left, right))
+                self.assertEqual(
+                    left == right, left.sort_key == right.sort_key,
+                    (left, right))
+        self.assertEqual(
+            V("1.0+1").upstream_sort_key, V("1.0").upstream_sort_key)
+        self.assertEqual(
+            V("1.2.3+10").upstream_sort_key, V("1.2.3+2").upstream_sort_key)
+        self.assertNotEqual(
+            V("1.0.post1").upstream_sort_key, V("1.0").upstream_sort_key)
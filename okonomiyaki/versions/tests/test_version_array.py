@@ -0,0 +1,244 @@
+import operator
+import unittest
+
+from .. import EnpkgVersion, RuntimeVersion, VersionArray
+from ..version_array import numpy
+
+
+ENPKG_VERSIONS = [
+    "1.3.0-2", "1.2.0-1", "1.3.0-1", "1.3.0rc1-1", "1.3.0-1", "1.10.0-1",
+    "1.3-3", "0.9.1.dev1-1", "2013.1.3-1", "1.3.0_foo-1", "1.3.0-10",
+]
+
+RUNTIME_VERSIONS = [
+    "3.8.10", "3.8.10+1", "2.7.18", "3.8.10+2", "3.11.2", "3.8.9+5",
+    "3.11.2+1", "3.8.10rc1",
+]
+
+
+def _as_list(values):
+    return [value.item() if hasattr(value, "item") else value
+            for value in values]
+
+
+class _VersionArrayTestMixin(object):
+    use_numpy = None
+
+    def _array(self, strings, version_class=EnpkgVersion):
+        return VersionArray.from_strings(
+            strings, version_class, use_numpy=self.use_numpy)
+
+    def _check_comparisons(self, strings, version_class):
+        # Given
+        versions = [version_class.from_string(s) for s in strings]
+        array = self._array(strings, version_class)
+        others = versions + [
+            version_class.from_string(s) for s in ("0.1", "1.2.5", "99")
+        ]
+
+        for other in others:
+            for op in (operator.lt, operator.le, operator.eq, operator.ne,
+                       operator.gt, operator.ge):
+                # When
+                result = _as_list(op(array, other))
+
+                # Then
+                self.assertEqual(result, [op(v, other) for v in versions])
+
+    def test_comparisons_enpkg(self):
+        self._check_comparisons(ENPKG_VERSIONS, EnpkgVersion)
+
+    def test_comparisons_runtime(self):
+        self._check_comparisons(RUNTIME_VERSIONS, RuntimeVersion)
+
+    def test_comparisons_arrays(self):
+        # Given
+        left_strings = ENPKG_VERSIONS
+        right_strings = ENPKG_VERSIONS[3:] + ENPKG_VERSIONS[:3]
+        left = self._array(left_strings)
+        right = self._array(right_strings)
+
+        for op in (operator.lt, operator.le, operator.eq, operator.ge):
+            # When
+            result = _as_list(op(left, right))
+
+            # Then
+            expected = [
+                op(EnpkgVersion.from_string(a), EnpkgVersion.from_string(b))
+                for a, b in zip(left_strings, right_strings)
+            ]
+            self.assertEqual(result, expected)
+
+    def test_comparisons_errors(self):
+        # Given
+        array = self._array(ENPKG_VERSIONS)
+
+        # When/Then
+        with self.assertRaises(TypeError):
+            array < RuntimeVersion.from_string("3.8.10")
+        with self.assertRaises(ValueError):
+            array < self._array(ENPKG_VERSIONS[1:])
+
+    def test_argsort(self):
+        # Given
+        versions = [EnpkgVersion.from_string(s) for s in ENPKG_VERSIONS]
+        array = self._array(ENPKG_VERSIONS)
+
+        # When
+        indices = _as_list(array.argsort())
+
+        # Then
+        self.assertEqual(
+            indices,
+            sorted(range(len(versions)), key=versions.__getitem__))
+
+    def test_searchsorted(self):
+        # Given
+        versions = sorted(
+            EnpkgVersion.from_string(s) for s in ENPKG_VERSIONS)
+        array = self._array(ENPKG_VERSIONS)
+        queries = [
+            EnpkgVersion.from_string(s)
+            for s in ("0.1-1", "1.3.0-1", "1.3.0-3", "1.10.0-1", "9999-1")
+        ]
+
+        for query in queries:
+            # When
+            left = array.searchsorted(query)
+            right = array.searchsorted(query, side="right")
+
+            # Then
+            self.assertEqual(left, sum(1 for v in versions if v < query))
+            self.assertEqual(right, sum(1 for v in versions if v <= query))
+
+        # When
+        lefts = _as_list(array.searchsorted(queries))
+
+        # Then
+        self.assertEqual(
+            lefts, [array.searchsorted(query) for query in queries])
+
+    def test_searchsorted_invalid_side(self):
+        # Given
+        array = self._array(ENPKG_VERSIONS)
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            array.searchsorted(EnpkgVersion.from_string("1.3.0-1"), "middle")
+
+    def test_latest_per_upstream_enpkg(self):
+        # Given
+        array = self._array(ENPKG_VERSIONS)
+
+        # When
+        indices = _as_list(array.latest_per_upstream())
+
+        # Then
+        self.assertEqual(
+            [str(array[i]) for i in indices],
+            ["1.3.0_foo-1", "0.9.1.dev1-1", "1.2.0-1", "1.3.0rc1-1",
+             "1.3.0-10", "1.10.0-1", "2013.1.3-1"])
+
+    def test_latest_per_upstream_duplicates(self):
+        # Given
+        array = self._array(["1.0-1", "1.0-2", "1.0.0-2", "0.5-1"])
+
+        # When
+        indices = _as_list(array.latest_per_upstream())
+
+        # Then
+        self.assertEqual(indices, [3, 1])
+
+    def test_latest_per_upstream_runtime(self):
+        # Given
+        array = self._array(RUNTIME_VERSIONS, RuntimeVersion)
+
+        # When
+        indices = _as_list(array.latest_per_upstream())
+
+        # Then
+        self.assertEqual(
+            [str(array[i]) for i in indices],
+            ["2.7.18", "3.8.9+5", "3.8.10rc1", "3.8.10+2", "3.11.2+1"])
+
+    def test_empty(self):
+        # Given
+        array = self._array([])
+
+        # When/Then
+        self.assertEqual(len(array), 0)
+        self.assertEqual(_as_list(array < EnpkgVersion.from_string("1.0-1")), [])
+        self.assertEqual(_as_list(array.argsort()), [])
+        self.assertEqual(_as_list(array.latest_per_upstream()), [])
+        self.assertEqual(array.searchsorted(EnpkgVersion.from_string("1.0-1")), 0)
+
+    def test_sequence_protocol(self):
+        # Given
+        array = self._array(["1.0-1", "2.0-1"])
+
+        # When/Then
+        self.assertEqual(len(array), 2)
+        self.assertEqual(array[1], EnpkgVersion.from_string("2.0-1"))
+        self.assertEqual(
+            list(array),
+            [EnpkgVersion.from_string("1.0-1"),
+             EnpkgVersion.from_string("2.0-1")])
+        self.assertEqual(repr(array), "VersionArray([1.0-1, 2.0-1])")
+
+
+class TestVersionArrayPython(_VersionArrayTestMixin, unittest.TestCase):
+    use_numpy = False
+
+    def test_results_are_lists(self):
+        # Given
+        array = self._array(ENPKG_VERSIONS)
+
+        # When/Then
+        self.assertIsInstance(array < EnpkgVersion.from_string("1.3.0-1"), list)
+        self.assertIsInstance(array.argsort(), list)
+        self.assertIsInstance(array.latest_per_upstream(), list)
+        self.assertIsInstance(
+            array.searchsorted([EnpkgVersion.from_string("1.3.0-1")]), list)
+
+    def test_unsupported_version_class(self):
+        # Given
+        from .. import PEP440Version
+        versions = [PEP440Version.from_string("1.0")]
+
+        # When/Then
+        with self.assertRaises(TypeError):
+            VersionArray(versions, use_numpy=False)
+
+    def test_mixed_version_classes(self):
+        # Given
+        versions = [
+            EnpkgVersion.from_string("1.0-1"),
+            RuntimeVersion.from_string("1.0"),
+        ]
+
+        # When/Then
+        with self.assertRaises(TypeError):
+            VersionArray(versions, use_numpy=False)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not available")
+class TestVersionArrayNumPy(_VersionArrayTestMixin, unittest.TestCase):
+    use_numpy = True
+
+    def test_results_are_arrays(self):
+        # Given
+        array = self._array(ENPKG_VERSIONS)
+
+        # When
+        mask = array < EnpkgVersion.from_string("1.3.0-1")
+
+        # Then
+        self.assertIsInstance(mask, numpy.ndarray)
+        self.assertEqual(mask.dtype, numpy.bool_)
+        self.assertIsInstance(array.argsort(), numpy.ndarray)
+        self.assertIsInstance(array.latest_per_upstream(), numpy.ndarray)
+        self.assertIsInstance(
+            array.searchsorted([EnpkgVersion.from_string("1.3.0-1")]),
+            numpy.ndarray)
+        self.assertIsInstance(
+            array.searchsorted(EnpkgVersion.from_string("1.3.0-1")), int)
@@ -0,0 +1,303 @@
+import bisect
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .enpkg import EnpkgVersion
+from .runtime_version import RuntimeVersion
+
+
+_SUPPORTED_CLASSES = (EnpkgVersion, RuntimeVersion)
+
+
+def _key(version):
+    return version.sort_key
+
+
+def _upstream_key(version):
+    if isinstance(version, EnpkgVersion):
+        return version.upstream.sort_key
+    else:
+        return version.upstream_sort_key
+
+
+def _ranks(keys):
+    """ Returns the sorted unique keys, and the rank of each key in it."""
+    uniques = sorted(set(keys))
+    positions = dict((key, i) for i, key in enumerate(uniques))
+    return uniques, [positions[key] for key in keys]
+
+
+class VersionArray(object):
+    """ An immutable batch of EnpkgVersion or RuntimeVersion instances,
+    supporting vectorized comparisons and sorting.
+
+    Versions are encoded as integer ranks, so that the bulk operations are
+    done on integers. The encoding is done once, when the array is created.
+    If NumPy is available, ranks are stored in NumPy arrays, operations are
+    vectorized and return NumPy arrays. Otherwise, the same operations are
+    implemented in pure python, and return lists.
+
+    Example::
+
+        versions = VersionArray.from_strings(["1.2.0-1", "1.3.0-1", "1.3.0-2"])
+        mask = versions >= EnpkgVersion.from_string("1.3.0-1")
+
+    Parameters
+    ----------
+    versions: iterable
+        EnpkgVersion or RuntimeVersion instances, all of the same class.
+    use_numpy: bool or None
+        Whether to use NumPy. If None (the default), NumPy is used if it is
+        available.
+    """
+    @classmethod
+    def from_strings(cls, strings, version_class=EnpkgVersion, **kw):
+        """ Create a new instance from version strings.
+
+        Parameters
+        ----------
+        strings: iterable
+            The version strings.
+        version_class: class
+            EnpkgVersion (the default) or RuntimeVersion.
+        """
+        return cls((version_class.from_string(s) for s in strings), **kw)
+
+    def __init__(self, versions, use_numpy=None):
+        versions = tuple(versions)
+        if len(versions) > 0:
+            version_class = type(versions[0])
+            if version_class not in _SUPPORTED_CLASSES:
+                raise TypeError(
+                    "Unsupported version type: {0!r}".format(version_class))
+            for version in versions:
+                self._ensure_compatible(version, version_class)
+        else:
+            version_class = None
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ValueError("NumPy is not available")
+
+        self.versions = versions
+        """ The versions, as a tuple."""
+
+        self.version_class = version_class
+        """ The class of the versions, or None for an empty array."""
+
+        self._use_numpy = use_numpy
+
+        self._uniques, ranks = _ranks([_key(v) for v in versions])
+        self._ranks = self._array(ranks)
+
+        self._upstream_ranks = None
+        self._cumulative_counts = None
+
+    # Public methods
+    def argsort(self):
+        """ Indices which would sort the versions, equal versions keeping
+        their relative order.
+        """
+        if self._use_numpy:
+            return numpy.argsort(self._ranks, kind="stable")
+        else:
+            return sorted(range(len(self)), key=self._ranks.__getitem__)
+
+    def searchsorted(self, version, side="left"):
+        """ Find the index at which the given version would be inserted in
+        the sorted versions to maintain order, as numpy.searchsorted.
+
+        Parameters
+        ----------
+        version: version or iterable
+            A version of the same class as the array's versions, or an
+            iterable of such versions.
+        side: 'left' or 'right'
+            If 'left', return the first suitable index, if 'right' the last
+            one.
+        """
+        if side not in ("left", "right"):
+            raise ValueError("Invalid side: {0!r}".format(side))
+        cumulative_counts = self._get_cumulative_counts()
+
+        def _bound(version):
+            left, right = self._bounds(version)
+            return left if side == "left" else right
+
+        if self._is_version(version):
+            return int(cumulative_counts[_bound(version)])
+        elif self._use_numpy:
+            bounds = numpy.fromiter(
+                (_bound(v) for v in version), dtype=numpy.intp)
+            return cumulative_counts[bounds]
+        else:
+            return [cumulative_counts[_bound(v)] for v in version]
+
+    def latest_per_upstream(self):
+        """ Indices of the highest version for each upstream version, ordered
+        by upstream version.
+
+        The upstream version is everything but the build number, i.e. the
+        upstream attribute of EnpkgVersion, and the version without its local
+        part for RuntimeVersion. The first index is returned when the
+        highest version appears several times.
+        """
+        if self._upstream_ranks is None:
+            _, upstream_ranks = _ranks([_upstream_key(v) for v in self])
+            self._upstream_ranks = self._array(upstream_ranks)
+
+        if self._use_numpy:
+            if len(self) == 0:
+                return numpy.zeros(0, dtype=numpy.intp)
+            # Sort by upstream, then version, then decreasing index, and
+            # keep the last item of each upstream
+            indices = numpy.arange(len(self))
+            order = numpy.lexsort((-indices, self._ranks, self._upstream_ranks))
+            upstream_ranks = self._upstream_ranks[order]
+            is_last = numpy.ones(len(self), dtype=bool)
+            is_last[:-1] = upstream_ranks[:-1] != upstream_ranks[1:]
+            return order[is_last]
+        else:
+            latest = {}
+            for i, (upstream_rank, rank) in enumerate(
+                    zip(self._upstream_ranks, self._ranks)):
+                best = latest.get(upstream_rank)
+                if best is None or rank > self._ranks[best]:
+                    latest[upstream_rank] = i
+            return [latest[upstream_rank] for upstream_rank in sorted(latest)]
+
+    # Protocol implementations
+    def __len__(self):
+        return len(self.versions)
+
+    def __iter__(self):
+        return iter(self.versions)
+
+    def __getitem__(self, index):
+        return self.versions[index]
+
+    def __repr__(self):
+        return "{0}([{1}])".format(
+            self.__class__.__name__, ", ".join(str(v) for v in self))
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    __hash__ = None
+
+    # Private methods
+    def _array(self, values):
+        if self._use_numpy:
+            return numpy.array(values, dtype=numpy.intp)
+        else:
+            return values
+
+    def _get_cumulative_counts(self):
+        """ Returns the number of versions of rank lower than each rank, and
+        the total number of versions as last item.
+        """
+        if self._cumulative_counts is None:
+            if self._use_numpy:
+                counts = numpy.bincount(
+                    self._ranks, minlength=len(self._uniques))
+                cumulative_counts = numpy.zeros(
+                    len(self._uniques) + 1, dtype=numpy.intp)
+                numpy.cumsum(counts, out=cumulative_counts[1:])
+            else:
+                counts = [0] * len(self._uniques)
+                for rank in self._ranks:
+                    counts[rank] += 1
+                cumulative_counts = [0]
+                for count in counts:
+                    cumulative_counts.append(cumulative_counts[-1] + count)
+            self._cumulative_counts = cumulative_counts
+        return self._cumulative_counts
+
+    def _is_version(self, value):
+        return isinstance(value, _SUPPORTED_CLASSES)
+
+    def _ensure_compatible(self, version, version_class=None):
+        version_class = version_class or self.version_class
+        if version_class is not None and type(version) is not version_class:
+            msg = "Cannot compare {0!r} and {1!r}"
+            raise TypeError(msg.format(version_class, type(version)))
+
+    def _bounds(self, version):
+        """ Returns (left, right), such that versions of rank < left are
+        lower than the given version, and versions of rank >= right higher.
+        """
+        self._ensure_compatible(version)
+        key = _key(version)
+        return (
+            bisect.bisect_left(self._uniques, key),
+            bisect.bisect_right(self._uniques, key),
+        )
+
+    def _compare(self, other, op):
+        if isinstance(other, VersionArray):
+            return self._compare_arrays(other, op)
+        elif not self._is_version(other):
+            return NotImplemented
+
+        left, right = self._bounds(other)
+        # A version is lower than other iff its rank < left, equal iff its
+        # rank is in [left, right), and higher iff its rank >= right. The
+        # predicates work both on integers and on NumPy arrays.
+        predicate = {
+            operator.lt: lambda rank: rank < left,
+            operator.le: lambda rank: rank < right,
+            operator.eq: lambda rank: (rank >= left) & (rank < right),
+            operator.ne: lambda rank: (rank < left) | (rank >= right),
+            operator.gt: lambda rank: rank >= right,
+            operator.ge: lambda rank: rank >= left,
+        }[op]
+
+        if self._use_numpy:
+            return predicate(self._ranks)
+        else:
+            return [predicate(rank) for rank in self._ranks]
+
+    def _compare_arrays(self, other, op):
+        if len(self) != len(other):
+            raise ValueError(
+                "Cannot compare arrays of different lengths: {0} and {1}"
+                .format(len(self), len(other)))
+        if len(self) == 0:
+            return self._array([])
+        self._ensure_compatible(other[0])
+
+        uniques = sorted(set(self._uniques) | set(other._uniques))
+        positions = dict((key, i) for i, key in enumerate(uniques))
+        left_mapping = [positions[key] for key in self._uniques]
+        right_mapping = [positions[key] for key in other._uniques]
+
+        if self._use_numpy:
+            left = numpy.array(left_mapping, dtype=numpy.intp)[self._ranks]
+            right = numpy.array(right_mapping, dtype=numpy.intp)[
+                numpy.asarray(other._ranks, dtype=numpy.intp)]
+            return op(left, right)
+        else:
+            return [
+                op(left_mapping[left], right_mapping[right])
+                for left, right in zip(self._ranks, other._ranks)
+            ]
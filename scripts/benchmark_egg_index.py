@@ -0,0 +1,125 @@
+""" Compare EggIndex lookups with linear scans, on a synthetic repository of
+to_json_dict() records.
+"""
+import itertools
+import random
+import time
+import timeit
+
+import click
+
+from okonomiyaki.file_formats import EggIndex
+from okonomiyaki.platforms import (
+    EPDPlatform, PythonImplementation, supported_tags)
+from okonomiyaki.versions import EnpkgVersion
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+_PYTHONS = ("cp38", "cp311", "cp312")
+_PLATFORMS = (
+    "linux_x86_64", "win_amd64", "macosx_10_14_x86_64", "macosx_11_0_arm64")
+
+
+def records(names, versions):
+    """ One record per name, version, python and platform."""
+    combinations = itertools.product(
+        range(names), range(versions), _PYTHONS, _PLATFORMS)
+    for name, version, python_tag, platform_tag in combinations:
+        yield {
+            "metadata_version": "1.3",
+            "_raw_name": "package{0}".format(name),
+            "version": "{0}.{1}.0-{2}".format(
+                version // 10, version % 10, 1 + version % 3),
+            "epd_platform": None,
+            "python_tag": python_tag,
+            "abi_tag": python_tag,
+            "platform_tag": platform_tag,
+            "platform_abi_tag": None,
+            "runtime_dependencies": [],
+            "summary": "",
+        }
+
+
+def scan_latest(entries, name, python_tag, platform_tag):
+    """ The linear scan replaced by EggIndex.latest."""
+    matching = [
+        entry for entry in entries
+        if entry["_raw_name"].lower() == name
+        and entry["python_tag"] == python_tag
+        and entry["platform_tag"] == platform_tag
+    ]
+    if len(matching) == 0:
+        return None
+    return max(
+        matching, key=lambda entry: EnpkgVersion.from_string(entry["version"]))
+
+
+def _best(func, number, repeat):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('--names', default=1000, help='Number of package names.')
+@click.option('--versions', default=10, help='Number of versions per name.')
+@click.option('-n', '--number', default=1000, help='Queries per run.')
+@click.option('-r', '--repeat', default=5, help='Number of runs.')
+def main(names, versions, number, repeat):
+    entries = list(records(names, versions))
+    click.echo("{0} records, {1} names".format(len(entries), names))
+
+    start = time.perf_counter()
+    index = EggIndex(entries)
+    click.echo("{0:>20}: {1:10.2f} s".format(
+        "build", time.perf_counter() - start))
+
+    rng = random.Random(0)
+    queries = [
+        ("package{0}".format(rng.randrange(names)), rng.choice(_PYTHONS),
+         rng.choice(_PLATFORMS))
+        for _ in range(number)
+    ]
+    queries_cycle = itertools.cycle(queries)
+    supported = list(supported_tags(
+        EPDPlatform.from_string("rh7_x86_64"),
+        PythonImplementation.from_string("cp311"), "cp311"))
+
+    def latest():
+        name, python_tag, platform_tag = next(queries_cycle)
+        index.latest(name, python_tag, python_tag, platform_tag)
+
+    def latest_platform():
+        name, _, platform_tag = next(queries_cycle)
+        index.latest(name, platform_tag=platform_tag)
+
+    def get():
+        name, python_tag, _ = next(queries_cycle)
+        index.get(name, python_tag=python_tag)
+
+    def best():
+        name, _, _ = next(queries_cycle)
+        index.best(name, supported)
+
+    def add_remove():
+        entry = entries[rng.randrange(len(entries))]
+        index.remove(entry)
+        index.add(entry)
+
+    def scan():
+        scan_latest(entries, *next(queries_cycle))
+
+    for title, func, func_number in (
+        ("latest (all tags)", latest, number),
+        ("latest (platform)", latest_platform, number),
+        ("get (python)", get, number),
+        ("best", best, number),
+        ("remove + add", add_remove, number),
+        ("linear scan", scan, max(1, number // 100)),
+    ):
+        timing = _best(func, func_number, repeat)
+        click.echo("{0:>20}: {1:10.2f} us / query".format(
+            title, timing * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+""" Compare the PKG-INFO parser of PackageInfo.from_string with
+email.parser, on the PKG-INFO/METADATA files of the test eggs and wheels,
+and on metadata with a large description.
+"""
+import glob
+import io
+import os.path
+import timeit
+import zipfile
+
+import click
+
+from okonomiyaki.file_formats import PackageInfo
+from okonomiyaki.file_formats._package_info import _parse, _parse_string
+from okonomiyaki.utils import test_data
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+# Fields typically needed to build a package index
+INDEX_FIELDS = ("summary", "requires_dist", "requires_python")
+
+
+def pkg_info_strings(directory):
+    patterns = (
+        os.path.join(directory, "**", "*.egg"),
+        os.path.join(directory, "**", "*.whl"),
+    )
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            try:
+                with zipfile.ZipFile(path) as zp:
+                    for name in zp.namelist():
+                        if name.endswith(("/PKG-INFO", "/METADATA")):
+                            data = zp.read(name)
+                            yield data.decode("utf8", "replace")
+            except zipfile.BadZipFile:
+                continue
+
+
+def large_description(strings, size):
+    """ Metadata 2.1 content with a description body of about size bytes.
+    """
+    paragraph = "".join(
+        "\n".join(s.splitlines()[:40]) for s in strings
+    )
+    body = (paragraph * (size // len(paragraph) + 1))[:size]
+    return (
+        "Metadata-Version: 2.1\nName: large\nVersion: 1.0\n"
+        "Summary: a package with a large description\n\n" + body
+    )
+
+
+def parse_all_email(strings):
+    for s in strings:
+        _parse(io.StringIO(s))
+
+
+def parse_all_fast(strings):
+    for s in strings:
+        _parse_string(s)
+
+
+def from_string_all(strings):
+    for s in strings:
+        PackageInfo.from_string(s)
+
+
+def from_string_fields_all(strings):
+    for s in strings:
+        PackageInfo.from_string(s, fields=INDEX_FIELDS)
+
+
+def _best(func, strings, number, repeat):
+    timings = timeit.repeat(lambda: func(strings), number=number, repeat=repeat)
+    return min(timings) / number / len(strings)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('-n', '--number', default=20, help='Iterations per run.')
+@click.option('-r', '--repeat', default=5, help='Number of runs.')
+@click.option(
+    '--size', default=200000, help='Size of the large description.')
+def main(number, repeat, size):
+    directory = os.path.dirname(test_data.__file__)
+    strings = list(pkg_info_strings(directory))
+    large = [large_description(strings, size)]
+
+    for title, corpus in (
+        ("{0} test metadata files".format(len(strings)), strings),
+        ("{0} bytes description".format(size), large),
+    ):
+        click.echo(title)
+        email = _best(parse_all_email, corpus, number, repeat)
+        fast = _best(parse_all_fast, corpus, number, repeat)
+        total = _best(from_string_all, corpus, number, repeat)
+        fields = _best(from_string_fields_all, corpus, number, repeat)
+        click.echo("{0:>14}: {1:10.2f} us / file".format("email", email * 1e6))
+        click.echo("{0:>14}: {1:10.2f} us / file".format("fast", fast * 1e6))
+        click.echo("{0:>14}: {1:10.2f} us / file".format(
+            "from_string", total * 1e6))
+        click.echo("{0:>14}: {1:10.2f} us / file".format(
+            "index fields", fields * 1e6))
+        click.echo("{0:>14}: {1:10.1f}x".format("speedup", email / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+""" Compare the simple assignment parser with the AST-based one on the
+spec/depend files of the test eggs.
+"""
+import glob
+import os.path
+import timeit
+import zipfile
+
+import click
+
+from okonomiyaki.utils import test_data
+from okonomiyaki.utils.misc import (
+    _AssignmentParser, _parse_simple_assignments)
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+
+def spec_depend_strings(directory):
+    pattern = os.path.join(directory, "**", "*.egg")
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        try:
+            with zipfile.ZipFile(path) as zp:
+                data = zp.read("EGG-INFO/spec/depend")
+        except (KeyError, zipfile.BadZipFile):
+            continue
+        yield data.decode("utf8").replace("\r", "")
+
+
+def parse_all_ast(strings):
+    for s in strings:
+        _AssignmentParser().parse(s)
+
+
+def parse_all_simple(strings):
+    for s in strings:
+        _parse_simple_assignments(s)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('-n', '--number', default=200, help='Iterations per run.')
+@click.option('-r', '--repeat', default=5, help='Number of runs.')
+def main(number, repeat):
+    directory = os.path.dirname(test_data.__file__)
+    strings = list(spec_depend_strings(directory))
+    fallbacks = sum(1 for s in strings if _parse_simple_assignments(s) is None)
+    click.echo("{0} spec/depend files ({1} using the AST fallback)".format(
+        len(strings), fallbacks))
+
+    results = {}
+    for name, func in (("ast", parse_all_ast), ("simple", parse_all_simple)):
+        timings = timeit.repeat(
+            lambda: func(strings), number=number, repeat=repeat)
+        per_file = min(timings) / number / len(strings)
+        results[name] = per_file
+        click.echo("{0:>8}: {1:8.2f} us / file".format(name, per_file * 1e6))
+
+    click.echo("speedup: {0:.1f}x".format(results["ast"] / results["simple"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+""" Measure the time taken by a fresh interpreter to import the okonomiyaki
+packages, compared to a bare interpreter start.
+
+Exits with a non-zero status if any import exceeds its budget. Importing a
+package only pays for the package itself, importing one of its classes pays
+for its actual dependencies (attrs, zipfile, ...).
+"""
+import subprocess
+import sys
+import timeit
+
+import click
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+# (statement, budget in ms)
+STATEMENTS = (
+    ("import okonomiyaki.file_formats", 25),
+    ("import okonomiyaki.platforms", 25),
+    ("import okonomiyaki.runtimes", 25),
+    ("import okonomiyaki.versions", 25),
+    ("import okonomiyaki.file_formats._blacklist", 50),
+    ("from okonomiyaki.file_formats import EggMetadata", 150),
+    ("from okonomiyaki.runtimes import IRuntimeMetadata", 150),
+)
+
+
+def startup_time(statement, repeat):
+    """ Best wall clock time, in seconds, to run the given statement in a
+    fresh interpreter.
+    """
+    command = [sys.executable, "-c", statement]
+    return min(timeit.repeat(
+        lambda: subprocess.run(command, check=True), number=1, repeat=repeat
+    ))
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('-r', '--repeat', default=20, help='Number of runs.')
+@click.option(
+    '--scale', default=1.0,
+    help='Factor applied to the budgets, e.g. for slow machines.')
+def main(repeat, scale):
+    baseline = startup_time("pass", repeat)
+    click.echo("{0:>50}: {1:6.1f} ms".format("interpreter", baseline * 1e3))
+
+    over_budget = []
+    for statement, budget in STATEMENTS:
+        budget *= scale
+        elapsed = (startup_time(statement, repeat) - baseline) * 1e3
+        click.echo("{0:>50}: {1:6.1f} ms (budget {2:.0f} ms)".format(
+            statement, elapsed, budget))
+        if elapsed > budget:
+            over_budget.append(statement)
+
+    if over_budget:
+        click.echo("Over budget: {0}".format(", ".join(over_budget)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
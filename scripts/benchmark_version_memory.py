@@ -0,0 +1,88 @@
+""" Measure the memory used by a large number of version objects.
+"""
+import gc
+import itertools
+import sys
+import tracemalloc
+
+import click
+
+from okonomiyaki.versions import (
+    EnpkgVersion, PEP440Version, SemanticVersion)
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+_SUFFIXES = ("", "a1", "rc2", ".post1", ".dev3")
+
+
+def enpkg_version_strings(n):
+    """ n distinct version strings, e.g. '12.3.4rc2-7'."""
+    ranges = (range(100), range(100), range(10), _SUFFIXES, range(1, 21))
+    for major, minor, micro, suffix, build in itertools.islice(
+            itertools.product(*ranges), n):
+        yield "{0}.{1}.{2}{3}-{4}".format(major, minor, micro, suffix, build)
+
+
+def pep440_version_strings(n):
+    for s in enpkg_version_strings(n):
+        yield s.replace("-", "+")
+
+
+def semantic_version_strings(n):
+    ranges = (range(100), range(100), range(10), ("", "-rc"), range(1, 51))
+    for major, minor, patch, pre_release, build in itertools.islice(
+            itertools.product(*ranges), n):
+        yield "{0}.{1}.{2}{3}+{4}".format(
+            major, minor, patch, pre_release and pre_release + "." + str(build),
+            build)
+
+
+def measure(factory, strings):
+    """ Returns the number of bytes allocated per created object."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory(s) for s in strings]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    size = after - before - sys.getsizeof(objects)
+    return size / len(objects)
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.option('-n', '--number', default=1000000, help='Number of versions.')
+@click.option(
+    '--distinct', default=10000,
+    help='Number of distinct strings for the interned workload.')
+def main(number, distinct):
+    enpkg_strings = list(enpkg_version_strings(number))
+    cases = [
+        ("EnpkgVersion", EnpkgVersion.from_string, enpkg_strings),
+        ("PEP440Version", PEP440Version.from_string,
+         list(pep440_version_strings(number))),
+        ("SemanticVersion", SemanticVersion.from_string,
+         list(semantic_version_strings(number))),
+    ]
+
+    try:
+        from okonomiyaki.versions import VersionInterner
+    except ImportError:
+        pass
+    else:
+        repeated = [enpkg_strings[i % distinct] for i in range(number)]
+        cases.append((
+            "EnpkgVersion (interned, {0} distinct)".format(distinct),
+            VersionInterner(EnpkgVersion).from_string, repeated,
+        ))
+
+    for name, factory, strings in cases:
+        per_version = measure(factory, strings)
+        click.echo("{0:>40}: {1:7.1f} bytes / version, {2:7.1f} MB total".format(
+            name, per_version, per_version * len(strings) / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+""" Merge new entries into one of the egg blacklists, and regenerate the
+blacklist data file and names module in okonomiyaki.file_formats._blacklist.
+
+The entries are read from a file containing a python dict literal, as
+output by the compute_* scripts:
+
+    {egg basename: {egg sha256: value}}
+
+where value is the epd platform string, the python tag or the decoded
+PKG-INFO content, depending on the blacklist.
+"""
+import ast
+import gzip
+import io
+import json
+import os.path
+import re
+
+import click
+
+from okonomiyaki.file_formats._blacklist import _data
+
+
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
+
+NAMES_MODULE = os.path.join(os.path.dirname(_data.__file__), "names.py")
+
+_KINDS = (_data.PKG_INFO, _data.PLATFORM, _data.PYTHON_TAG)
+
+_HEADER = '''\
+""" Names of the blacklisted eggs.
+
+Generated by scripts/update_blacklist_data.py, do not edit.
+"""
+'''
+
+_NAMES_VARIABLES = {
+    _data.PKG_INFO: "EGG_PKG_INFO_NAMES",
+    _data.PLATFORM: "EGG_PLATFORM_NAMES",
+    _data.PYTHON_TAG: "EGG_PYTHON_TAG_NAMES",
+}
+
+
+def read_blacklist_data(path=_data.BLACKLIST_DATA):
+    with gzip.open(path, "rt", encoding="utf8") as fp:
+        return json.load(fp)
+
+
+def write_blacklist_data(data, path=_data.BLACKLIST_DATA):
+    content = json.dumps(data, indent=0, sort_keys=True).encode("utf8")
+    # mtime=0 so that the file only changes when its content does
+    with open(path, "wb") as target:
+        with gzip.GzipFile(
+            filename="", mode="wb", fileobj=target, mtime=0
+        ) as fp:
+            fp.write(content)
+
+
+def format_names(data):
+    lines = [_HEADER]
+    for kind in _KINDS:
+        lines.append("{0} = frozenset([".format(_NAMES_VARIABLES[kind]))
+        for name in sorted(data[kind]):
+            lines.append("    {0!r},".format(name))
+        lines.append("])")
+    lines.append("# Names of the shared PKG-INFO contents")
+    lines.append("PKG_INFO_CONTENT_NAMES = frozenset([")
+    for key in sorted(data[_data.PKG_INFO_CONTENTS]):
+        lines.append("    {0!r},".format(key))
+    lines.append("])")
+    return "\n".join(lines) + "\n"
+
+
+def write_names(data, path=NAMES_MODULE):
+    with io.open(path, "wt", encoding="utf8") as fp:
+        fp.write(format_names(data))
+
+
+def _pkg_info_key(name, contents):
+    """ Name of the shared PKG-INFO content for the given egg, e.g.
+    PYSIDE_1_1_0 for PySide-1.1.0-1.egg.
+    """
+    base = "_".join(name.split("-")[:2])
+    key = re.sub(r"[^0-9A-Z]", "_", base.upper())
+    candidate, i = key, 1
+    while candidate in contents:
+        i += 1
+        candidate = "{0}_{1}".format(key, i)
+    return candidate
+
+
+def merge_entries(data, kind, entries):
+    for name, egg in entries.items():
+        target = data[kind].setdefault(name, {})
+        for checksum, value in egg.items():
+            if kind == _data.PKG_INFO:
+                contents = data[_data.PKG_INFO_CONTENTS]
+                keys = dict((v, k) for k, v in contents.items())
+                key = keys.get(value)
+                if key is None:
+                    key = _pkg_info_key(name, contents)
+                    contents[key] = value
+                value = key
+            target[checksum] = value
+
+
+@click.command(context_settings=CONTEXT_SETTINGS)
+@click.argument("kind", type=click.Choice(_KINDS))
+@click.argument("entries", type=click.File("rt", encoding="utf8"))
+def main(kind, entries):
+    data = read_blacklist_data()
+    merge_entries(data, kind, ast.literal_eval(entries.read()))
+    write_blacklist_data(data)
+    write_names(data)
+
+
+if __name__ == '__main__':
+    main()